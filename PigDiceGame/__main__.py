@@ -0,0 +1,6 @@
+"""Run the game or one of its subcommands with python -m PigDiceGame."""
+
+import sys
+from PigDiceGame import cli
+
+sys.exit(cli.main())
@@ -0,0 +1,42 @@
+"""Batched dice backed by a NumPy random generator."""
+
+import numpy as np
+from PigDiceGame.dice import Dice
+
+BUFFER_SIZE = 4096
+
+
+class BatchDice(Dice):
+    """
+    Dice that draws its rolls in batches from a seeded NumPy generator.
+
+    Single rolls are handed out from a pre-allocated buffer that is
+    refilled once it runs out, so it can replace Dice anywhere
+    get_random_number is used.
+    """
+
+    def __init__(self, seed=None, buffer_size=BUFFER_SIZE, rng=None):
+        """Initialize the generator and the roll buffer."""
+        super().__init__()
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
+        self.buffer = np.empty(buffer_size, dtype=np.int8)
+        self._rolls = []
+        self._position = 0
+
+    def refill(self):
+        """Fill the buffer with a new batch of rolls."""
+        self.buffer[:] = self.rng.integers(1, 7, size=self.buffer.size, dtype=np.int8)
+        self._rolls = self.buffer.tolist()
+        self._position = 0
+
+    def get_random_number(self):
+        """Class method for getting a random number from the buffer."""
+        if self._position >= len(self._rolls):
+            self.refill()
+        roll = self._rolls[self._position]
+        self._position += 1
+        return roll
+
+    def roll_many(self, amount):
+        """Return an int8 array with the given amount of rolls."""
+        return self.rng.integers(1, 7, size=amount, dtype=np.int8)
@@ -0,0 +1,214 @@
+"""
+Command line of the game, python -m PigDiceGame.
+
+Without a subcommand the interactive menu starts. The simulate
+subcommand plays computer against computer without the console:
+
+    python -m PigDiceGame simulate --p1 2 --p2 Pelle --games 10M --workers 16 --seed 42 --json
+"""
+
+import argparse
+import collections
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from PigDiceGame import main as interactive
+from PigDiceGame import simulation
+from PigDiceGame import stats
+from PigDiceGame import strategy
+
+CHUNK_SIZE = 100_000
+IN_FLIGHT = 2
+SUFFIXES = {"k": 10**3, "M": 10**6, "G": 10**9}
+PROG = "python -m PigDiceGame"
+SIMULATE = "Play computer against computer and report the win rates."
+
+
+def count(text):
+    """Return a number of games like 500, 10_000, 20k or 10M."""
+    multiplier = SUFFIXES.get(text[-1:], 1)
+    digits = text[:-1] if multiplier > 1 else text
+    try:
+        games = int(digits) * multiplier
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a number of games: {text!r}") from None
+    if games < 1:
+        raise argparse.ArgumentTypeError("play at least one game")
+    return games
+
+
+def play_chunk(first, second, start, games, seed):
+    """
+    Play the games numbered from start of a seeded run in a worker.
+
+    The chunk is played by the vectorized simulation with a SeedSequence
+    spawned from the master seed and keyed by start, the same child
+    SeedSequence.spawn would give, so any chunk is seeded on its own.
+    """
+    # Imported here, NumPy is not needed to start the interactive game.
+    import numpy as np  # pylint: disable=import-outside-toplevel
+    from PigDiceGame import vectorized  # pylint: disable=import-outside-toplevel
+
+    sequence = np.random.SeedSequence(seed, spawn_key=(start,))
+    return vectorized.VectorSimulation(first, second, seed=sequence).run(games, start=start)
+
+
+def confidence_level(text):
+    """Return a confidence level between 0 and 1, like 0.95."""
+    try:
+        level = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a confidence level: {text!r}") from None
+    if not 0.0 < level < 1.0:
+        raise argparse.ArgumentTypeError("the confidence level must be between 0 and 1")
+    return level
+
+
+def chunks(games, chunk_size=CHUNK_SIZE):
+    """Yield the first game number and the number of games of every chunk."""
+    for start in range(0, games, chunk_size):
+        yield start, min(chunk_size, games - start)
+
+
+def play_chunks(
+    first, second, games, seed, workers, chunk_size=CHUNK_SIZE
+):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    """
+    Yield the result of every chunk of a run in order.
+
+    With more than one worker the chunks are played in a process pool,
+    with at most IN_FLIGHT chunks per worker submitted at a time, so a
+    run of any size only keeps a few chunks in memory.
+    """
+    parts = chunks(games, chunk_size)
+    if workers <= 1:
+        for start, size in parts:
+            yield play_chunk(first, second, start, size, seed)
+        return
+    pool = ProcessPoolExecutor(max_workers=workers)
+    pending = collections.deque()
+    try:
+        for start, size in parts:
+            pending.append(pool.submit(play_chunk, first, second, start, size, seed))
+            if len(pending) >= workers * IN_FLIGHT:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        pool.shutdown(cancel_futures=True)
+
+
+def summary(result, seed, seconds, confidence=stats.CONFIDENCE):
+    """Return the result of a run with the confidence interval of the win rate of both seats."""
+    line = {"type": "summary"}
+    line.update(result.as_dict())
+    line["confidence"] = confidence
+    line["win_rate_interval"] = [
+        list(stats.wilson_interval(wins, result.games, confidence)) for wins in result.wins
+    ]
+    line["seed"] = seed
+    line["seconds"] = seconds
+    line["games_per_second"] = result.games / seconds if seconds > 0 else None
+    return line
+
+
+def simulate(args, out=None, err=None):
+    """
+    Play the games of the simulate subcommand and return the summary.
+
+    The run is cut into chunks of a fixed size and every chunk is seeded
+    from the master seed and its first game, so with a seed the result
+    does not depend on the number of workers. A progress line follows every chunk, as NDJSON
+    on out with --json and else as text on err, which default to
+    standard output and standard error.
+    """
+    out = out if out is not None else sys.stdout
+    err = err if err is not None else sys.stderr
+    started = time.perf_counter()
+    total = simulation.SimulationResult(args.p1, args.p2)
+    for partial in play_chunks(
+        args.p1, args.p2, args.games, args.seed, args.workers, args.chunk_size
+    ):
+        total.merge(partial)
+        progress = {
+            "type": "progress",
+            "games": total.games,
+            "of": args.games,
+            "wins": list(total.wins),
+            "win_rate": total.win_rate(0),
+            "seconds": time.perf_counter() - started,
+        }
+        if args.json:
+            out.write(json.dumps(progress) + "\n")
+            out.flush()
+        elif not args.quiet:
+            err.write(f"\r{total.games}/{args.games} games, {args.p1} won {total.win_rate(0):.2%}")
+            err.flush()
+    if not args.json and not args.quiet:
+        err.write("\n")
+
+    line = summary(total, args.seed, time.perf_counter() - started, args.confidence)
+    if args.json:
+        out.write(json.dumps(line) + "\n")
+    else:
+        report(line, out)
+    return line
+
+
+def report(line, out):
+    """Write the summary of a run as text."""
+    percent = round(line["confidence"] * 100)
+    for seat, name in enumerate((line["first"], line["second"])):
+        low, high = line["win_rate_interval"][seat]
+        wins = line["wins"][seat]
+        out.write(
+            f"{name:>8} won {wins} of {line['games']} games, {wins / line['games']:.2%} "
+            f"({percent}% interval {low:.2%} to {high:.2%})\n"
+        )
+    out.write(f"{line['average_turns']:.2f} turns per game, {line['seconds']:.1f} seconds\n")
+
+
+def simulate_arguments(parser):
+    """Add the options of the simulate subcommand to parser and return it."""
+    difficulties = strategy.names()
+    parser.add_argument("--p1", default="2", choices=difficulties, help="difficulty of seat 1")
+    parser.add_argument("--p2", default="Pelle", choices=difficulties, help="difficulty of seat 2")
+    parser.add_argument("--games", type=count, default=10_000, help="games to play, like 10M")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, help="master seed that makes the run reproducible")
+    parser.add_argument("--chunk-size", type=count, default=CHUNK_SIZE, help=argparse.SUPPRESS)
+    parser.add_argument("--confidence", type=confidence_level, default=stats.CONFIDENCE)
+    parser.add_argument("--json", action="store_true", help="write progress and summary as NDJSON")
+    parser.add_argument("--quiet", action="store_true", help="only write the summary")
+    return parser
+
+
+def parse_simulate(argv):
+    """Return the options of the simulate subcommand."""
+    parser = argparse.ArgumentParser(prog=f"{PROG} simulate", description=SIMULATE)
+    return simulate_arguments(parser).parse_args(argv)
+
+
+def build_parser():
+    """Return the parser of the game options and the subcommands."""
+    parser = argparse.ArgumentParser(
+        prog=PROG,
+        description="Play Pig against a friend or the computer, or start a subcommand.",
+        parents=[interactive.build_parser(add_help=False)],
+    )
+    commands = parser.add_subparsers(dest="command", title="subcommands")
+    simulate_arguments(commands.add_parser("simulate", help=SIMULATE, description=SIMULATE))
+    return parser
+
+
+def main(argv=None):
+    """Run a subcommand or start the game, return the exit status."""
+    argv = sys.argv[1:] if argv is None else argv
+    args = build_parser().parse_args(argv)
+    if args.command == "simulate":
+        simulate(args)
+        return 0
+    interactive.main(argv)
+    return 0
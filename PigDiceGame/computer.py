@@ -1,41 +1,49 @@
 """Computer intelligence."""
 
+import functools
 import random
+from PigDiceGame import strategy
+
+
+@functools.lru_cache(maxsize=1)
+def optimal_strategy():
+    """Return the shared optimal strategy, its decisions never draw."""
+    return strategy.create("4")
 
 
 class Computer:
     """Class for computer."""
 
-    def __init__(self, difficulty):
-        """Instanciate computer class."""
+    __slots__ = ("tossed_amount", "sum", "difficulty", "strategy", "rng")
+
+    options = ("toss", "stay")
+
+    def __init__(self, difficulty, rng=None):
+        """Instanciate computer class, rng is a random.Random or the random module."""
         self.tossed_amount = 0
         self.sum = 0
         self.difficulty = difficulty
-        self.options = ["toss", "stay"]
+        self.rng = rng if rng is not None else random
+        self.strategy = strategy.create(difficulty, self.rng)
 
     def set_difficulty(self, diff):
         """Setting the difficulty for the computer."""
         self.difficulty = diff
+        self.strategy = strategy.create(diff, self.rng)
 
     def get_difficulty(self):
         """Returning the difficulty of the computer."""
         return self.difficulty
 
-    def difficulty_choice(self, toss_counter, score):
-        """Class method for choosing difficulty."""
-        if self.difficulty == "1":
-            option = self.easy_difficulty(toss_counter)
-            return option
-        if self.difficulty == "2":
-            option = self.medium_difficulty(toss_counter)
-            return option
-        if self.difficulty == "Pelle":
-            option = self.hard_difficulty(score)
-            return option
-        if self.difficulty == "3":
-            option = self.random_difficulty()
-            return option
-        return None  # This line should never execute
+    def difficulty_choice(self, toss_counter, score, opponent_score=0):
+        """Class method for choosing difficulty, returns the decision in a list."""
+        return [self.decide(toss_counter, score, opponent_score)]
+
+    def decide(self, toss_counter, score, opponent_score=0):
+        """Return "toss" or "stay" from the strategy chosen for the difficulty."""
+        if self.strategy is None:
+            return None  # This line should never execute
+        return self.strategy.decide(self.sum, opponent_score, score, toss_counter)
 
     def set_total_score(self, score):
         """Setter for sum of computer."""
@@ -61,38 +69,42 @@ class Computer:
     def hard_difficulty(self, score):
         """Class method for hard_difficulty."""
         if score >= 25:
-            return random.choices(self.options, weights=(0, 100))
+            return self.rng.choices(self.options, weights=(0, 100))
+
+        return self.rng.choices(self.options, weights=(100, 0))
 
-        return random.choices(self.options, weights=(100, 0))
+    def optimal_difficulty(self, score, opponent_score):
+        """Class method for optimal_difficulty, a lookup in the solved policy."""
+        return [optimal_strategy().decide(self.sum, opponent_score, score, 0)]
 
     def medium_difficulty(self, toss_count):
         """Class method for medium_difficulty."""
         if toss_count == 0:
-            return random.choices(self.options, weights=(100, 0))
+            return self.rng.choices(self.options, weights=(100, 0))
         if toss_count == 1:
-            return random.choices(self.options, weights=(80, 20))
+            return self.rng.choices(self.options, weights=(80, 20))
         if toss_count == 2:
-            return random.choices(self.options, weights=(70, 30))
+            return self.rng.choices(self.options, weights=(70, 30))
         if toss_count == 3:
-            return random.choices(self.options, weights=(60, 40))
+            return self.rng.choices(self.options, weights=(60, 40))
         if toss_count == 4:
-            return random.choices(self.options, weights=(50, 50))
+            return self.rng.choices(self.options, weights=(50, 50))
         if toss_count == 5:
-            return random.choices(self.options, weights=(40, 60))
+            return self.rng.choices(self.options, weights=(40, 60))
         if toss_count == 6:
-            return random.choices(self.options, weights=(30, 70))
+            return self.rng.choices(self.options, weights=(30, 70))
         if toss_count == 7:
-            return random.choices(self.options, weights=(20, 80))
+            return self.rng.choices(self.options, weights=(20, 80))
 
-        return random.choices(self.options, weights=(0, 100))
+        return self.rng.choices(self.options, weights=(0, 100))
 
     def easy_difficulty(self, toss_count):
         """Class method for easy_difficulty."""
         if toss_count == 0:
-            return random.choices(self.options, weights=(100, 0))
+            return self.rng.choices(self.options, weights=(100, 0))
 
-        return random.choices(self.options, weights=(0, 100))
+        return self.rng.choices(self.options, weights=(0, 100))
 
     def random_difficulty(self):
         """Class method for random_difficulty."""
-        return random.choices(self.options, weights=(50, 50))
+        return self.rng.choices(self.options, weights=(50, 50))
@@ -6,11 +6,12 @@ import random
 class Dice:
     """Class to represent a Dice."""
 
-    def __init__(self):
-        """Initialize Dice attributes."""
+    def __init__(self, rng=None):
+        """Initialize Dice attributes, rng is a random.Random or the random module."""
         self.die = 1
+        self.rng = rng if rng is not None else random
 
     def get_random_number(self):
         """Class method for getting a random number."""
-        die = random.randint(1, 6)
+        die = self.rng.randint(1, 6)
         return die
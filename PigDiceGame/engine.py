@@ -0,0 +1,86 @@
+"""Game rules as a state machine without any I/O."""
+
+WINNING_SCORE = 100
+
+
+class GameState:  # pylint: disable=too-many-instance-attributes
+    """
+    The state of a game between two seats, 0 and 1.
+
+    roll applies a die value that was rolled elsewhere, so the state never
+    draws random numbers and a game can be replayed from its rolls. A one
+    loses the points of the turn, reaching the target wins at once, hold
+    banks the points of the turn and surrender hands the game to the
+    other seat. Rolling or holding after the game is over raises
+    ValueError.
+    """
+
+    __slots__ = (
+        "target",
+        "scores",
+        "current",
+        "turn_total",
+        "toss_count",
+        "turns",
+        "tosses",
+        "winner",
+    )
+
+    def __init__(self, scores=(0, 0), starter=0, target=WINNING_SCORE):
+        """Initialize the game with the banked scores and the seat that starts."""
+        self.target = target
+        self.scores = list(scores)
+        self.current = starter
+        self.turn_total = 0
+        self.toss_count = 0
+        self.turns = 1
+        self.tosses = 0
+        self.winner = None
+
+    def total(self):
+        """Return the banked score plus the points of the turn for the current seat."""
+        return self.scores[self.current] + self.turn_total
+
+    def opponent_score(self):
+        """Return the banked score of the seat that waits."""
+        return self.scores[1 - self.current]
+
+    def roll(self, value):
+        """Apply a rolled die value, return True while the turn goes on."""
+        self.check_not_over()
+        self.toss_count += 1
+        self.tosses += 1
+        if value == 1:
+            self.next_turn()
+            return False
+        self.turn_total += value
+        if self.scores[self.current] + self.turn_total >= self.target:
+            self.scores[self.current] += self.turn_total
+            self.turn_total = 0
+            self.winner = self.current
+            return False
+        return True
+
+    def hold(self):
+        """Bank the points of the turn and pass the die."""
+        self.check_not_over()
+        self.scores[self.current] += self.turn_total
+        self.next_turn()
+
+    def surrender(self):
+        """Give up, the other seat wins."""
+        self.check_not_over()
+        self.turn_total = 0
+        self.winner = 1 - self.current
+
+    def next_turn(self):
+        """Pass the die to the other seat."""
+        self.turn_total = 0
+        self.toss_count = 0
+        self.current = 1 - self.current
+        self.turns += 1
+
+    def check_not_over(self):
+        """Raise ValueError when the game already has a winner."""
+        if self.winner is not None:
+            raise ValueError("The game is over")
@@ -1,33 +1,50 @@
 """Game class."""
 
-import time
-import os
-import platform
 from PigDiceGame import player
 from PigDiceGame import computer
 from PigDiceGame import dice
-from PigDiceGame import histogram
+from PigDiceGame import engine
 from PigDiceGame import output
+from PigDiceGame import render
 
 RED = "\033[91m"
 GREEN = "\33[32m"
 END = "\033[0m"
 
 
-class Game:
+class Game:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
     """Game class."""
 
-    def __init__(self, highscore):
-        """Instanciate game class."""
+    def __init__(
+        self, highscore, renderer=None, recorder=None, show_odds=False, stats=None
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """
+        Instanciate game class.
+
+        The renderer shows the game and paces the computer, it defaults to
+        render.ConsoleRenderer. Use render.InstantRenderer for no pauses
+        or render.NullRenderer for automated runs. A records.RecordWriter
+        as recorder gets every finished game. With show_odds the player's
+        chance to win is shown before every choice. A stats.Statistics gets
+        every finished turn and game of every player.
+        """
         self.high = highscore
+        self.renderer = renderer if renderer is not None else render.ConsoleRenderer()
         self.playing = True
         self.players = {}
+        self.state = engine.GameState()
+        self.seats = [None, None]
+        self.recorder = recorder
+        self.show_odds = show_odds
+        self.stats = stats
+        self.rolls = []
+        self.decisions = []
 
     def start_game(self):
         """Beginning of the program."""
         self.high.retreive_highscore_file()
         while self.playing:
-            output.Output().display()
+            output.Output(self.renderer.show).display()
 
             choice = self.get_choice_from_user("Choice: ")
             self.handle_choice(choice)
@@ -47,28 +64,32 @@ class Game:
             self.player_vs_computer()
         elif choice == "3":
             self.clear_screen()
-            output.Output().game_rules()
+            output.Output(self.renderer.show).game_rules()
         elif choice == "4":
             self.clear_screen()
+            # Imported on first use, matplotlib takes most of the startup time.
+            from PigDiceGame import histogram  # pylint: disable=import-outside-toplevel
+
             chart = histogram.Histogram()
-            chart.plot_chart(self.high)
+            chart.plot_chart(self.high, self.renderer.show)
         elif choice == "5":
             self.quit()
         else:
             self.clear_screen()
-            print(RED + "Invalid option" + END)
+            self.renderer.show(RED + "Invalid option" + END)
 
     def player_vs_player(self):
         """Logic when the user picks play vs another player."""
         player1 = self.setup_player()
         player2 = self.setup_player()
+        self.new_match(player1, player2)
         self.clear_screen()
         playing = True
         while playing:
             playing = self.player_playing(player1)
             if playing is False and player1.get_total_score() < 100:
                 self.clear_screen()
-                print(
+                self.renderer.show(
                     RED
                     + player1.get_name()
                     + " surrendered"
@@ -83,7 +104,7 @@ class Game:
                 playing = self.player_playing(player2)
                 if playing is False and player2.get_total_score() < 100:
                     self.clear_screen()
-                    print(
+                    self.renderer.show(
                         RED
                         + player2.get_name()
                         + " surrendered"
@@ -98,15 +119,10 @@ class Game:
     def player_playing(self, current_player, computer_on=False, computer_instance=None):
         """Logic for when the player is playing."""
         die = dice.Dice()
-        score = current_player.get_total_score()
+        seat = self.seat(current_player)
         game_is_being_played = True
         while game_is_being_played:
-            print(
-                current_player.get_name()
-                + " you currently have "
-                + str(score)
-                + " point(s)"
-            )
+            self.show_points(current_player, computer_instance)
 
             choice = self.get_choice_from_user(
                 current_player.get_name()
@@ -123,25 +139,26 @@ Press 4 to surrender
             if choice == "1":
                 self.clear_screen()
                 die_value = current_player.throw_dice(die)
-                print(current_player.get_name() + " rolled a " + str(die_value))
+                self.renderer.show(current_player.get_name() + " rolled a " + str(die_value))
+                self.roll(die_value)
                 if die_value != 1:
-                    score += die_value
-                    game_is_being_played = self.check_if_winner(score, current_player)
+                    game_is_being_played = self.check_if_winner(self.state.total(), current_player)
                     continue
 
                 self.clear_screen()
-                print("Oh you got a " + str(die_value) + " better luck next time\n")
+                self.renderer.show("Oh you got a " + str(die_value) + " better luck next time\n")
                 game_is_being_played = False
                 return True
 
             if choice == "2":
-                current_player.set_total_score(score)
+                self.hold()
+                current_player.set_total_score(self.state.scores[seat])
                 name = current_player.get_name()
                 self.players[name] = current_player.get_total_score()
 
                 current_points = current_player.get_total_score()
                 self.clear_screen()
-                print(
+                self.renderer.show(
                     current_player.get_name()
                     + " stayed and now have "
                     + str(current_points)
@@ -158,10 +175,11 @@ Press 4 to surrender
                 new_key = new_name
                 self.players[new_key] = value
                 self.clear_screen()
-                print("Your new name is now " + new_name)
+                self.renderer.show("Your new name is now " + new_name)
                 continue
 
             if choice == "4":
+                self.surrender()
                 return False
 
             if choice == "ezwin":
@@ -176,7 +194,7 @@ Press 4 to surrender
 
             else:
                 self.clear_screen()
-                print(RED + "That's not an option" + END)
+                self.renderer.show(RED + "That's not an option" + END)
         return False
 
     def computer_difficulty(self):
@@ -186,16 +204,17 @@ Press 4 to surrender
                 """What difficulty do you want?
 1. Playing against a new born baby
 2. Playing against a grown up
-3. Completly random no logic\nChoice: """
+3. Completly random no logic
+4. Playing against a perfect player\nChoice: """
             )  # noqa: 122 ignores line missing indentation
             self.clear_screen()
 
-            if difficulty in ["1", "2", "3", "Pelle"]:
+            if difficulty in ["1", "2", "3", "4", "Pelle"]:
                 if difficulty == "Pelle":
-                    output.Output().pelle()
+                    output.Output(self.renderer.show).pelle()
                 break
             self.clear_screen()
-            print(RED + "Invalid option" + END)
+            self.renderer.show(RED + "Invalid option" + END)
         return difficulty
 
     def player_vs_computer(self):
@@ -205,12 +224,13 @@ Press 4 to surrender
         difficulty = self.computer_difficulty()
         intelligence = computer.Computer(difficulty)
         self.players["Computer"] = intelligence.get_total_score()
+        self.new_match(player1, intelligence)
         playing = True
         while playing:
             playing = self.player_playing(player1, computer_on=True, computer_instance=intelligence)
             if playing is False and player1.get_total_score() < 100:
                 self.clear_screen()
-                print(
+                self.renderer.show(
                     RED
                     + player1.get_name()
                     + " surrendered"
@@ -221,40 +241,36 @@ Press 4 to surrender
                     + END
                 )
             elif playing is True:
-                playing = self.computer_playing(intelligence)
+                playing = self.computer_playing(intelligence, player1.get_total_score())
 
-    def computer_playing(self, pc):
+    def computer_playing(self, pc, opponent_score=0):
         """Logic for when the computer is playing."""
         die = dice.Dice()
-        score = pc.get_total_score()
-        score_this_round = 0
+        seat = self.seat(pc)
         game_is_being_played = True
-        toss_counter = 0
         while game_is_being_played:
-            print("Computer currently have " + str(score) + " point(s)")
-            time.sleep(1)
-            decision = pc.difficulty_choice(toss_counter, score_this_round)
-            choice = decision[0]
+            self.renderer.show("Computer currently have " + str(self.state.total()) + " point(s)")
+            self.renderer.pause()
+            choice = pc.decide(self.state.toss_count, self.state.turn_total, opponent_score)
             if choice == "toss":
                 self.clear_screen()
-                toss_counter += 1
                 die_value = pc.throw_dice(die)
-                print("Computer got a " + str(die_value))
+                self.renderer.show("Computer got a " + str(die_value))
+                self.roll(die_value)
                 if die_value != 1:
-                    score += die_value
-                    game_is_being_played = self.check_if_winner(score, pc)
-                    score_this_round += die_value
+                    game_is_being_played = self.check_if_winner(self.state.total(), pc)
                     continue
 
-                print("Oh you got a " + str(die_value) + " better luck next time\n")
+                self.renderer.show("Oh you got a " + str(die_value) + " better luck next time\n")
                 game_is_being_played = False
                 return True
 
             if choice == "stay":
-                pc.set_total_score(score)
+                self.hold()
+                pc.set_total_score(self.state.scores[seat])
                 current_points = pc.get_total_score()
                 self.clear_screen()
-                print(
+                self.renderer.show(
                     "Computer stayed and now have "
                     + str(current_points)
                     + " point(s)\n"
@@ -263,10 +279,10 @@ Press 4 to surrender
                 return True
 
     def check_if_winner(self, score, current_player):
-        """Check if the current toss is enough to win."""
-        if isinstance(current_player, player.Player):
-            if score >= 100:
-                print(
+        """Check if the current toss is enough to win, anyone but the computer is a player."""
+        if not isinstance(current_player, computer.Computer):
+            if score >= engine.WINNING_SCORE:
+                self.renderer.show(
                     GREEN
                     + "You won in "
                     + str(current_player.get_tossed_amount())
@@ -277,12 +293,13 @@ Press 4 to surrender
                 points = current_player.get_total_score()
                 self.players[current_player.get_name()] = points
                 self.high.add_winner(current_player.get_name())
+                self.record_stats(current_player)
                 return False
 
             return True
         if isinstance(current_player, computer.Computer):
-            if score >= 100:
-                print(
+            if score >= engine.WINNING_SCORE:
+                self.renderer.show(
                     GREEN
                     + "Computer won in "
                     + str(current_player.get_tossed_amount())
@@ -292,10 +309,108 @@ Press 4 to surrender
                 current_player.set_total_score(score)
                 self.players["Computer"] = current_player.get_total_score()
                 self.high.add_winner("Computer")
+                self.record_stats(current_player)
                 return False
 
         return True
 
+    def new_match(self, first, second=None):
+        """Start a new game state with the banked scores of the participants."""
+        self.seats = [first, second]
+        scores = [0 if seat is None else seat.get_total_score() for seat in self.seats]
+        self.state = engine.GameState(scores)
+        self.rolls = []
+        self.decisions = []
+
+    def seat(self, participant):
+        """
+        Return the seat of the participant in the match.
+
+        The menu starts a match with new_match before the first turn. A
+        participant that is not in the match, or whose match is over, gets
+        a new match of its own when a turn is played on its own.
+        """
+        if self.state.winner is None:
+            for index, seated in enumerate(self.seats):
+                if seated is participant:
+                    return index
+        self.new_match(participant)
+        return 0
+
+    def show_points(self, current_player, computer_instance=None):
+        """Show the points of the player and the chance to win if asked for."""
+        self.renderer.show(
+            current_player.get_name()
+            + " you currently have "
+            + str(self.state.total())
+            + " point(s)"
+        )
+        if self.show_odds:
+            self.renderer.show(f"Chance to win: {self.odds(computer_instance):.1%}")
+
+    def odds(self, computer_instance=None):
+        """Return the chance to win of the player to move when playing optimally."""
+        # Imported on first use, the tables need NumPy.
+        from PigDiceGame import winprob  # pylint: disable=import-outside-toplevel
+
+        opponent = "4" if computer_instance is None else computer_instance.get_difficulty()
+        return winprob.win_probability(
+            self.state.scores[self.state.current],
+            self.state.opponent_score(),
+            self.state.turn_total,
+            self.state.toss_count,
+            "4",
+            opponent,
+        )
+
+    def roll(self, die_value):
+        """Apply a roll to the game state."""
+        self.rolls.append(die_value)
+        self.decisions.append(True)
+        seat, tosses, turn_total = self.state.current, self.state.toss_count, self.state.turn_total
+        self.state.roll(die_value)
+        if self.stats is not None:
+            if die_value == 1:
+                self.stats.record_turn(self.name_of(seat), tosses + 1, 0, bust=True)
+            elif self.state.winner is not None:
+                self.stats.record_turn(self.name_of(seat), tosses + 1, turn_total + die_value)
+        self.record_game()
+
+    def hold(self):
+        """Bank the points of the turn in the game state."""
+        self.decisions.append(False)
+        if self.stats is not None:
+            self.stats.record_turn(
+                self.name_of(self.state.current), self.state.toss_count, self.state.turn_total
+            )
+        self.state.hold()
+
+    def surrender(self):
+        """Give up the game for the current seat."""
+        self.state.surrender()
+        self.record_stats(self.seats[self.state.winner])
+        self.record_game()
+
+    def name_of(self, seat):
+        """Return the name of the participant in a seat."""
+        participant = self.seats[seat]
+        if isinstance(participant, computer.Computer):
+            return "Computer"
+        return participant.get_name()
+
+    def record_stats(self, winner):
+        """Add the finished game to the statistics of both participants."""
+        if self.stats is None:
+            return
+        for seat, participant in enumerate(self.seats):
+            if participant is not None:
+                self.stats.record_game(self.name_of(seat), participant is winner)
+
+    def record_game(self):
+        """Write the game to the recorder once it has a winner."""
+        if self.recorder is not None and self.state.winner is not None:
+            self.recorder.write_state(self.state, self.rolls, self.decisions)
+
     def get_player_score(self, player_name):
         """
         To get the players score, this is used for easier testing if the.
@@ -309,7 +424,7 @@ Press 4 to surrender
 
     def change_name(self, current_player):
         """Set a new name for the player."""
-        print("Old name: " + current_player.get_name())
+        self.renderer.show("Old name: " + current_player.get_name())
         new_name = input("Input new name: ").capitalize()
         current_player.set_name(new_name)
 
@@ -325,12 +440,10 @@ Press 4 to surrender
 
     def clear_screen(self):
         """Clear screen for both Windows and Mac users."""
-        if platform.system() == "Windows":
-            os.system("cls")
-        else:
-            os.system("clear")
+        self.renderer.clear()
 
     def quit(self):
         """Stop the program."""
-        print("Quit out of the game")
+        self.renderer.show("Quit out of the game")
+        self.high.close()
         self.playing = False
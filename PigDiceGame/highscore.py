@@ -1,29 +1,97 @@
 """Highscore class."""
 
+import re
+from PigDiceGame.leaderboard import Leaderboard
+
+# Lines of name : wins as add_highscore_to_file writes them, names without spaces.
+CANONICAL = re.compile(r"(?:\S+ : [0-9]+\n)*+(?:\S+ : [0-9]+)?")
+
+
+def parse_highscores(text):
+    """
+    Return the wins in the text of a highscore file as a dictionary.
+
+    Every line is name : wins, split at the last colon so names may
+    contain colons. Names are stripped, wins are ASCII digits, other
+    lines are skipped and the wins of a name that occurs twice are
+    added. A file that is all in the form add_highscore_to_file writes,
+    without spaces in the names, is checked with one regular expression
+    and split into columns without a loop in Python.
+    """
+    if CANONICAL.fullmatch(text) is None:
+        return parse_highscore_lines(text)
+    tokens = text.split()
+    names = tokens[0::3]
+    scores = list(map(int, tokens[2::3]))
+    counts = dict(zip(names, scores))
+    if len(counts) < len(names):
+        counts = {}
+        for name, score in zip(names, scores):
+            counts[name] = counts.get(name, 0) + score
+    return counts
+
+
+def parse_highscore_lines(text):
+    """Return the wins in the text one line at a time, skipping the bad lines."""
+    counts = {}
+    for line in text.splitlines():
+        name, separator, score = line.rpartition(":")
+        name, score = name.strip(), score.strip()
+        if separator and name and score.isascii() and score.isdigit():
+            counts[name] = counts.get(name, 0) + int(score)
+    return counts
+
+
+def read_highscores(path):
+    """Read a whole highscore file and return its wins, an empty dictionary if it is missing."""
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as file:
+            return parse_highscores(file.read())
+    except FileNotFoundError:
+        return {}
+
 
 class Highscore:
     """Class to initiate highscore."""
 
-    def __init__(self):
-        """Initialize highsscore list."""
+    def __init__(self, store=None):
+        """
+        Initialize highsscore list.
+
+        Without a store every win rewrites highscore_list.txt, with a
+        store such as storage.AppendLogStore the store persists the wins.
+        An indexed store such as storage.SQLiteStore also answers the
+        leaderboard queries, then the list is not kept in memory.
+        Otherwise the wins are also kept ranked in a Leaderboard.
+        """
         self.highscores = {}
+        self.board = Leaderboard()
+        self.store = store
 
     def add_winner(self, player):
         """Add winner a winner."""
+        if self.store is not None and self.store.indexed:
+            self.store.record(player)
+            return
+
         if player in self.highscores:
             self.highscores[player] += 1
         else:
             score = 1
             self.highscores[player] = score
+        self.board.set_wins(player, self.highscores[player])
 
-        self.add_highscore_to_file(self.highscores)
+        if self.store is None:
+            self.add_highscore_to_file(self.highscores)
+        else:
+            self.store.record(player)
 
-    def get_name_and_highscore(self):
-        """Class method to get name and score."""
+    def get_name_and_highscore(self, limit=None):
+        """Class method to get name and score, of the best players if limit is set."""
         names = []
         values = []
 
-        playerlist = self.sorted_list()
+        playerlist = self.sorted_list() if limit is None else self.top(limit)
         for keys_values in playerlist:
             name, value = keys_values
             names.append(name)
@@ -38,16 +106,41 @@ class Highscore:
 
     def retreive_highscore_file(self):
         """Class method to retreive highscore file."""
-        self.highscores = {}
-        with open("highscore_list.txt", "r", encoding="utf-8") as file:
-            for line in file:
-                name, score = line.strip().split(":")
-                self.highscores[name] = int(score)
+        if self.store is not None:
+            if not self.store.indexed:
+                self.highscores = self.store.load()
+                self.board.rebuild(self.highscores)
+            return self.highscores
+        self.highscores = read_highscores("highscore_list.txt")
+        self.board.rebuild(self.highscores)
         return self.highscores
 
     def sorted_list(self):
         """Class method to sort highscores."""
-        sorted_highscores = sorted(
-            self.highscores.items(), key=lambda x: x[1], reverse=True
-        )
-        return sorted_highscores
+        if self.store is not None and self.store.indexed:
+            return self.store.top(self.store.count())
+        return self.board.top(len(self.board))
+
+    def top(self, limit=10):
+        """Return the best players as (name, wins), most wins first."""
+        if self.store is not None and self.store.indexed:
+            return self.store.top(limit)
+        return self.board.top(limit)
+
+    def rank(self, player):
+        """Return the 1-based rank of a player, or None if the player never won."""
+        if self.store is not None and self.store.indexed:
+            return self.store.rank(player)
+        return self.board.rank(player)
+
+    def page(self, number, size=10):
+        """Return one page of the leaderboard, the first page is number 0."""
+        if self.store is not None and self.store.indexed:
+            return self.store.page(number, size)
+        start, end = number * size, (number + 1) * size
+        return self.board.top(end)[start:]
+
+    def close(self):
+        """Write everything the store still buffers."""
+        if self.store is not None:
+            self.store.close()
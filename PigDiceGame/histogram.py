@@ -1,13 +1,19 @@
 """Histogram."""
 
+import hashlib
+import io
 import sys
 import os
-import matplotlib.pyplot as plt
-from matplotlib.ticker import MaxNLocator
+
+# matplotlib is imported by the methods that draw, so importing this
+# module stays cheap for the game and the simulation workers.
+# pylint: disable=import-outside-toplevel
 
 RED = "\033[91m"
 END = "\033[0m"
 
+CACHE_SIZE = 16
+
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
@@ -16,54 +22,97 @@ class Histogram:
     """Histogram Class."""
 
     def __init__(self):
-        """Initialize the histogram."""
+        """Initialize the histogram and the cache of rendered charts."""
+        self.cache = {}
 
-    def plot_chart(self, high_score):
-        """Plot the high score table."""
-        names, values = high_score.get_name_and_highscore()
+    def plot_chart(self, high_score, show=print):
+        """Plot the high score table, or show that it is empty with show."""
+        names, values = high_score.get_name_and_highscore(limit=10)
 
         if not names and not values:
-            print(RED + "\nTHE LIST IS EMPTY !\n" + END)
+            show(RED + "\nTHE LIST IS EMPTY !\n" + END)
         else:
-            if len(names) <= 10:
-                combined_names = names
-                combined_values = values
-            else:
-                combined_names = names[:10]
-                combined_values = values[:10]
+            import matplotlib.pyplot as plt
 
             _, ax = plt.subplots()
-
-            colors = ["gold", "silver", "saddlebrown"] + ["black"] * (len(names) - 3)
-
-            bars = ax.bar(
-                combined_names,
-                combined_values,
-                color=colors,
-                edgecolor="black",
-                alpha=0.7,
-            )
-
-            ax.set_title("Highscores")
-            ax.set_xlabel("Name")
-            ax.set_ylabel("Highscore")
-
-            ax.grid(axis="y", linestyle="--", alpha=0.5)
-
-            for bar_, combined_values in zip(bars, combined_values):
-                height = bar_.get_height()
-                ax.annotate(
-                    f"{combined_values}",
-                    xy=(bar_.get_x() + bar_.get_width() / 2, height),
-                    xytext=(0, 3),
-                    textcoords="offset points",
-                    ha="center",
-                    va="bottom",
-                )
-
+            self.draw(ax, names[:10], values[:10])
             plt.xticks(rotation=45)
-            ax.yaxis.set_major_locator(MaxNLocator(integer=True))
-            ax.set_ylim(0, max(values) * 1.1)
-
             plt.tight_layout()
             plt.show()
+
+    def draw(self, ax, names, values):
+        """Draw the bars of the high score table on the axes."""
+        from matplotlib.ticker import MaxNLocator
+
+        colors = ["gold", "silver", "saddlebrown"] + ["black"] * (len(names) - 3)
+
+        bars = ax.bar(
+            names,
+            values,
+            color=colors,
+            edgecolor="black",
+            alpha=0.7,
+        )
+
+        ax.set_title("Highscores")
+        ax.set_xlabel("Name")
+        ax.set_ylabel("Highscore")
+
+        ax.grid(axis="y", linestyle="--", alpha=0.5)
+
+        for bar_, value in zip(bars, values):
+            height = bar_.get_height()
+            ax.annotate(
+                f"{value}",
+                xy=(bar_.get_x() + bar_.get_width() / 2, height),
+                xytext=(0, 3),
+                textcoords="offset points",
+                ha="center",
+                va="bottom",
+            )
+
+        ax.yaxis.set_major_locator(MaxNLocator(integer=True))
+        ax.set_ylim(0, max(values) * 1.1)
+
+    def render(self, high_score, fmt="png"):
+        """
+        Render the top 10 as PNG or SVG bytes without opening a window.
+
+        The chart is drawn with the Agg canvas and cached by a hash of the
+        top 10, so an unchanged leaderboard is never drawn twice. Returns
+        None when the list is empty.
+        """
+        names, values = high_score.get_name_and_highscore(limit=10)
+        if not names:
+            return None
+        key = hashlib.sha256(repr((fmt, names, values)).encode("utf-8")).hexdigest()
+        if key in self.cache:
+            return self.cache[key]
+
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        figure = Figure()
+        FigureCanvasAgg(figure)
+        ax = figure.add_subplot()
+        self.draw(ax, names, values)
+        ax.tick_params(axis="x", labelrotation=45)
+        figure.tight_layout()
+        buffer = io.BytesIO()
+        figure.savefig(buffer, format=fmt)
+
+        if len(self.cache) >= CACHE_SIZE:
+            del self.cache[next(iter(self.cache))]
+        self.cache[key] = buffer.getvalue()
+        return self.cache[key]
+
+    def save(self, high_score, path, fmt=None):
+        """Render the top 10 to a file, the format follows the file ending by default."""
+        if fmt is None:
+            fmt = os.path.splitext(path)[1].lstrip(".") or "png"
+        chart = self.render(high_score, fmt)
+        if chart is None:
+            return False
+        with open(path, "wb") as file:
+            file.write(chart)
+        return True
@@ -0,0 +1,168 @@
+"""Counters and timings of the phases of the game, off unless enabled."""
+
+import bisect
+import functools
+import importlib
+import json
+import time
+
+ENV_VAR = "PIGDICE_PROFILE"
+
+# Upper bounds of the timing buckets in seconds, the last bucket is +Inf.
+BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 0.1, 1.0, 10.0)
+
+# The methods that are timed, as module, class, method and phase.
+HOOKS = (
+    ("PigDiceGame.game", "Game", "player_playing", "player_turn"),
+    ("PigDiceGame.game", "Game", "computer_playing", "computer_turn"),
+    ("PigDiceGame.computer", "Computer", "decide", "decision"),
+    ("PigDiceGame.dice", "Dice", "get_random_number", "roll"),
+    ("PigDiceGame.render", "ConsoleRenderer", "show", "render"),
+    ("PigDiceGame.render", "ConsoleRenderer", "clear", "render"),
+    ("PigDiceGame.render", "InstantRenderer", "clear", "render"),
+    ("PigDiceGame.render", "ConsoleRenderer", "pause", "pause"),
+    ("PigDiceGame.highscore", "Highscore", "add_winner", "persist"),
+    ("PigDiceGame.highscore", "Highscore", "retreive_highscore_file", "load"),
+)
+
+
+class Histogram:
+    """Number of calls, total time and calls per bucket of one phase."""
+
+    __slots__ = ("count", "total", "buckets")
+
+    def __init__(self):
+        """Initialize a histogram without calls."""
+        self.count = 0
+        self.total = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)
+
+    def observe(self, seconds):
+        """Add one call that took seconds."""
+        self.count += 1
+        self.total += seconds
+        self.buckets[bisect.bisect_left(BUCKETS, seconds)] += 1
+
+    def cumulative(self):
+        """Return the calls at or below every bucket bound, the last is all calls."""
+        counts = []
+        seen = 0
+        for count in self.buckets:
+            seen += count
+            counts.append(seen)
+        return counts
+
+    def as_dict(self):
+        """Return the histogram as a plain dictionary."""
+        bounds = [str(bound) for bound in BUCKETS] + ["+Inf"]
+        return {
+            "count": self.count,
+            "seconds": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "buckets": dict(zip(bounds, self.cumulative())),
+        }
+
+
+class Instruments:
+    """
+    The histograms of every phase and the hooks that fill them.
+
+    Disabled the game runs its own methods and pays nothing. enable wraps
+    the methods in HOOKS with a timer and disable puts the originals
+    back. Phases nest, the time of a player_turn includes its roll and
+    render.
+    """
+
+    def __init__(self):
+        """Initialize disabled instruments without data."""
+        self.phases = {}
+        self.originals = []
+
+    @property
+    def enabled(self):
+        """Return True while the hooks are installed."""
+        return bool(self.originals)
+
+    def observe(self, phase, seconds):
+        """Add one call of a phase."""
+        histogram = self.phases.get(phase)
+        if histogram is None:
+            histogram = self.phases[phase] = Histogram()
+        histogram.observe(seconds)
+
+    def timed(self, function, phase):
+        """Return function wrapped to add the time of every call to phase."""
+        clock = time.perf_counter
+        observe = self.observe
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                observe(phase, clock() - start)
+
+        return wrapper
+
+    def enable(self):
+        """Install the hooks, does nothing if they are installed."""
+        if self.enabled:
+            return
+        for module, owner, name, phase in HOOKS:
+            cls = getattr(importlib.import_module(module), owner)
+            original = cls.__dict__[name]
+            self.originals.append((cls, name, original))
+            setattr(cls, name, self.timed(original, phase))
+
+    def disable(self):
+        """Put the original methods back, the data is kept."""
+        while self.originals:
+            cls, name, original = self.originals.pop()
+            setattr(cls, name, original)
+
+    def reset(self):
+        """Drop the data of every phase."""
+        self.phases = {}
+
+    def as_dict(self):
+        """Return every phase as a plain dictionary."""
+        return {phase: histogram.as_dict() for phase, histogram in sorted(self.phases.items())}
+
+    def prometheus(self):
+        """Return every phase in the Prometheus text format."""
+        lines = [
+            "# HELP pigdice_phase_seconds Time spent in each phase of the game.",
+            "# TYPE pigdice_phase_seconds histogram",
+        ]
+        bounds = [repr(bound) for bound in BUCKETS] + ["+Inf"]
+        for phase, histogram in sorted(self.phases.items()):
+            label = f'phase="{phase}"'
+            for bound, count in zip(bounds, histogram.cumulative()):
+                lines.append(f'pigdice_phase_seconds_bucket{{{label},le="{bound}"}} {count}')
+            lines.append(f"pigdice_phase_seconds_sum{{{label}}} {histogram.total!r}")
+            lines.append(f"pigdice_phase_seconds_count{{{label}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, path):
+        """Write the data to path, as Prometheus text for .prom or .txt and else as JSON."""
+        with open(path, "w", encoding="utf-8") as file:
+            if path.endswith((".prom", ".txt")):
+                file.write(self.prometheus())
+            else:
+                json.dump({"phases": self.as_dict()}, file, indent=2)
+                file.write("\n")
+
+
+INSTRUMENTS = Instruments()
+
+
+def profile(path, function, *args, **kwargs):
+    """Call function under cProfile, dump the stats to path and return its result."""
+    import cProfile  # pylint: disable=import-outside-toplevel
+
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(function, *args, **kwargs)
+    finally:
+        profiler.dump_stats(path)
@@ -0,0 +1,74 @@
+"""Incrementally ranked leaderboard."""
+
+import bisect
+
+
+class Leaderboard:
+    """
+    Players grouped in buckets by their number of wins.
+
+    A win moves a player one bucket up, which costs a dict update and a
+    bisect in the sorted list of distinct win counts. top walks the
+    buckets from the most wins down and stops after limit players, rank
+    adds up the bucket sizes above the player. Neither sorts the players.
+    """
+
+    def __init__(self, highscores=None):
+        """Initialize an empty board, or one with the given wins per name."""
+        self.wins = {}
+        self.buckets = {}
+        self.counts = []
+        if highscores:
+            self.rebuild(highscores)
+
+    def __len__(self):
+        """Return the number of players on the board."""
+        return len(self.wins)
+
+    def rebuild(self, highscores):
+        """Replace the board with the given wins per name."""
+        self.wins = {}
+        self.buckets = {}
+        self.counts = []
+        for name, wins in highscores.items():
+            self.set_wins(name, wins)
+
+    def set_wins(self, name, wins):
+        """Move a player to the bucket for the given wins."""
+        old = self.wins.get(name)
+        if old is not None:
+            bucket = self.buckets[old]
+            del bucket[name]
+            if not bucket:
+                del self.buckets[old]
+                del self.counts[bisect.bisect_left(self.counts, old)]
+        self.wins[name] = wins
+        bucket = self.buckets.get(wins)
+        if bucket is None:
+            bucket = self.buckets[wins] = {}
+            bisect.insort(self.counts, wins)
+        bucket[name] = None
+
+    def add_win(self, name):
+        """Add one win to a player."""
+        self.set_wins(name, self.wins.get(name, 0) + 1)
+
+    def top(self, limit=10):
+        """Return the best players as (name, wins), most wins first."""
+        result = []
+        if limit is not None and limit <= 0:
+            return result
+        for wins in reversed(self.counts):
+            for name in self.buckets[wins]:
+                result.append((name, wins))
+                if len(result) == limit:
+                    return result
+        return result
+
+    def rank(self, name):
+        """Return the 1-based rank of a player, or None if the player is not on the board."""
+        wins = self.wins.get(name)
+        if wins is None:
+            return None
+        position = bisect.bisect_right(self.counts, wins)
+        return sum(len(self.buckets[count]) for count in self.counts[position:]) + 1
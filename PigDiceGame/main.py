@@ -1,16 +1,91 @@
 """Main Class."""
 
+import argparse
+import math
 import sys
 import os
 
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
-from PigDiceGame import game, highscore
+from PigDiceGame import game, highscore, instrument, render, storage
 
+RENDERERS = {
+    "console": render.ConsoleRenderer,
+    "instant": render.InstantRenderer,
+    "null": render.NullRenderer,
+}
 
-def main():
+
+def seconds(text):
+    """Return a delay in seconds that is not negative, like 0.5."""
+    try:
+        delay = float(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a number of seconds: {text!r}") from None
+    if not math.isfinite(delay) or delay < 0.0:
+        raise argparse.ArgumentTypeError("the delay must be a finite number of seconds from 0")
+    return delay
+
+
+def make_renderer(args):
+    """Return the renderer of the options, with their delay if one was given."""
+    cls = RENDERERS[args.renderer]
+    if args.delay is None or cls is render.NullRenderer:
+        return cls()
+    return cls(args.delay)
+
+
+def build_parser(add_help=True):
+    """Return the parser of the command line options of the game."""
+    parser = argparse.ArgumentParser(
+        description="Play Pig against a friend or the computer.", add_help=add_help
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        default=os.environ.get(instrument.ENV_VAR) or None,
+        help="time the phases of the game and write them to PATH, Prometheus text for "
+        f".prom or .txt and else JSON (default: ${instrument.ENV_VAR})",
+    )
+    parser.add_argument(
+        "--cprofile", metavar="PATH", help="run the game under cProfile and dump the stats to PATH"
+    )
+    parser.add_argument(
+        "--renderer",
+        choices=RENDERERS,
+        default="console",
+        help="console clears the screen with a system command, instant with ANSI escapes and "
+        "without pausing, null shows nothing (default: console)",
+    )
+    parser.add_argument(
+        "--delay",
+        type=seconds,
+        help="seconds to pause before every computer decision (default: 1 for console, "
+        "0 for instant)",
+    )
+    return parser
+
+
+def parse_args(argv=None):
+    """Return the command line options."""
+    return build_parser().parse_args(argv)
+
+
+def main(argv=None):
     """Execute the main program."""
-    high = highscore.Highscore()
-    game.Game(high).start_game()
+    args = parse_args(argv)
+    if args.profile:
+        instrument.INSTRUMENTS.enable()
+    try:
+        high = highscore.Highscore(storage.LockedFileStore(batch_size=1))
+        play = game.Game(high, make_renderer(args))
+        if args.cprofile:
+            instrument.profile(args.cprofile, play.start_game)
+        else:
+            play.start_game()
+    finally:
+        if args.profile:
+            instrument.INSTRUMENTS.disable()
+            instrument.INSTRUMENTS.export(args.profile)
 
 
 if __name__ == "__main__":
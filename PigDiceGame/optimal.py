@@ -0,0 +1,112 @@
+"""Optimal Pig strategy solved with value iteration."""
+
+import os
+import numpy as np
+from PigDiceGame import strategy
+
+TARGET = 100
+POLICY_PATH = os.path.join(os.path.dirname(__file__), "data", "optimal_policy.npy")
+
+_cache = {}
+
+
+def solve(target=TARGET, tolerance=1e-9, max_iterations=10_000):
+    """
+    Solve Pig to the target score with value iteration.
+
+    Returns the winning probabilities and the hold policy, both indexed
+    by (own score, opponent score, turn total) for the player to move.
+    Rolling a 1 loses the turn total, reaching the target wins at once.
+    """
+    own = np.arange(target)[:, None, None]
+    opponent = np.arange(target)[None, :, None]
+    turn_total = np.arange(target)[None, None, :]
+    won = own + turn_total >= target
+    banked = np.minimum(own + turn_total, target - 1)
+
+    # Turn totals up to target + 5 can be reached by one roll, those win.
+    prob = np.ones((target, target, target + 6))
+    prob[:, :, :target] = np.where(won, 1.0, 0.0)
+    for _ in range(max_iterations):
+        start = prob[:, :, 0].copy()
+        hold = 1.0 - start[opponent, banked]
+        roll = (1.0 - start.T)[:, :, None]
+        for value in range(2, 7):
+            end = target + value
+            roll = roll + prob[:, :, value:end]
+        roll /= 6.0
+        new = np.where(won, 1.0, np.maximum(roll, hold))
+        delta = np.abs(new - prob[:, :, :target]).max()
+        prob[:, :, :target] = new
+        if delta < tolerance:
+            break
+    policy = (hold > roll) & ~won
+    return prob[:, :, :target], policy
+
+
+def save_policy(policy, path=POLICY_PATH):
+    """Save a hold policy as a bit-packed array."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    np.save(path, np.packbits(policy, axis=None))
+
+
+def load_policy(path=POLICY_PATH, target=TARGET):
+    """Load a bit-packed hold policy, solving and saving it if it is missing."""
+    if path in _cache:
+        return _cache[path]
+    if os.path.exists(path):
+        packed = np.load(path)
+        policy = np.unpackbits(packed, count=target**3).view(bool).reshape((target,) * 3)
+    else:
+        _, policy = solve(target)
+        save_policy(policy, path)
+    _cache[path] = policy
+    return policy
+
+
+def should_hold(own_score, opponent_score, turn_total):
+    """Return True if the optimal player holds in this state."""
+    if own_score + turn_total >= TARGET:
+        return True
+    return bool(load_policy()[own_score, opponent_score, turn_total])
+
+
+class OptimalStrategy(strategy.Strategy):
+    """Strategy that plays the solved optimal policy."""
+
+    toss_limit = 0
+
+    def __init__(self, rng=None):
+        """Load the policy table once."""
+        super().__init__(rng)
+        self.policy = load_policy()
+
+    def decide(self, own_score, opponent_score, turn_total, toss_count):
+        """Return TOSS or HOLD from the policy table."""
+        if own_score + turn_total >= TARGET or self.policy[own_score, opponent_score, turn_total]:
+            return strategy.HOLD
+        return strategy.TOSS
+
+    def decide_batch(self, own_score, opponent_score, turn_total, toss_count, rng):
+        """Look up the policy for every game."""
+        return self.policy[own_score, opponent_score, turn_total]
+
+    def hold_probability(self, own_score, opponent_score, turn_total, toss_count):
+        """Return 1.0 where the policy holds and 0.0 where it tosses."""
+        decision = self.decide(own_score, opponent_score, turn_total, toss_count)
+        return 1.0 if decision == strategy.HOLD else 0.0
+
+    def hold_probabilities(self, own_score, opponent_score, turn_total, toss_count):
+        """Look up the policy for broadcastable arrays, holding where the target is reached."""
+        won = np.add(own_score, turn_total) >= TARGET
+        policy = self.policy[
+            np.minimum(own_score, TARGET - 1),
+            np.minimum(opponent_score, TARGET - 1),
+            np.minimum(turn_total, TARGET - 1),
+        ]
+        hold = (won | policy).astype(float)
+        return np.broadcast_to(hold, np.broadcast_shapes(hold.shape, np.shape(toss_count)))
+
+
+if __name__ == "__main__":
+    save_policy(solve()[1])
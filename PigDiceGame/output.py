@@ -9,12 +9,13 @@ YELLOW = "\u001b[33m"
 class Output:
     """Instanciate ascii class."""
 
-    def __init__(self) -> None:
-        """Pass."""
+    def __init__(self, show=print) -> None:
+        """Initialize with the function that shows a text, print by default."""
+        self.show = show
 
     def pelle(self):
         """Pelle."""
-        print(
+        self.show(
             """@@@&&@@&&&&#/**/*,,*////((#%###%%#/*#@@@@@@&&&&@@@
 @@@@@@&%(///*///((###%%&&&&&&%%%%&&#/**(%&@@@@&&@&
 @@@@@%((((#######%&&&&&&&%###(((((####((((#&@@@&@@
@@ -40,11 +41,11 @@ class Output:
 &%%%%&&@@&%%(/(#((/(((#((((((((((((###%%##(((&@@@@
 @@&&&&&%%%%%#(((((/////(((##((((/(##&@&%##((//%&&@"""
         )
-        print("You chose death\n")
+        self.show("You chose death\n")
 
     def game_rules(self):
         """Display the rules of the game."""
-        print(
+        self.show(
             UNDERLINE
             + CITALIC
             + """
@@ -63,8 +64,8 @@ The first player to score 100 or more points wins\n"""
 
     def display(self):
         """Display the startup menu to the user."""
-        print(YELLOW + "Hello and welcome to Pig Dice Game" + END)
-        print(
+        self.show(YELLOW + "Hello and welcome to Pig Dice Game" + END)
+        self.show(
             """-------------------------------------------------
 Press 1 if you want to play with a friend
 Press 2 if you want to play vs the computer
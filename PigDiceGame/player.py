@@ -4,6 +4,8 @@
 class Player:
     """Class to represent a player."""
 
+    __slots__ = ("name", "total_score", "tossed_amount")
+
     def __init__(self, name):
         """Initialize player attributes."""
         self.name = name
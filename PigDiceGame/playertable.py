@@ -0,0 +1,92 @@
+"""Columnar storage for many players."""
+
+from array import array
+
+
+class PlayerRow:
+    """View of one row in a PlayerTable with the getters and setters of Player."""
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        """Initialize the view of a row."""
+        self.table = table
+        self.index = index
+
+    def get_name(self):
+        """Getter for player's name."""
+        return self.table.names[self.index]
+
+    def get_total_score(self):
+        """Getter for player's total score."""
+        return self.table.total_scores[self.index]
+
+    def get_tossed_amount(self):
+        """Getter for the number of times the player tossed the dice."""
+        return self.table.tossed_amounts[self.index]
+
+    def set_name(self, name):
+        """Setter to set a new name for the player."""
+        self.table.names[self.index] = name
+
+    def set_total_score(self, value):
+        """Setter for player's total score."""
+        self.table.total_scores[self.index] = value
+
+    def set_tossed_amount(self):
+        """Increment the number of times the player tossed the dice."""
+        self.table.tossed_amounts[self.index] += 1
+
+    def throw_dice(self, dice):
+        """Throw the dice and increment tossed amount."""
+        dice_random_number = dice.get_random_number()
+        self.set_tossed_amount()
+        return dice_random_number
+
+
+class PlayerTable:
+    """
+    Names, total scores and toss counts of many players in columns.
+
+    The scores and toss counts are typed arrays of 32-bit and 64-bit
+    integers, so a player costs a few bytes in them plus the name instead
+    of a whole object. Indexing the table returns a PlayerRow, a small
+    view that behaves like a Player and writes through to the columns.
+    """
+
+    def __init__(self, names=()):
+        """Initialize the table with a row for every name."""
+        self.names = []
+        self.total_scores = array("i")
+        self.tossed_amounts = array("q")
+        for name in names:
+            self.add(name)
+
+    def __len__(self):
+        """Return the number of players."""
+        return len(self.names)
+
+    def __getitem__(self, index):
+        """Return a view of the row."""
+        if not -len(self.names) <= index < len(self.names):
+            raise IndexError("player index out of range")
+        return PlayerRow(self, index % len(self.names))
+
+    def __iter__(self):
+        """Iterate over views of all rows."""
+        for index in range(len(self.names)):
+            yield PlayerRow(self, index)
+
+    def add(self, name, total_score=0, tossed_amount=0):
+        """Add a player and return the view of its row."""
+        self.names.append(name)
+        self.total_scores.append(total_score)
+        self.tossed_amounts.append(tossed_amount)
+        return PlayerRow(self, len(self.names) - 1)
+
+    def nbytes(self):
+        """Return the bytes used by the score and toss columns."""
+        return (
+            self.total_scores.itemsize * len(self.total_scores)
+            + self.tossed_amounts.itemsize * len(self.tossed_amounts)
+        )
@@ -0,0 +1,246 @@
+"""Binary records of completed games."""
+
+import mmap
+import os
+import struct
+
+MAGIC = b"PIGREC1\n"
+
+# seed, starter, winner, score of seat 0 and 1, turns, rolls, decisions
+HEADER = struct.Struct("<QBBHHHHH")
+
+ROLL_BITS = 3
+ROLL_MASK = (1 << ROLL_BITS) - 1
+
+# The fields of HEADER as a NumPy dtype
+HEADER_FIELDS = [
+    ("seed", "<u8"),
+    ("starter", "u1"),
+    ("winner", "u1"),
+    ("scores", "<u2", (2,)),
+    ("turns", "<u2"),
+    ("rolls", "<u2"),
+    ("decisions", "<u2"),
+]
+
+
+def roll_bytes(count):
+    """Return the bytes taken by count packed rolls."""
+    return (count * ROLL_BITS + 7) // 8
+
+
+def decision_bytes(count):
+    """Return the bytes taken by count decision bits."""
+    return (count + 7) // 8
+
+
+def pack_rolls(rolls):
+    """Pack die values at 3 bits each, the first roll in the lowest bits."""
+    packed = 0
+    for index, value in enumerate(rolls):
+        packed |= value << (index * ROLL_BITS)
+    return packed.to_bytes(roll_bytes(len(rolls)), "little")
+
+
+def unpack_rolls(data, count):
+    """Return the die values packed by pack_rolls."""
+    packed = int.from_bytes(data, "little")
+    return [packed >> (index * ROLL_BITS) & ROLL_MASK for index in range(count)]
+
+
+def pack_decisions(decisions):
+    """Pack decisions as a bitmap, a set bit is a toss."""
+    packed = 0
+    for index, decision in enumerate(decisions):
+        if decision:
+            packed |= 1 << index
+    return packed.to_bytes(decision_bytes(len(decisions)), "little")
+
+
+def unpack_decisions(data, count):
+    """Return the decisions packed by pack_decisions, True for toss."""
+    packed = int.from_bytes(data, "little")
+    return [bool(packed >> index & 1) for index in range(count)]
+
+
+class GameRecord:  # pylint: disable=too-many-instance-attributes
+    """A game in a record file, the rolls and decisions are unpacked on demand."""
+
+    __slots__ = (
+        "seed",
+        "starter",
+        "winner",
+        "scores",
+        "turns",
+        "roll_count",
+        "decision_count",
+        "payload",
+    )
+
+    def __init__(self, header, payload):
+        """Initialize the record from the unpacked header and a view of the payload."""
+        (
+            self.seed,
+            self.starter,
+            self.winner,
+            score0,
+            score1,
+            self.turns,
+            self.roll_count,
+            self.decision_count,
+        ) = header
+        self.scores = (score0, score1)
+        self.payload = payload
+
+    def rolls(self):
+        """Return the die values of the game."""
+        end = roll_bytes(self.roll_count)
+        return unpack_rolls(self.payload[:end], self.roll_count)
+
+    def decisions(self):
+        """Return the decisions of the game, True for toss."""
+        start = roll_bytes(self.roll_count)
+        return unpack_decisions(self.payload[start:], self.decision_count)
+
+
+class RecordWriter:
+    """
+    Append completed games to a record file.
+
+    The file starts with MAGIC, then every game is a fixed-width HEADER,
+    the rolls packed at 3 bits each and the decisions as a bitmap, each
+    padded to whole bytes. Writes go through the file buffer, close or
+    flush to be sure they are on disk.
+    """
+
+    def __init__(self, path):
+        """Open the file for appending and write MAGIC to a new file."""
+        self.path = path
+        self.file = open(path, "ab")  # pylint: disable=consider-using-with
+        if self.file.tell() == 0:
+            self.file.write(MAGIC)
+        self.games = 0
+
+    def write(
+        self, rolls, decisions, winner, scores, turns, starter=0, seed=0
+    ):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+        """Append one game."""
+        self.file.write(
+            HEADER.pack(
+                seed,
+                starter,
+                winner,
+                scores[0],
+                scores[1],
+                turns,
+                len(rolls),
+                len(decisions),
+            )
+        )
+        self.file.write(pack_rolls(rolls))
+        self.file.write(pack_decisions(decisions))
+        self.games += 1
+
+    def write_state(self, state, rolls, decisions, starter=0, seed=0):
+        """Append the game that ended in a GameState."""
+        self.write(rolls, decisions, state.winner, state.scores, state.turns, starter, seed)
+
+    def flush(self):
+        """Write the buffered games to the file."""
+        self.file.flush()
+
+    def close(self):
+        """Write the buffered games and close the file."""
+        self.file.close()
+
+    def __enter__(self):
+        """Return the writer for a with block."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the writer at the end of a with block."""
+        self.close()
+
+
+class RecordReader:
+    """
+    Read a record file through mmap.
+
+    Iterating yields GameRecord objects whose payload is a memoryview
+    into the map, so nothing is copied until rolls or decisions are
+    unpacked. to_array returns the headers as a NumPy structured array.
+    """
+
+    def __init__(self, path):
+        """Map the file and check MAGIC."""
+        self.path = path
+        self.map = None
+        self.view = memoryview(b"")
+        if os.path.getsize(path) == 0:
+            return
+        with open(path, "rb") as file:
+            self.map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.map[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{path} is not a game record file")
+        self.view = memoryview(self.map)
+
+    def offsets(self):
+        """Yield the offset and unpacked header of every game."""
+        position = len(MAGIC)
+        end = len(self.view)
+        unpack_from = HEADER.unpack_from
+        while position + HEADER.size <= end:
+            header = unpack_from(self.view, position)
+            yield position, header
+            position += HEADER.size + roll_bytes(header[6]) + decision_bytes(header[7])
+
+    def __iter__(self):
+        """Yield every game as a GameRecord."""
+        for position, header in self.offsets():
+            start = position + HEADER.size
+            end = start + roll_bytes(header[6]) + decision_bytes(header[7])
+            yield GameRecord(header, self.view[start:end])
+
+    def to_array(self):
+        """Return the headers and file offsets as a NumPy structured array."""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        dtype = np.dtype(HEADER_FIELDS + [("offset", "<u8")])
+        rows = [
+            (seed, starter, winner, (score0, score1), turns, rolls, decisions, position)
+            for position, (
+                seed,
+                starter,
+                winner,
+                score0,
+                score1,
+                turns,
+                rolls,
+                decisions,
+            ) in self.offsets()
+        ]
+        return np.array(rows, dtype=dtype)
+
+    def close(self):
+        """
+        Release the view and unmap the file.
+
+        Records that are still alive keep their payload readable, then
+        the map is dropped and unmapped once the last of them is gone.
+        """
+        self.view.release()
+        if self.map is not None:
+            try:
+                self.map.close()
+            except BufferError:
+                pass
+            self.map = None
+
+    def __enter__(self):
+        """Return the reader for a with block."""
+        return self
+
+    def __exit__(self, *exc_info):
+        """Close the reader at the end of a with block."""
+        self.close()
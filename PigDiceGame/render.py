@@ -0,0 +1,56 @@
+"""Renderers that show the game and pace the computer."""
+
+import os
+import platform
+import time
+
+CLEAR = "\033[2J\033[H"
+
+
+class ConsoleRenderer:
+    """Print to the console, clear it with the system command and pause the computer."""
+
+    def __init__(self, delay=1.0):
+        """Initialize the renderer with the pause before every computer decision."""
+        self.delay = delay
+
+    def show(self, text):
+        """Show a line of text."""
+        print(text)
+
+    def clear(self):
+        """Clear screen for both Windows and Mac users."""
+        if platform.system() == "Windows":
+            os.system("cls")
+        else:
+            os.system("clear")
+
+    def pause(self):
+        """Wait before the computer makes a decision."""
+        if self.delay:
+            time.sleep(self.delay)
+
+
+class InstantRenderer(ConsoleRenderer):
+    """Print to the console, clear it with ANSI escapes and do not pause."""
+
+    def __init__(self, delay=0.0):
+        """Initialize the renderer, an animation delay can still be set."""
+        super().__init__(delay)
+
+    def clear(self):
+        """Clear the screen without starting a process."""
+        print(CLEAR, end="", flush=True)
+
+
+class NullRenderer:
+    """Show nothing and never pause, for automated runs."""
+
+    def show(self, text):
+        """Drop the text."""
+
+    def clear(self):
+        """Do nothing."""
+
+    def pause(self):
+        """Do nothing."""
@@ -0,0 +1,80 @@
+"""Compact replay logs of computer games."""
+
+import random
+from PigDiceGame import dice
+from PigDiceGame import engine
+from PigDiceGame import seeds
+from PigDiceGame import simulation
+
+FORMAT = "pig1"
+
+
+class Replay:
+    """
+    A recorded game: the game seed, the difficulties, the starter and the decisions.
+
+    The rolls are not stored, they come again from the die stream of the
+    seed. The decisions are stored as bits, 1 for toss, so replaying
+    needs neither the strategies nor their random streams.
+    """
+
+    def __init__(self, seed, first, second, starter=0, decisions=()):
+        """Initialize the replay, decisions are booleans that are True for toss."""
+        self.seed = seed
+        self.difficulties = (first, second)
+        self.starter = starter
+        self.decisions = [bool(decision) for decision in decisions]
+
+    def encode(self):
+        """Return the replay as one line of text."""
+        bits = 0
+        for index, decision in enumerate(self.decisions):
+            if decision:
+                bits |= 1 << index
+        first, second = self.difficulties
+        return (
+            f"{FORMAT} {self.seed} {first} {second} {self.starter} "
+            f"{len(self.decisions)} {bits:x}"
+        )
+
+    @classmethod
+    def decode(cls, line):
+        """Return the replay stored in a line made by encode."""
+        fields = line.split()
+        if len(fields) != 7 or fields[0] != FORMAT:
+            raise ValueError(f"Not a {FORMAT} replay: {line!r}")
+        _, seed, first, second, starter, count, bits = fields
+        bits = int(bits, 16)
+        decisions = [bool(bits >> index & 1) for index in range(int(count))]
+        return cls(int(seed), first, second, int(starter), decisions)
+
+    def play(self, rolls=None):
+        """
+        Replay the game and return the final GameState.
+
+        When rolls is a list every die value is appended to it.
+        """
+        die = dice.Dice(random.Random(seeds.derive(self.seed, 0)))
+        state = engine.GameState(starter=self.starter)
+        for toss in self.decisions:
+            if toss:
+                value = die.get_random_number()
+                if rolls is not None:
+                    rolls.append(value)
+                state.roll(value)
+            else:
+                state.hold()
+        return state
+
+
+def record(first, second, seed, starter=0):
+    """Play one seeded game between two difficulties and return its replay."""
+    decisions = []
+    simulation.Simulation(first, second).play_game(starter, seed, decisions)
+    return Replay(seed, first, second, starter, decisions)
+
+
+def record_from_run(first, second, master_seed, index, swap_start=True):
+    """Return the replay of game number index of a seeded Simulation run."""
+    sim = simulation.Simulation(first, second, swap_start=swap_start, seed=master_seed)
+    return record(first, second, sim.game_seed(index), sim.starter(index))
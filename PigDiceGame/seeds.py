@@ -0,0 +1,29 @@
+"""Seeds for independent random streams derived from one master seed."""
+
+import hashlib
+
+STREAMS = 3
+
+
+def derive(master_seed, *path):
+    """
+    Return a 64-bit seed for the stream at path below the master seed.
+
+    Like SeedSequence.spawn the children are independent of each other
+    and of the parent, and any child can be derived directly, so game
+    number n of a run is found without replaying the games before it.
+    """
+    key = "/".join(str(part) for part in (master_seed,) + path)
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def spawn(master_seed, count):
+    """Return the seeds of the first count children of the master seed."""
+    return [derive(master_seed, index) for index in range(count)]
+
+
+def reseed(rngs, game_seed):
+    """Seed the die stream and the stream of every computer for one game."""
+    for index, rng in enumerate(rngs):
+        rng.seed(derive(game_seed, index))
@@ -0,0 +1,200 @@
+"""Asyncio server hosting many games against the computer."""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from PigDiceGame import computer, dice, engine, highscore, player, storage
+
+HOST = "127.0.0.1"
+PORT = 8765
+
+HELP = "Commands: roll, hold, difficulty <1|2|3|4>, top, quit"
+
+
+class Session:
+    """One client's game against the computer, the player has seat 0."""
+
+    def __init__(self, name, difficulty="2", die=None):
+        """Set up the player, the computer, the die and the game state."""
+        self.player = player.Player(name)
+        self.computer = computer.Computer(difficulty)
+        self.die = die if die is not None else dice.Dice()
+        self.state = engine.GameState()
+
+    @property
+    def turn_total(self):
+        """Return the points of the turn."""
+        return self.state.turn_total
+
+    @property
+    def winner(self):
+        """Return the name of the winner, or None while the game goes on."""
+        if self.state.winner is None:
+            return None
+        return self.player.get_name() if self.state.winner == 0 else "Computer"
+
+    def roll(self):
+        """Roll for the player and return the die value."""
+        value = self.player.throw_dice(self.die)
+        self.state.roll(value)
+        self.player.set_total_score(self.state.scores[0])
+        return value
+
+    def hold(self):
+        """Add the points of this turn to the player's score."""
+        self.state.hold()
+        self.player.set_total_score(self.state.scores[0])
+
+    def computer_turn(self):
+        """Play the computer's turn, yield every die value and None when it stays."""
+        pc = self.computer
+        state = self.state
+        while state.current == 1 and state.winner is None:
+            choice = pc.decide(state.toss_count, state.turn_total, state.opponent_score())
+            if choice == "stay":
+                state.hold()
+                pc.set_total_score(state.scores[1])
+                yield None
+                return
+            value = pc.throw_dice(self.die)
+            state.roll(value)
+            pc.set_total_score(state.scores[1])
+            yield value
+
+
+class Server:
+    """
+    Line based TCP server, every connection plays its own game.
+
+    All sessions run in one event loop. The computer gives the loop back
+    after every roll, so a long computer turn never holds up the other
+    sessions. The highscore is shared and only touched by a single
+    worker thread, so file writes are serialized and never block the loop.
+    """
+
+    def __init__(self, high=None, host=HOST, port=PORT, delay=0.0, difficulty="2"):
+        """
+        Initialize the server, delay is the pause between computer rolls.
+
+        Without a highscore the server loads highscore_list.txt through a
+        storage.LockedFileStore, so a win adds to the wins in the file,
+        also those of other servers and games running at the same time.
+        """
+        if high is None:
+            high = highscore.Highscore(storage.LockedFileStore(batch_size=1))
+            high.retreive_highscore_file()
+        self.high = high
+        self.host = host
+        self.port = port
+        self.delay = delay
+        self.difficulty = difficulty
+        self.writer = ThreadPoolExecutor(max_workers=1)
+        self.server = None
+
+    async def start(self):
+        """Start listening and return the asyncio server."""
+        self.server = await asyncio.start_server(self.handle, self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self.server
+
+    async def serve_forever(self):
+        """Start the server and serve until it is cancelled."""
+        await self.start()
+        try:
+            async with self.server:
+                await self.server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self):
+        """Stop listening and write what the highscore still buffers."""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        await self.highscore_call(self.high.close)
+        self.writer.shutdown()
+
+    async def highscore_call(self, function, *args):
+        """Run a highscore method in the writer thread."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.writer, function, *args)
+
+    async def handle(self, reader, writer):
+        """Play one game with a connected client."""
+        async def send(text):
+            writer.write((text + "\n").encode("utf-8"))
+            await writer.drain()
+
+        try:
+            await send("Welcome to Pig! What is your name?")
+            name = (await reader.readline()).decode("utf-8").strip().capitalize()
+            if not name:
+                return
+            session = Session(name, self.difficulty)
+            await send(HELP)
+            await self.play(session, reader, send)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def play(self, session, reader, send):
+        """Read commands until the game is over or the client quits."""
+        while session.winner is None:
+            await send(
+                f"You have {session.player.get_total_score()} point(s)"
+                f" and {session.turn_total} this turn"
+            )
+            line = await reader.readline()
+            if not line:
+                return
+            command, _, argument = line.decode("utf-8").strip().lower().partition(" ")
+            if command == "roll":
+                value = session.roll()
+                await send(f"You rolled a {value}")
+                if value == 1:
+                    await self.computer_turn(session, send)
+            elif command == "hold":
+                session.hold()
+                await send(f"You stayed and now have {session.player.get_total_score()} point(s)")
+                await self.computer_turn(session, send)
+            elif command == "difficulty" and argument in ("1", "2", "3", "4"):
+                session.computer.set_difficulty(argument)
+                await send(f"Difficulty is now {argument}")
+            elif command == "top":
+                for position, (name, wins) in enumerate(
+                    await self.highscore_call(self.high.top, 10), 1
+                ):
+                    await send(f"{position}. {name} : {wins}")
+            elif command == "quit":
+                await send("Bye")
+                return
+            else:
+                await send("That's not an option. " + HELP)
+        await send(f"{session.winner} won!")
+        await self.highscore_call(self.high.add_winner, session.winner)
+
+    async def computer_turn(self, session, send):
+        """Play the computer's turn and give the loop back between rolls."""
+        if session.winner is not None:
+            return
+        for value in session.computer_turn():
+            if value is None:
+                await send(
+                    f"Computer stayed and now have {session.computer.get_total_score()} point(s)"
+                )
+            else:
+                await send(f"Computer got a {value}")
+            await asyncio.sleep(self.delay)
+
+
+def main():
+    """Serve games on localhost until interrupted."""
+    server = Server()
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+"""Headless simulation of computer versus computer games."""
+
+import random
+from PigDiceGame import computer
+from PigDiceGame import dice
+from PigDiceGame import engine
+from PigDiceGame import seeds
+
+WINNING_SCORE = engine.WINNING_SCORE
+
+
+class SimulationResult:
+    """Aggregated outcome of a batch of simulated games."""
+
+    def __init__(self, first, second):
+        """Initialize an empty result for two difficulties."""
+        self.difficulties = (first, second)
+        self.games = 0
+        self.wins = [0, 0]
+        self.turns = 0
+        self.tosses = 0
+
+    def add_game(self, winner, turns, tosses):
+        """Record the outcome of one game."""
+        self.games += 1
+        self.wins[winner] += 1
+        self.turns += turns
+        self.tosses += tosses
+
+    def merge(self, other):
+        """Add the counts of another result for the same pairing."""
+        self.games += other.games
+        self.wins[0] += other.wins[0]
+        self.wins[1] += other.wins[1]
+        self.turns += other.turns
+        self.tosses += other.tosses
+        return self
+
+    def win_rate(self, seat=0):
+        """Return the share of games won by the given seat."""
+        if self.games == 0:
+            return 0.0
+        return self.wins[seat] / self.games
+
+    def average_turns(self):
+        """Return the average number of turns per game."""
+        if self.games == 0:
+            return 0.0
+        return self.turns / self.games
+
+    def as_dict(self):
+        """Return the result as a plain dictionary."""
+        return {
+            "first": self.difficulties[0],
+            "second": self.difficulties[1],
+            "games": self.games,
+            "wins": list(self.wins),
+            "win_rate": self.win_rate(0),
+            "average_turns": self.average_turns(),
+            "tosses": self.tosses,
+        }
+
+
+class Simulation:
+    """Play computer versus computer games without any console I/O."""
+
+    def __init__(self, first, second, die=None, swap_start=True, seed=None):
+        """
+        Set up two computers with the given difficulties.
+
+        When swap_start is set the starting computer alternates between
+        games so that neither side gets the first-move advantage. The die
+        and each computer draw from their own random stream. With a master
+        seed game n of a run is seeded with seeds.derive(seed, n), so every
+        game can be reproduced on its own. A die passed in is not reseeded,
+        only the computers are, so its rolls are only reproducible if the
+        caller seeds it. An unknown difficulty raises KeyError.
+        """
+        self.rngs = tuple(random.Random() for _ in range(seeds.STREAMS))
+        self.computers = (
+            computer.Computer(first, self.rngs[1]),
+            computer.Computer(second, self.rngs[2]),
+        )
+        if any(pc.strategy is None for pc in self.computers):
+            raise KeyError(f"Unknown difficulty in {(first, second)}")
+        self.die = die if die is not None else dice.Dice(self.rngs[0])
+        self.swap_start = swap_start
+        self.seed = seed
+
+    def play_game(self, starter=0, seed=None, log=None, rolls=None):
+        """
+        Play one game and return the winning seat, turns and tosses.
+
+        A seed reseeds the random streams of the computers, and of the die
+        unless one was passed in, before the game. When log is a
+        list every decision is appended to it, True for toss, and when
+        rolls is a list every die value is appended to it.
+        """
+        state = self.play_state(starter, seed, log, rolls)
+        return state.winner, state.turns, state.tosses
+
+    def play_state(self, starter=0, seed=None, log=None, rolls=None):
+        """Play one game like play_game and return the final GameState."""
+        if seed is not None:
+            seeds.reseed(self.rngs, seed)
+        state = engine.GameState(starter=starter)
+        scores = state.scores
+        roll_die = self.die.get_random_number
+        while state.winner is None:
+            seat = state.current
+            pc = self.computers[seat]
+            pc.set_total_score(scores[seat])
+            choice = pc.decide(state.toss_count, state.turn_total, scores[1 - seat])
+            if log is not None:
+                log.append(choice != "stay")
+            if choice == "stay":
+                state.hold()
+            else:
+                value = roll_die()
+                if rolls is not None:
+                    rolls.append(value)
+                state.roll(value)
+        return state
+
+    def run(self, games, writer=None, stats=None, start=0):
+        """
+        Play a number of games and return the aggregated result.
+
+        With a records.RecordWriter every game is also written to it, and
+        with a stats.Statistics every game is added to the statistics of
+        "Computer 1 (<difficulty>)" and "Computer 2 (<difficulty>)". The
+        games are numbered from start, so a run can be split into parts
+        that play the same games as the whole run.
+        """
+        result = SimulationResult(*(pc.get_difficulty() for pc in self.computers))
+        names = [
+            f"Computer {seat + 1} ({pc.get_difficulty()})" for seat, pc in enumerate(self.computers)
+        ]
+        logged = writer is not None or stats is not None
+        for index in range(start, start + games):
+            starter, seed = self.starter(index), self.game_seed(index)
+            log, rolls = ([], []) if logged else (None, None)
+            state = self.play_state(starter, seed, log, rolls)
+            if writer is not None:
+                writer.write_state(state, rolls, log, starter, seed or 0)
+            if stats is not None:
+                stats.record_log(names, starter, log, rolls)
+            result.add_game(state.winner, state.turns, state.tosses)
+        return result
+
+    def starter(self, index):
+        """Return the seat that starts game number index of a run."""
+        return index % 2 if self.swap_start else 0
+
+    def game_seed(self, index):
+        """Return the seed of game number index of a run, None without a master seed."""
+        if self.seed is None:
+            return None
+        return seeds.derive(self.seed, index)
@@ -0,0 +1,294 @@
+"""Streaming per-player statistics."""
+
+import math
+import statistics
+from PigDiceGame import engine
+
+RELATIVE_ACCURACY = 0.01
+MAX_BUCKETS = 2048
+QUANTILES = (0.5, 0.9, 0.99)
+CONFIDENCE = 0.95
+
+
+def wilson_interval(successes, trials, confidence=CONFIDENCE):
+    """Return the Wilson score interval of a share, (0.0, 1.0) without trials."""
+    if trials == 0:
+        return 0.0, 1.0
+    z = statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+    share = successes / trials
+    denominator = 1 + z * z / trials
+    center = (share + z * z / (2 * trials)) / denominator
+    spread = z * math.sqrt(share * (1 - share) / trials + z * z / (4 * trials * trials))
+    return max(0.0, center - spread / denominator), min(1.0, center + spread / denominator)
+
+
+class RunningStats:
+    """Count, mean, variance, min and max in constant memory with Welford's method."""
+
+    __slots__ = ("count", "mean", "m2", "minimum", "maximum")
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.minimum = None
+        self.maximum = None
+
+    def add(self, value):
+        """Add one value."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.minimum is None or value < self.minimum:
+            self.minimum = value
+        if self.maximum is None or value > self.maximum:
+            self.maximum = value
+
+    def merge(self, other):
+        """Add the values of other statistics, as if they were added one by one."""
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.minimum, self.maximum = other.minimum, other.maximum
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    def variance(self):
+        """Return the sample variance, 0.0 for fewer than two values."""
+        if self.count < 2:
+            return 0.0
+        return self.m2 / (self.count - 1)
+
+    def stdev(self):
+        """Return the sample standard deviation."""
+        return math.sqrt(self.variance())
+
+
+class QuantileSketch:
+    """
+    Quantiles with a bounded relative error, like DDSketch.
+
+    Positive values are counted in buckets that grow geometrically, so a
+    quantile is off by at most relative_accuracy of its value. Zeros and
+    negative values share one bucket that returns 0. When there are more
+    than max_buckets buckets the lowest ones are folded together, which
+    only costs accuracy in the low quantiles. Sketches with the same
+    accuracy merge by adding their buckets.
+    """
+
+    __slots__ = ("relative_accuracy", "gamma", "log_gamma", "max_buckets", "buckets", "zeros")
+
+    def __init__(self, relative_accuracy=RELATIVE_ACCURACY, max_buckets=MAX_BUCKETS):
+        """Initialize an empty sketch."""
+        self.relative_accuracy = relative_accuracy
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.log_gamma = math.log(self.gamma)
+        self.max_buckets = max_buckets
+        self.buckets = {}
+        self.zeros = 0
+
+    def __len__(self):
+        """Return the number of values in the sketch."""
+        return self.zeros + sum(self.buckets.values())
+
+    def add(self, value):
+        """Add one value."""
+        if value <= 0:
+            self.zeros += 1
+            return
+        key = math.ceil(math.log(value) / self.log_gamma)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+        if len(self.buckets) > self.max_buckets:
+            self.collapse()
+
+    def collapse(self):
+        """Fold the lowest buckets together until max_buckets are left."""
+        keys = sorted(self.buckets)
+        excess = len(keys) - self.max_buckets
+        lowest = keys[excess]
+        for key in keys[:excess]:
+            self.buckets[lowest] += self.buckets.pop(key)
+
+    def merge(self, other):
+        """Add the counts of another sketch with the same accuracy."""
+        if other.gamma != self.gamma:
+            raise ValueError("Only sketches with the same accuracy can be merged")
+        self.zeros += other.zeros
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        if len(self.buckets) > self.max_buckets:
+            self.collapse()
+        return self
+
+    def quantile(self, quantile):
+        """Return the value at the quantile between 0 and 1, None for an empty sketch."""
+        total = len(self)
+        if total == 0:
+            return None
+        rank = quantile * (total - 1)
+        seen = self.zeros
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                return 2 * self.gamma**key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+
+class Distribution:
+    """Running statistics and a quantile sketch of one measure."""
+
+    __slots__ = ("running", "sketch")
+
+    def __init__(self):
+        """Initialize an empty distribution."""
+        self.running = RunningStats()
+        self.sketch = QuantileSketch()
+
+    def add(self, value):
+        """Add one value."""
+        self.running.add(value)
+        self.sketch.add(value)
+
+    def merge(self, other):
+        """Add the values of another distribution."""
+        self.running.merge(other.running)
+        self.sketch.merge(other.sketch)
+        return self
+
+    def as_dict(self):
+        """Return the summary as a plain dictionary."""
+        summary = {
+            "count": self.running.count,
+            "mean": self.running.mean,
+            "stdev": self.running.stdev(),
+            "min": self.running.minimum,
+            "max": self.running.maximum,
+        }
+        for quantile in QUANTILES:
+            summary[f"p{round(quantile * 100)}"] = self.sketch.quantile(quantile)
+        return summary
+
+
+class PlayerStats:
+    """Streaming statistics of one player."""
+
+    __slots__ = (
+        "games",
+        "wins",
+        "busts",
+        "turns_this_game",
+        "turns_per_game",
+        "rolls_per_turn",
+        "points_per_turn",
+    )
+
+    def __init__(self):
+        """Initialize statistics for a player without games."""
+        self.games = 0
+        self.wins = 0
+        self.busts = 0
+        self.turns_this_game = 0
+        self.turns_per_game = Distribution()
+        self.rolls_per_turn = Distribution()
+        self.points_per_turn = Distribution()
+
+    def record_turn(self, rolls, points, bust=False):
+        """Add a finished turn, points is what the turn banked."""
+        self.turns_this_game += 1
+        self.rolls_per_turn.add(rolls)
+        self.points_per_turn.add(points)
+        if bust:
+            self.busts += 1
+
+    def record_game(self, won):
+        """Add a finished game with the turns recorded since the last one."""
+        self.games += 1
+        if won:
+            self.wins += 1
+        self.turns_per_game.add(self.turns_this_game)
+        self.turns_this_game = 0
+
+    def merge(self, other):
+        """Add the statistics of the same player from another worker."""
+        self.games += other.games
+        self.wins += other.wins
+        self.busts += other.busts
+        self.turns_per_game.merge(other.turns_per_game)
+        self.rolls_per_turn.merge(other.rolls_per_turn)
+        self.points_per_turn.merge(other.points_per_turn)
+        return self
+
+    def as_dict(self):
+        """Return the statistics as a plain dictionary."""
+        return {
+            "games": self.games,
+            "wins": self.wins,
+            "busts": self.busts,
+            "turns_per_game": self.turns_per_game.as_dict(),
+            "rolls_per_turn": self.rolls_per_turn.as_dict(),
+            "points_per_turn": self.points_per_turn.as_dict(),
+        }
+
+
+class Statistics:
+    """Statistics of every player by name, every event costs O(1)."""
+
+    def __init__(self):
+        """Initialize without players."""
+        self.players = {}
+
+    def player(self, name):
+        """Return the statistics of a player, created on first use."""
+        stats = self.players.get(name)
+        if stats is None:
+            stats = self.players[name] = PlayerStats()
+        return stats
+
+    def record_turn(self, name, rolls, points, bust=False):
+        """Add a finished turn of a player."""
+        self.player(name).record_turn(rolls, points, bust)
+
+    def record_game(self, name, won):
+        """Add a finished game of a player."""
+        self.player(name).record_game(won)
+
+    def record_log(self, names, starter, decisions, rolls):
+        """Add a whole game from its decisions and rolls, names are given by seat."""
+        state = engine.GameState(starter=starter)
+        rolls = iter(rolls)
+        for toss in decisions:
+            seat, tosses, turn_total = state.current, state.toss_count, state.turn_total
+            if not toss:
+                self.record_turn(names[seat], tosses, turn_total)
+                state.hold()
+                continue
+            value = next(rolls)
+            state.roll(value)
+            if value == 1:
+                self.record_turn(names[seat], tosses + 1, 0, bust=True)
+            elif state.winner is not None:
+                self.record_turn(names[seat], tosses + 1, turn_total + value)
+        for seat, name in enumerate(names):
+            self.record_game(name, state.winner == seat)
+
+    def merge(self, other):
+        """Add the statistics from another worker."""
+        for name, stats in other.players.items():
+            self.player(name).merge(stats)
+        return self
+
+    def as_dict(self):
+        """Return the statistics of every player as a plain dictionary."""
+        return {name: stats.as_dict() for name, stats in self.players.items()}
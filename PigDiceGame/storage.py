@@ -0,0 +1,382 @@
+"""Storage backends for the highscore list."""
+
+import glob
+import os
+import threading
+from PigDiceGame.highscore import parse_highscores, read_highscores
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:  # Everywhere else
+    msvcrt = None
+
+SNAPSHOT_HEADER = "#generation "
+
+
+def normalize_name(name):
+    """Return a name as the snapshot and the log keep it, stripped and on one line."""
+    return " ".join(name.splitlines()).strip()
+
+
+class AppendLogStore:
+    """
+    Highscore storage that appends win events to a log.
+
+    Wins are buffered and written in batches with one fsync per batch.
+    Now and then the counts are written to a snapshot by a background
+    thread and the logs it covers are removed. The files are
+    <path>.snapshot and <path>.log.<generation>; a snapshot of generation
+    G holds every win logged in generations below G, so loading is the
+    snapshot plus a replay of the logs from G on.
+    """
+
+    indexed = False
+
+    def __init__(self, path="highscore_list.txt", batch_size=64, compact_every=10_000):
+        """Initialize the store, nothing is read before load."""
+        self.path = path
+        self.batch_size = batch_size
+        self.compact_every = compact_every
+        self.counts = {}
+        self.pending = []
+        self.generation = 0
+        self.since_compact = 0
+        self.log = None
+        self.lock = threading.Lock()
+        self.compactor = None
+
+    def snapshot_path(self):
+        """Return the path of the snapshot file."""
+        return self.path + ".snapshot"
+
+    def log_path(self, generation):
+        """Return the path of the log for a generation."""
+        return f"{self.path}.log.{generation}"
+
+    def log_generations(self):
+        """Return the generations of the logs on disk, oldest first."""
+        generations = []
+        for name in glob.glob(glob.escape(self.path) + ".log.*"):
+            suffix = name.rsplit(".", 1)[1]
+            if suffix.isdigit():
+                generations.append(int(suffix))
+        return sorted(generations)
+
+    def read_snapshot(self):
+        """Return the counts and generation stored in the snapshot."""
+        counts = {}
+        try:
+            with open(self.snapshot_path(), "r", encoding="utf-8") as file:
+                header = file.readline()
+                if not header.startswith(SNAPSHOT_HEADER):
+                    return counts, 0
+                generation = int(header.split()[-1])
+                counts = parse_highscores(file.read())
+        except FileNotFoundError:
+            return counts, 0
+        return counts, generation
+
+    def load(self):
+        """Load the snapshot, replay the newer logs and return the counts."""
+        self.close()
+        counts, generation = self.read_snapshot()
+        generations = self.log_generations()
+        for log_generation in generations:
+            if log_generation < generation:
+                continue
+            with open(self.log_path(log_generation), "r", encoding="utf-8") as file:
+                for line in file:
+                    # A line without newline was torn by a crash mid write.
+                    name = normalize_name(line)
+                    if line.endswith("\n") and name:
+                        counts[name] = counts.get(name, 0) + 1
+        with self.lock:
+            self.counts = counts
+            # Continue in a new log so a torn line is never appended to.
+            self.generation = max(generations + [generation - 1]) + 1
+        return dict(counts)
+
+    def record(self, name):
+        """Record one win, writing the batch when it is full."""
+        name = normalize_name(name)
+        with self.lock:
+            self.pending.append(name)
+            self.counts[name] = self.counts.get(name, 0) + 1
+            self.since_compact += 1
+            if len(self.pending) >= self.batch_size:
+                self._write_pending()
+            compact = self.since_compact >= self.compact_every
+        if compact:
+            self.compact()
+
+    def flush(self):
+        """Write the buffered wins to the log."""
+        with self.lock:
+            self._write_pending()
+
+    def _write_pending(self):
+        """Append the buffered wins and fsync once, the lock must be held."""
+        if not self.pending:
+            return
+        if self.log is None:
+            self.log = open(  # pylint: disable=consider-using-with
+                self.log_path(self.generation), "a", encoding="utf-8"
+            )
+        self.log.write("".join(name + "\n" for name in self.pending))
+        self.log.flush()
+        os.fsync(self.log.fileno())
+        self.pending = []
+
+    def compact(self, wait=False):
+        """Write a snapshot of the counts in the background and drop old logs."""
+        with self.lock:
+            if self.compactor is not None and self.compactor.is_alive():
+                return
+            self._write_pending()
+            if self.log is not None:
+                self.log.close()
+                self.log = None
+            counts = dict(self.counts)
+            self.generation += 1
+            self.since_compact = 0
+            self.compactor = threading.Thread(
+                target=self.write_snapshot, args=(counts, self.generation), daemon=True
+            )
+            self.compactor.start()
+        if wait:
+            self.compactor.join()
+
+    def write_snapshot(self, counts, generation):
+        """Atomically replace the snapshot and remove the logs it covers."""
+        temporary = self.snapshot_path() + ".tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            file.write(f"{SNAPSHOT_HEADER}{generation}\n")
+            file.write("".join(f"{name} : {score}\n" for name, score in counts.items()))
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, self.snapshot_path())
+        for log_generation in self.log_generations():
+            if log_generation < generation:
+                os.remove(self.log_path(log_generation))
+
+    def close(self):
+        """Write the buffered wins and wait for a running compaction."""
+        with self.lock:
+            self._write_pending()
+            if self.log is not None:
+                self.log.close()
+                self.log = None
+        if self.compactor is not None:
+            self.compactor.join()
+
+
+class SQLiteStore:
+    """
+    Highscore storage in an SQLite database in WAL mode.
+
+    The table has an index on wins, so the leaderboard queries read only
+    the rows they return. Wins are buffered and written in one
+    transaction per batch. Highscore does not keep its own copy of an
+    indexed store, it asks the store.
+    """
+
+    indexed = True
+
+    def __init__(self, path="highscore.db", batch_size=256):
+        """Open the database and create the table and index."""
+        self.path = path
+        self.batch_size = batch_size
+        self.pending = {}
+        self.pending_wins = 0
+        import sqlite3  # pylint: disable=import-outside-toplevel
+
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS highscores "
+                "(name TEXT PRIMARY KEY, wins INTEGER NOT NULL) WITHOUT ROWID"
+            )
+            self.connection.execute(
+                "CREATE INDEX IF NOT EXISTS highscores_wins ON highscores (wins DESC, name)"
+            )
+
+    def record(self, name):
+        """Record one win, writing the batch when it is full."""
+        self.pending[name] = self.pending.get(name, 0) + 1
+        self.pending_wins += 1
+        if self.pending_wins >= self.batch_size:
+            self.flush()
+
+    def record_many(self, names):
+        """Record many wins in one transaction."""
+        for name in names:
+            self.pending[name] = self.pending.get(name, 0) + 1
+            self.pending_wins += 1
+        self.flush()
+
+    def flush(self):
+        """Write the buffered wins in one transaction."""
+        if not self.pending:
+            return
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO highscores (name, wins) VALUES (?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET wins = wins + excluded.wins",
+                self.pending.items(),
+            )
+        self.pending = {}
+        self.pending_wins = 0
+
+    def load(self):
+        """Return every name and its wins."""
+        self.flush()
+        return dict(self.connection.execute("SELECT name, wins FROM highscores"))
+
+    def top(self, limit=10):
+        """Return the best players as (name, wins), most wins first."""
+        return self.page(0, limit)
+
+    def page(self, number, size=10):
+        """Return one page of the leaderboard, the first page is number 0."""
+        self.flush()
+        return self.connection.execute(
+            "SELECT name, wins FROM highscores ORDER BY wins DESC, name LIMIT ? OFFSET ?",
+            (size, number * size),
+        ).fetchall()
+
+    def wins(self, name):
+        """Return the wins of a player, 0 if the player never won."""
+        self.flush()
+        row = self.connection.execute(
+            "SELECT wins FROM highscores WHERE name = ?", (name,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def rank(self, name):
+        """Return the 1-based rank of a player, or None if the player never won."""
+        wins = self.wins(name)
+        if wins == 0:
+            return None
+        (better,) = self.connection.execute(
+            "SELECT COUNT(*) FROM highscores WHERE wins > ?", (wins,)
+        ).fetchone()
+        return better + 1
+
+    def count(self):
+        """Return the number of players on the leaderboard."""
+        self.flush()
+        return self.connection.execute("SELECT COUNT(*) FROM highscores").fetchone()[0]
+
+    def close(self):
+        """Write the buffered wins and close the database."""
+        self.flush()
+        self.connection.close()
+
+
+class LockedFileStore:
+    """
+    Highscore storage in highscore_list.txt that several processes can share.
+
+    Wins are counted in memory and merged into the file in batches. A
+    merge takes an exclusive lock on <path>.lock, reads the file, adds
+    the wins of this process and atomically replaces the file, so wins
+    from other processes are never overwritten. The lock is held only
+    for the merge, so with large batches the workers rarely wait on
+    each other. The lock is fcntl.flock, or msvcrt.locking on Windows.
+    """
+
+    indexed = False
+
+    def __init__(self, path="highscore_list.txt", batch_size=64):
+        """Initialize the store, nothing is read before load."""
+        self.path = path
+        self.batch_size = batch_size
+        self.counts = {}
+        self.pending = {}
+        self.pending_wins = 0
+
+    def lock_path(self):
+        """Return the path of the lock file."""
+        return self.path + ".lock"
+
+    def read(self):
+        """Return the counts in the file, skipping lines that are not name : score."""
+        return read_highscores(self.path)
+
+    def load(self):
+        """Read the counts of all processes and return them with the wins not merged yet."""
+        with self.locked():
+            counts = self.read()
+        for name, wins in self.pending.items():
+            counts[name] = counts.get(name, 0) + wins
+        self.counts = counts
+        return dict(counts)
+
+    def record(self, name):
+        """Record one win, merging the batch when it is full."""
+        self.counts[name] = self.counts.get(name, 0) + 1
+        self.pending[name] = self.pending.get(name, 0) + 1
+        self.pending_wins += 1
+        if self.pending_wins >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Merge the wins of this process into the file under the lock."""
+        if not self.pending:
+            return
+        with self.locked():
+            counts = self.read()
+            for name, wins in self.pending.items():
+                counts[name] = counts.get(name, 0) + wins
+            temporary = f"{self.path}.{os.getpid()}.tmp"
+            with open(temporary, "w", encoding="utf-8") as file:
+                file.write("".join(f"{name} : {score}\n" for name, score in counts.items()))
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temporary, self.path)
+        self.counts = counts
+        self.pending = {}
+        self.pending_wins = 0
+
+    def locked(self):
+        """Return a context manager that holds the exclusive lock."""
+        return _FileLock(self.lock_path())
+
+    def close(self):
+        """Merge the wins that are still buffered."""
+        self.flush()
+
+
+class _FileLock:
+    """Exclusive lock on a lock file for a with block."""
+
+    def __init__(self, path):
+        """Remember the path of the lock file."""
+        self.path = path
+        self.file = None
+
+    def __enter__(self):
+        """Open the lock file and wait for the lock."""
+        self.file = open(self.path, "a+b")  # pylint: disable=consider-using-with
+        if fcntl is not None:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_EX)
+        else:
+            self.file.seek(0)
+            msvcrt.locking(self.file.fileno(), msvcrt.LK_LOCK, 1)
+        return self
+
+    def __exit__(self, *exc_info):
+        """Release the lock and close the lock file."""
+        if fcntl is not None:
+            fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+        else:
+            self.file.seek(0)
+            msvcrt.locking(self.file.fileno(), msvcrt.LK_UNLCK, 1)
+        self.file.close()
+        self.file = None
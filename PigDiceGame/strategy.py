@@ -0,0 +1,202 @@
+"""Computer strategies, their compiled hold tables and the strategy registry."""
+
+import abc
+import functools
+import importlib
+import random
+
+TOSS = "toss"
+HOLD = "stay"
+
+STRATEGIES = {}
+
+
+class HoldTable:
+    """
+    Hold probabilities indexed by toss count or by turn total.
+
+    Indexes past the end of the table use the last probability. A
+    decision is one uniform draw compared against the table entry.
+    """
+
+    def __init__(self, probabilities, by_turn_total=False):
+        """Compile the probabilities into a tuple."""
+        self.probabilities = tuple(float(prob) for prob in probabilities)
+        self.last = len(self.probabilities) - 1
+        self.by_turn_total = by_turn_total
+
+    def hold_probability(self, toss_count, turn_total):
+        """Return the probability to hold."""
+        index = turn_total if self.by_turn_total else toss_count
+        return self.probabilities[index if index < self.last else self.last]
+
+    def decide(self, toss_count, turn_total, rng=random):
+        """Return TOSS or HOLD."""
+        index = turn_total if self.by_turn_total else toss_count
+        if rng.random() < self.probabilities[index if index < self.last else self.last]:
+            return HOLD
+        return TOSS
+
+    def threshold(self):
+        """Return the index from which the table always holds, or None if it draws."""
+        zeros = self.probabilities.count(0.0)
+        ones = (1.0,) * (len(self.probabilities) - zeros)
+        if ones and self.probabilities == (0.0,) * zeros + ones:
+            return zeros
+        return None
+
+
+HOLD_TABLES = {
+    "1": HoldTable((0.0, 1.0)),
+    "2": HoldTable((0.0, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 1.0)),
+    "Pelle": HoldTable((0.0,) * 25 + (1.0,), by_turn_total=True),
+    "3": HoldTable((0.5,)),
+}
+
+
+class Strategy(abc.ABC):
+    """
+    Interface for computer strategies.
+
+    decide gets the own banked score, the opponent score, the points
+    collected this turn and the number of tosses this turn, and returns
+    TOSS or HOLD. decide_batch takes the same values as NumPy arrays plus
+    a numpy.random.Generator and returns a boolean array that is True
+    where the strategy holds. The default decide_batch calls decide once
+    per game, strategies override it to run at full speed in simulators.
+
+    hold_probability returns the probability to hold instead of drawing,
+    for exact calculations. The default calls decide, which is only right
+    for strategies that do not draw. hold_probabilities is the same for
+    NumPy arrays. toss_limit is the toss count from which the decisions
+    no longer depend on it, None if that is not known.
+    """
+
+    toss_limit = None
+
+    def __init__(self, rng=None):
+        """Keep the random source used for decisions."""
+        self.rng = rng if rng is not None else random
+
+    @abc.abstractmethod
+    def decide(self, own_score: int, opponent_score: int, turn_total: int, toss_count: int) -> str:
+        """Return TOSS or HOLD."""
+
+    def decide_batch(
+        self, own_score, opponent_score, turn_total, toss_count, rng
+    ):  # pylint: disable=unused-argument
+        """Return a boolean array that is True where the strategy holds."""
+        # All False and shaped like the input, without importing NumPy here.
+        hold = toss_count < 0
+        for index in range(hold.size):
+            decision = self.decide(
+                int(own_score[index]),
+                int(opponent_score[index]),
+                int(turn_total[index]),
+                int(toss_count[index]),
+            )
+            hold[index] = decision == HOLD
+        return hold
+
+    def hold_probability(self, own_score, opponent_score, turn_total, toss_count):
+        """Return the probability to hold."""
+        decision = self.decide(own_score, opponent_score, turn_total, toss_count)
+        return 1.0 if decision == HOLD else 0.0
+
+    def hold_probabilities(self, own_score, opponent_score, turn_total, toss_count):
+        """Return the probabilities to hold for broadcastable NumPy arrays."""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        return np.vectorize(self.hold_probability, otypes=[float])(
+            own_score, opponent_score, turn_total, toss_count
+        )
+
+
+class TableStrategy(Strategy):
+    """Strategy that decides from a compiled HoldTable."""
+
+    def __init__(self, table, rng=None):
+        """Resolve the table lookup once."""
+        super().__init__(rng)
+        self.table = table
+        self.threshold = table.threshold()
+        self.probabilities = None
+        self.toss_limit = 0 if table.by_turn_total else table.last
+
+    def decide(self, own_score, opponent_score, turn_total, toss_count):
+        """Return TOSS or HOLD from the table."""
+        return self.table.decide(toss_count, turn_total, self.rng)
+
+    def decide_batch(self, own_score, opponent_score, turn_total, toss_count, rng):
+        """Compare with the threshold, or draw once per game against the table."""
+        index = turn_total if self.table.by_turn_total else toss_count
+        if self.threshold is not None:
+            return index >= self.threshold
+        if self.probabilities is None:
+            import numpy as np  # pylint: disable=import-outside-toplevel
+
+            self.probabilities = np.array(self.table.probabilities)
+        return rng.random(index.size) < self.probabilities[index.clip(max=self.table.last)]
+
+    def hold_probability(self, own_score, opponent_score, turn_total, toss_count):
+        """Return the probability to hold from the table."""
+        return self.table.hold_probability(toss_count, turn_total)
+
+    def hold_probabilities(self, own_score, opponent_score, turn_total, toss_count):
+        """Look up the probabilities to hold, shaped like the broadcast input."""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        if self.probabilities is None:
+            self.probabilities = np.array(self.table.probabilities)
+        index = turn_total if self.table.by_turn_total else toss_count
+        shape = np.broadcast_shapes(
+            np.shape(own_score),
+            np.shape(opponent_score),
+            np.shape(turn_total),
+            np.shape(toss_count),
+        )
+        return np.broadcast_to(self.probabilities[np.minimum(index, self.table.last)], shape)
+
+
+def register(name, factory):
+    """
+    Register a strategy under a difficulty name.
+
+    The factory is called with a random source, or None for the default,
+    and returns a Strategy. A Strategy subclass can be registered as is.
+    """
+    STRATEGIES[name] = factory
+
+
+def create(name, rng=None):
+    """Return a new strategy for the difficulty name, or None if it is unknown."""
+    factory = STRATEGIES.get(name)
+    if factory is None:
+        return None
+    return factory(rng)
+
+
+def names():
+    """Return the registered difficulty names."""
+    return list(STRATEGIES)
+
+
+def lazy(module, attribute):
+    """
+    Return a factory for a strategy class that is imported on first use.
+
+    The module is only named, so it may import this module itself and
+    its dependencies are not loaded until the strategy is created.
+    """
+
+    def factory(rng=None):
+        return getattr(importlib.import_module(module), attribute)(rng)
+
+    return factory
+
+
+register("1", functools.partial(TableStrategy, HOLD_TABLES["1"]))
+register("2", functools.partial(TableStrategy, HOLD_TABLES["2"]))
+register("Pelle", functools.partial(TableStrategy, HOLD_TABLES["Pelle"]))
+register("3", functools.partial(TableStrategy, HOLD_TABLES["3"]))
+register("4", lazy("PigDiceGame.optimal", "OptimalStrategy"))
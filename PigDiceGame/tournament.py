@@ -0,0 +1,82 @@
+"""Round robin tournament between computer difficulties."""
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from PigDiceGame import strategy
+from PigDiceGame import vectorized
+from PigDiceGame.simulation import SimulationResult
+
+CHUNK_SIZE = 100_000
+
+
+def play_chunk(first, second, games, seed):
+    """Play one chunk of games between two difficulties in a worker."""
+    return vectorized.VectorSimulation(first, second, seed=seed).run(games)
+
+
+class Tournament:
+    """
+    Play every pair of difficulties against each other.
+
+    The games of every pairing are cut into chunks of a fixed size and
+    every chunk gets its own seed spawned from the master seed, so the
+    result only depends on the seed and not on the number of workers.
+    Custom strategies registered with strategy.register take part as
+    well; with a spawning start method they have to be registered when a
+    module the workers import is loaded.
+    """
+
+    def __init__(
+        self, games=100_000, seed=None, workers=None, difficulties=None, chunk_size=CHUNK_SIZE
+    ):
+        """Initialize the tournament settings."""
+        self.games = games
+        self.seed = seed
+        self.workers = workers if workers is not None else os.cpu_count()
+        self.difficulties = tuple(difficulties or strategy.names())
+        self.chunk_size = chunk_size
+        self.results = {}
+
+    def pairings(self):
+        """Return every pair of difficulties once."""
+        return list(itertools.combinations(self.difficulties, 2))
+
+    def tasks(self):
+        """Split every pairing into chunks with their own seeds."""
+        chunks = []
+        for first, second in self.pairings():
+            for start in range(0, self.games, self.chunk_size):
+                chunks.append((first, second, min(self.chunk_size, self.games - start)))
+        seeds = np.random.SeedSequence(self.seed).spawn(len(chunks))
+        return [chunk + (seed,) for chunk, seed in zip(chunks, seeds)]
+
+    def run(self):
+        """Play all pairings and return the win rate matrix."""
+        tasks = self.tasks()
+        columns = list(zip(*tasks)) if tasks else [(), (), (), ()]
+        if self.workers <= 1:
+            partials = map(play_chunk, *columns)
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                partials = list(pool.map(play_chunk, *columns))
+
+        self.results = {pair: SimulationResult(*pair) for pair in self.pairings()}
+        for partial in partials:
+            self.results[partial.difficulties].merge(partial)
+        return self.win_matrix()
+
+    def win_matrix(self):
+        """
+        Return the win rates as a matrix.
+
+        Row i, column j is the share of games difficulty i won against
+        difficulty j. The diagonal is 0.5.
+        """
+        index = {name: position for position, name in enumerate(self.difficulties)}
+        matrix = np.full((len(self.difficulties),) * 2, 0.5)
+        for (first, second), result in self.results.items():
+            matrix[index[first], index[second]] = result.win_rate(0)
+            matrix[index[second], index[first]] = result.win_rate(1)
+        return matrix
@@ -0,0 +1,127 @@
+"""Vectorized simulation of many computer versus computer games at once."""
+
+import random
+import numpy as np
+from PigDiceGame import strategy
+from PigDiceGame.simulation import WINNING_SCORE, SimulationResult
+
+BATCH_SIZE = 250_000
+
+
+class VectorSimulation:
+    """
+    Play many games at once with their state kept in NumPy arrays.
+
+    Every step advances all unfinished games by one decision: a hold or
+    a roll. Finished games are dropped from the arrays so the work per
+    step shrinks as the batch completes.
+    """
+
+    def __init__(self, first, second, seed=None, batch_size=BATCH_SIZE, swap_start=True):
+        """
+        Create the strategies for both difficulties.
+
+        Each strategy gets its own random.Random seeded from a child of
+        the seed, so strategies that draw through self.rng in decide are
+        as reproducible as the dice.
+        """
+        self.difficulties = (first, second)
+        self.rng = np.random.default_rng(seed)
+        children = self.rng.bit_generator.seed_seq.spawn(2)
+        self.strategies = tuple(
+            strategy.create(name, random.Random(int(child.generate_state(1, np.uint64)[0])))
+            for name, child in zip(self.difficulties, children)
+        )
+        if None in self.strategies:
+            raise KeyError(f"Unknown difficulty in {self.difficulties}")
+        self.batch_size = batch_size
+        self.swap_start = swap_start
+
+    def decide(self, seat, own, opponent, turn_total, toss_count):
+        """Return a boolean array that is True for games where the mover holds."""
+        first, second = self.strategies
+        hold = first.decide_batch(own, opponent, turn_total, toss_count, self.rng)
+        if self.difficulties[0] == self.difficulties[1]:
+            return hold
+        return np.where(
+            seat == 0, hold, second.decide_batch(own, opponent, turn_total, toss_count, self.rng)
+        )
+
+    def play_batch(self, games, first_starter=0):
+        """
+        Play a batch of games and return per game arrays.
+
+        The arrays hold the winning seat, the number of turns and the
+        number of tosses for every game, in the order the games started.
+        """
+        winners = np.empty(games, dtype=np.int8)
+        turn_counts = np.empty(games, dtype=np.int32)
+        toss_counts = np.empty(games, dtype=np.int32)
+
+        ids = np.arange(games)
+        seat = np.full(games, first_starter, dtype=np.int8)
+        if self.swap_start:
+            seat ^= (ids % 2).astype(np.int8)
+        own = np.zeros(games, dtype=np.int16)
+        opponent = np.zeros(games, dtype=np.int16)
+        turn_total = np.zeros(games, dtype=np.int16)
+        toss_count = np.zeros(games, dtype=np.int16)
+        turns = np.ones(games, dtype=np.int32)
+        tosses = np.zeros(games, dtype=np.int32)
+
+        while ids.size:
+            hold = self.decide(seat, own, opponent, turn_total, toss_count)
+            toss = ~hold
+            roll = self.rng.integers(1, 7, size=ids.size, dtype=np.int16)
+            bust = toss & (roll == 1)
+            turn_total += roll * (toss & ~bust)
+            toss_count += toss
+            tosses += toss
+            won = toss & ~bust & (own + turn_total >= WINNING_SCORE)
+            own += turn_total * hold
+
+            passed = hold | bust
+            kept = ~passed
+            turn_total *= kept
+            toss_count *= kept
+            own, opponent = np.where(passed, opponent, own), np.where(passed, own, opponent)
+            seat ^= passed.astype(np.int8)
+            turns += passed
+
+            if won.any():
+                done = ids[won]
+                winners[done] = seat[won]
+                turn_counts[done] = turns[won]
+                toss_counts[done] = tosses[won]
+                keep = ~won
+                ids = ids[keep]
+                seat = seat[keep]
+                own = own[keep]
+                opponent = opponent[keep]
+                turn_total = turn_total[keep]
+                toss_count = toss_count[keep]
+                turns = turns[keep]
+                tosses = tosses[keep]
+
+        return winners, turn_counts, toss_counts
+
+    def run(self, games, start=0):
+        """
+        Play a number of games in batches and return the aggregated result.
+
+        The games are numbered from start, so the starting seat keeps
+        alternating when a run is split into parts.
+        """
+        result = SimulationResult(*self.difficulties)
+        played = 0
+        while played < games:
+            size = min(self.batch_size, games - played)
+            winners, turns, tosses = self.play_batch(size, first_starter=(start + played) % 2)
+            second_wins = int(winners.sum())
+            result.games += size
+            result.wins[0] += size - second_wins
+            result.wins[1] += second_wins
+            result.turns += int(turns.sum())
+            result.tosses += int(tosses.sum())
+            played += size
+        return result
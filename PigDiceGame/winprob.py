@@ -0,0 +1,153 @@
+"""Exact win probabilities for a pair of strategies."""
+
+import functools
+import numpy as np
+from PigDiceGame import engine
+from PigDiceGame import strategy
+
+TARGET = engine.WINNING_SCORE
+TABLE_CACHE_SIZE = 16
+
+
+def turn_outcomes(player, target=TARGET):  # pylint: disable=too-many-locals
+    """
+    Return how one turn of a strategy ends from every pair of banked scores.
+
+    bank[own, opponent, gain] is the probability that the turn ends with
+    gain points banked, a one counts as gain 0, and win[own, opponent]
+    the probability that the turn reaches the target. The turn is walked
+    by turn total, the probability mass for each toss count moves up by
+    the die value until it is held, lost or wins.
+    """
+    limit = player.toss_limit if player.toss_limit is not None else target // 2 + 1
+    own = np.arange(target)[:, None, None]
+    opponent = np.arange(target)[None, :, None]
+    toss_count = np.arange(limit + 1)[None, None, :]
+
+    bank = np.zeros((target, target, target))
+    win = np.zeros((target, target))
+    # The mass for turn totals k to k + 6 in a ring, a roll adds at most 6.
+    ring = np.zeros((7, target, target, limit + 1))
+    ring[0, :, :, 0] = 1.0
+    for turn_total in range(target):
+        mass = ring[turn_total % 7]
+        held = mass * player.hold_probabilities(own, opponent, turn_total, toss_count)
+        bank[:, :, turn_total] += held.sum(axis=2)
+        rolled = (mass - held) / 6.0
+        bank[:, :, 0] += rolled.sum(axis=2)
+        if limit:
+            # One toss more, the last toss count stands for all higher ones.
+            tossed = np.empty_like(rolled)
+            tossed[:, :, 0] = 0.0
+            tossed[:, :, 1:] = rolled[:, :, :-1]
+            tossed[:, :, -1] += rolled[:, :, -1]
+            rolled = tossed
+        for value in range(2, 7):
+            wins = own[:, :, 0] + turn_total + value >= target
+            win += np.where(wins, rolled.sum(axis=2), 0.0)
+            ring[(turn_total + value) % 7] += np.where(wins[:, :, None], 0.0, rolled)
+        mass[...] = 0.0
+    return bank, win
+
+
+class WinProbability:
+    """
+    Exact win probabilities when the first strategy plays the second.
+
+    At the start of a turn the chance of the player to move only depends
+    on the banked scores, and every turn ends with the scores the same or
+    higher. So the tables are filled from the highest score sum down and
+    only a turn that banks nothing leads back to the same scores, which
+    is a two by two linear system solved in closed form. Within a turn
+    probability walks the rest of the turn and memoizes every state.
+    """
+
+    def __init__(self, first, second, target=TARGET):
+        """Solve the start of turn tables for two difficulty names."""
+        self.difficulties = (first, second)
+        self.target = target
+        self.players = (strategy.create(first), strategy.create(second))
+        if None in self.players:
+            raise KeyError(f"Unknown difficulty in {self.difficulties}")
+        self.tables = self.solve()
+        self.lists = tuple(table.tolist() for table in self.tables)
+        self.memo = {}
+
+    def solve(self):  # pylint: disable=too-many-locals
+        """Return the start of turn tables, table[seat][own, opponent] for the seat to move."""
+        target = self.target
+        bank_a, win_a = turn_outcomes(self.players[0], target)
+        bank_b, win_b = turn_outcomes(self.players[1], target)
+        prob_a = np.zeros((target, target))
+        prob_b = np.zeros((target, target))
+        gains = np.arange(target)[None, :]
+        for score_sum in range(2 * target - 2, -1, -1):
+            own = np.arange(max(0, score_sum - target + 1), min(score_sum, target - 1) + 1)
+            opponent = score_sum - own
+            # Turns that bank points lead to higher sums, which are solved.
+            after_a = np.minimum(own[:, None] + gains, target - 1)
+            after_b = np.minimum(opponent[:, None] + gains, target - 1)
+            rest_a = win_a[own, opponent] + (
+                bank_a[own, opponent, 1:] * (1.0 - prob_b[opponent[:, None], after_a])[:, 1:]
+            ).sum(axis=1)
+            rest_b = win_b[opponent, own] + (
+                bank_b[opponent, own, 1:] * (1.0 - prob_a[own[:, None], after_b])[:, 1:]
+            ).sum(axis=1)
+            # a = rest_a + zero_a * (1 - b) and b = rest_b + zero_b * (1 - a)
+            zero_a = bank_a[own, opponent, 0]
+            zero_b = bank_b[opponent, own, 0]
+            denominator = 1.0 - zero_a * zero_b
+            numerator = rest_a + zero_a * (1.0 - rest_b - zero_b)
+            solved = denominator > 0.0
+            prob_a[own, opponent] = np.where(
+                solved, numerator / np.where(solved, denominator, 1.0), 0.5
+            )
+            prob_b[opponent, own] = rest_b + zero_b * (1.0 - prob_a[own, opponent])
+        return prob_a, prob_b
+
+    def probability(self, own_score, opponent_score, turn_total=0, toss_count=0, seat=0):
+        """Return the probability that the seat to move wins, seat 0 plays the first strategy."""
+        if own_score + turn_total >= self.target:
+            return 1.0
+        if turn_total == 0 and toss_count == 0:
+            return self.lists[seat][own_score][opponent_score]
+        limit = self.players[seat].toss_limit
+        if limit is not None:
+            toss_count = min(toss_count, limit)
+        return self.within_turn(seat, own_score, opponent_score, turn_total, toss_count)
+
+    def within_turn(self, seat, own_score, opponent_score, turn_total, toss_count):
+        """Return the probability to win from a state within a turn, memoized."""
+        key = (seat, own_score, opponent_score, turn_total, toss_count)
+        if key in self.memo:
+            return self.memo[key]
+        player = self.players[seat]
+        other = self.lists[1 - seat][opponent_score]
+        hold = player.hold_probability(own_score, opponent_score, turn_total, toss_count)
+        next_toss = toss_count + 1
+        if player.toss_limit is not None:
+            next_toss = min(next_toss, player.toss_limit)
+        roll = 1.0 - other[own_score]
+        for value in range(2, 7):
+            if own_score + turn_total + value >= self.target:
+                roll += 1.0
+            else:
+                roll += self.within_turn(
+                    seat, own_score, opponent_score, turn_total + value, next_toss
+                )
+        prob = hold * (1.0 - other[own_score + turn_total]) + (1.0 - hold) * roll / 6.0
+        self.memo[key] = prob
+        return prob
+
+
+@functools.lru_cache(maxsize=TABLE_CACHE_SIZE)
+def tables(first, second, target=TARGET):
+    """Return the solved WinProbability for two difficulty names, the last few are cached."""
+    return WinProbability(first, second, target)
+
+
+def win_probability(
+    own_score, opponent_score, turn_total=0, toss_count=0, own="4", opponent="4"
+):  # pylint: disable=too-many-arguments,too-many-positional-arguments
+    """Return the probability that the player to move wins, with the difficulty names of both."""
+    return tables(own, opponent).probability(own_score, opponent_score, turn_total, toss_count)
@@ -0,0 +1,198 @@
+"""
+Run the benchmarks, store the results as JSON and compare them to a baseline.
+
+Every result is the best time per operation in seconds out of a few
+repeats. Run it from the repository root:
+
+    python -m benchmark.run --output benchmark/results.json --baseline benchmark/baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import timeit
+
+from PigDiceGame import computer, dice, highscore, simulation, strategy
+
+SIZES = (10**3, 10**4, 10**5, 10**6)
+QUICK_SIZES = (10**3, 10**4)
+REPEAT = 3
+TOLERANCE = 0.2
+
+
+def measure(function, number, repeat=REPEAT):
+    """Return the best seconds per call of function out of repeat runs of number calls."""
+    return min(timeit.Timer(function).repeat(repeat, number)) / number
+
+
+def bench_dice(quick=False):
+    """Time Dice.get_random_number."""
+    die = dice.Dice()
+    number = 10_000 if quick else 200_000
+    return {"dice.get_random_number": measure(die.get_random_number, number)}
+
+
+def bench_decisions(quick=False):
+    """Time Computer.difficulty_choice for every difficulty."""
+    number = 2_000 if quick else 50_000
+    results = {}
+    for difficulty in strategy.names():
+        pc = computer.Computer(difficulty)
+        pc.set_total_score(40)
+        states = [(toss, toss * 4) for toss in range(10)]
+
+        def choose(pc=pc, states=states):
+            for toss_counter, score in states:
+                pc.difficulty_choice(toss_counter, score, 30)
+
+        seconds = measure(choose, number)
+        results[f"computer.difficulty_choice[{difficulty}]"] = seconds / len(states)
+    return results
+
+
+def bench_highscore(quick=False):
+    """Time Highscore.add_winner and retreive_highscore_file for growing lists."""
+    results = {}
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as directory:
+        # Highscore reads and writes highscore_list.txt in the working directory.
+        os.chdir(directory)
+        try:
+            for size in QUICK_SIZES if quick else SIZES:
+                high = highscore.Highscore()
+                high.add_highscore_to_file({f"player{index}": index for index in range(size)})
+                results[f"highscore.retreive_highscore_file[{size}]"] = measure(
+                    high.retreive_highscore_file, 1
+                )
+                number = max(1, 10_000 // size)
+                results[f"highscore.add_winner[{size}]"] = measure(
+                    lambda high=high: high.add_winner("player0"), number
+                )
+        finally:
+            os.chdir(cwd)
+    return results
+
+
+def bench_games(quick=False):
+    """Time complete headless games."""
+    games = 200 if quick else 5_000
+    results = {}
+    for first, second in (("2", "Pelle"), ("4", "4")):
+        sim = simulation.Simulation(first, second, seed=0)
+        seconds = measure(lambda sim=sim: sim.run(games), 1)
+        results[f"simulation.game[{first}-{second}]"] = seconds / games
+    return results
+
+
+BENCHMARKS = {
+    "dice": bench_dice,
+    "decisions": bench_decisions,
+    "highscore": bench_highscore,
+    "games": bench_games,
+}
+
+
+def run(names=None, quick=False):
+    """Run the named benchmarks, all by default, and return the seconds per operation."""
+    results = {}
+    for name in names or BENCHMARKS:
+        results.update(BENCHMARKS[name](quick))
+    return results
+
+
+def compare(results, baseline, tolerance=TOLERANCE):
+    """
+    Compare the results with a baseline.
+
+    Returns a (name, baseline, result, change) row for every result that
+    is in the baseline, and the names that are slower than the baseline
+    by more than tolerance.
+    """
+    rows = []
+    regressions = []
+    for name, seconds in results.items():
+        if name not in baseline:
+            continue
+        change = seconds / baseline[name] - 1.0
+        rows.append((name, baseline[name], seconds, change))
+        if change > tolerance:
+            regressions.append(name)
+    return rows, regressions
+
+
+def report(results, rows):
+    """Print the results and the comparison with the baseline."""
+    changes = {name: change for name, _, _, change in rows}
+    for name, seconds in results.items():
+        line = f"{name:<48} {seconds * 1e6:>12.3f} us/op {1 / seconds:>14,.0f} ops/s"
+        if name in changes:
+            line += f" {changes[name]:>+8.1%}"
+        print(line)
+
+
+def save(path, results, quick):
+    """Write the results as JSON with the Python version, machine and mode."""
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(
+            {
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "quick": quick,
+                "results": results,
+            },
+            file,
+            indent=2,
+        )
+
+
+def main(argv=None):
+    """
+    Run the benchmarks from the command line.
+
+    A missing baseline is recorded from this run, baselines depend on the
+    machine so every machine keeps its own. Exits with 1 on a regression
+    and with 2 when the baseline was written by a run of the other mode,
+    quick or full.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--only", action="append", choices=list(BENCHMARKS), help="run only these benchmarks"
+    )
+    parser.add_argument("--output", help="write the results as JSON to this file")
+    parser.add_argument("--baseline", help="compare with the results in this JSON file")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE)
+    parser.add_argument("--quick", action="store_true", help="fewer runs and smaller lists")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+        if baseline.get("quick", False) != args.quick:
+            mode = "quick" if baseline.get("quick", False) else "full"
+            print(
+                f"Baseline {args.baseline} is from a {mode} run, compare runs of the same mode",
+                file=sys.stderr,
+            )
+            return 2
+
+    results = run(args.only, args.quick)
+    rows, regressions = [], []
+    if baseline is not None:
+        rows, regressions = compare(results, baseline["results"], args.tolerance)
+    report(results, rows)
+    if args.output:
+        save(args.output, results, args.quick)
+    if args.baseline and baseline is None:
+        save(args.baseline, results, args.quick)
+        print(f"Recorded the baseline {args.baseline}, later runs are compared to it")
+    for name in regressions:
+        print(f"Regression: {name} is more than {args.tolerance:.0%} slower than the baseline")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+"""
+Check that importing the game stays below the import time budget.
+
+Timing depends on the machine and its caches, so this is a make target
+and not a unit test. Run it from the repository root:
+
+    python -m benchmark.startup
+"""
+
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Cumulative import time of PigDiceGame.main in microseconds.
+IMPORT_BUDGET = 150_000
+
+
+def import_times(module):
+    """Import a module in a fresh interpreter and return the import times."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def main():
+    """Print the import time of the game, exit with 1 when it is over the budget."""
+    spent = import_times("PigDiceGame.main")["PigDiceGame.main"]
+    print(f"Importing PigDiceGame.main took {spent} us, the budget is {IMPORT_BUDGET} us")
+    return 1 if spent > IMPORT_BUDGET else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+"""Testclass for batchdice."""
+
+import unittest
+from PigDiceGame.batchdice import BatchDice
+from PigDiceGame.computer import Computer
+from PigDiceGame.player import Player
+
+
+class TestBatchDice(unittest.TestCase):
+    """Test the batched dice."""
+
+    def test_rolls_in_range(self):
+        """All rolls are between 1 and 6 and the buffer gets refilled."""
+        die = BatchDice(seed=1, buffer_size=16)
+        rolls = [die.get_random_number() for _ in range(100)]
+        self.assertTrue(all(1 <= roll <= 6 for roll in rolls))
+        self.assertEqual(set(rolls), {1, 2, 3, 4, 5, 6})
+        self.assertIsInstance(rolls[0], int)
+
+    def test_same_seed_same_rolls(self):
+        """Two dice with the same seed roll the same sequence."""
+        first = BatchDice(seed=42, buffer_size=8)
+        second = BatchDice(seed=42, buffer_size=8)
+        res = [first.get_random_number() for _ in range(20)]
+        exp = [second.get_random_number() for _ in range(20)]
+        self.assertEqual(res, exp)
+
+    def test_roll_many(self):
+        """Roll many returns an array of the requested length."""
+        rolls = BatchDice(seed=3).roll_many(1000)
+        self.assertEqual(rolls.shape, (1000,))
+        self.assertEqual(rolls.min(), 1)
+        self.assertEqual(rolls.max(), 6)
+
+    def test_throw_dice(self):
+        """Player and Computer can throw the batched dice."""
+        die = BatchDice(seed=5)
+        player = Player("Bob")
+        pc = Computer("1")
+        self.assertTrue(1 <= player.throw_dice(die) <= 6)
+        self.assertTrue(1 <= pc.throw_dice(die) <= 6)
+        self.assertEqual(player.get_tossed_amount(), 1)
+        self.assertEqual(pc.get_tossed_amount(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+"""Testclass for the benchmark runner."""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from benchmark import run
+
+
+class TestBenchmark(unittest.TestCase):
+    """Test running and comparing benchmarks."""
+
+    def test_compare(self):
+        """Results slower than the tolerance are regressions."""
+        rows, regressions = run.compare(
+            {"a": 1.0, "b": 1.5, "c": 2.0}, {"a": 1.0, "b": 1.0}, tolerance=0.2
+        )
+        self.assertEqual([row[0] for row in rows], ["a", "b"])
+        self.assertAlmostEqual(rows[1][3], 0.5)
+        self.assertEqual(regressions, ["b"])
+
+    @patch("builtins.print")
+    def test_main_writes_and_compares(self, mock_print):
+        """The results are written as JSON and a slow run fails against the baseline."""
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "results.json")
+            self.assertEqual(run.main(["--quick", "--only", "dice", "--output", output]), 0)
+            with open(output, "r", encoding="utf-8") as file:
+                results = json.load(file)["results"]
+            self.assertIn("dice.get_random_number", results)
+
+            with open(output, "w", encoding="utf-8") as file:
+                json.dump({"quick": True, "results": {"dice.get_random_number": 1e-12}}, file)
+            self.assertEqual(run.main(["--quick", "--only", "dice", "--baseline", output]), 1)
+
+    @patch("builtins.print")
+    @patch("benchmark.run.run", return_value={"dice.get_random_number": 1e-7})
+    def test_baseline_modes(self, mock_run, mock_print):
+        """A missing baseline is recorded and one of the other mode fails before anything runs."""
+        with tempfile.TemporaryDirectory() as directory:
+            baseline = os.path.join(directory, "baseline.json")
+            self.assertEqual(run.main(["--quick", "--baseline", baseline]), 0)
+            with open(baseline, "r", encoding="utf-8") as file:
+                recorded = json.load(file)
+            self.assertIs(recorded["quick"], True)
+            self.assertEqual(recorded["results"], {"dice.get_random_number": 1e-7})
+            self.assertEqual(run.main(["--quick", "--baseline", baseline]), 0)
+            self.assertEqual(mock_run.call_count, 2)
+            self.assertEqual(run.main(["--baseline", baseline]), 2)
+        self.assertEqual(mock_run.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
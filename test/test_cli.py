@@ -0,0 +1,131 @@
+"""Testclass for the command line."""
+
+import argparse
+import json
+import unittest
+from concurrent.futures import Future
+from io import StringIO
+from unittest.mock import patch
+from PigDiceGame import cli, simulation
+
+
+class TestCli(unittest.TestCase):
+    """Test the simulate subcommand."""
+
+    def simulate(self, *argv):
+        """Run simulate with the options and return the summary, output and errors."""
+        out, err = StringIO(), StringIO()
+        line = cli.simulate(cli.parse_simulate(list(argv)), out, err)
+        return line, out.getvalue(), err.getvalue()
+
+    def test_count(self):
+        """Numbers of games take a k, M or G suffix."""
+        self.assertEqual(cli.count("500"), 500)
+        self.assertEqual(cli.count("10_000"), 10_000)
+        self.assertEqual(cli.count("20k"), 20_000)
+        self.assertEqual(cli.count("10M"), 10_000_000)
+        for text in ("0", "x", "3x", "M"):
+            with self.assertRaises(argparse.ArgumentTypeError):
+                cli.count(text)
+
+    def test_chunks(self):
+        """The games are cut into chunks of the chunk size."""
+        self.assertEqual(list(cli.chunks(25, 10)), [(0, 10), (10, 10), (20, 5)])
+
+    def test_confidence(self):
+        """A confidence level outside 0 to 1 is refused before any game is played."""
+        self.assertEqual(cli.confidence_level("0.99"), 0.99)
+        for text in ("0", "1", "1.5", "-0.5", "high"):
+            with self.assertRaises(argparse.ArgumentTypeError):
+                cli.confidence_level(text)
+        with patch("sys.stderr"), patch("PigDiceGame.cli.play_chunks") as play_chunks:
+            with self.assertRaises(SystemExit):
+                cli.main(["simulate", "--confidence", "1.5"])
+        play_chunks.assert_not_called()
+
+    def test_json(self):
+        """Progress follows every chunk and the summary is the last NDJSON line."""
+        line, out, _ = self.simulate(
+            "--p1", "1", "--p2", "Pelle", "--games", "200", "--chunk-size", "50",
+            "--workers", "1", "--seed", "42", "--json",
+        )  # fmt: skip
+        lines = [json.loads(text) for text in out.splitlines()]
+        self.assertEqual([item["type"] for item in lines], ["progress"] * 4 + ["summary"])
+        self.assertEqual([item["games"] for item in lines[:4]], [50, 100, 150, 200])
+        self.assertEqual(lines[-1], line)
+
+        expected = simulation.SimulationResult("1", "Pelle")
+        for start in range(0, 200, 50):
+            expected.merge(cli.play_chunk("1", "Pelle", start, 50, 42))
+        self.assertEqual(line["wins"], expected.wins)
+        low, high = line["win_rate_interval"][1]
+        self.assertLess(low, expected.win_rate(1))
+        self.assertGreater(high, expected.win_rate(1))
+
+    def test_chunk_seeds(self):
+        """Every chunk of a seeded run has its own stream and can be replayed alone."""
+        first = cli.play_chunk("3", "3", 0, 500, 7)
+        self.assertEqual(cli.play_chunk("3", "3", 0, 500, 7).as_dict(), first.as_dict())
+        self.assertNotEqual(cli.play_chunk("3", "3", 500, 500, 7).as_dict(), first.as_dict())
+
+    def test_workers(self):
+        """A seeded run gives the same result with any number of workers."""
+        options = ("--games", "300", "--chunk-size", "100", "--seed", "3", "--quiet")
+        alone, _, _ = self.simulate(*options, "--workers", "1")
+        pooled, _, _ = self.simulate(*options, "--workers", "2")
+        self.assertEqual(pooled["wins"], alone["wins"])
+        self.assertEqual(pooled["tosses"], alone["tosses"])
+
+    def test_bounded_submissions(self):
+        """The pool never holds more than IN_FLIGHT chunks per worker."""
+        submitted = []
+
+        class Pool:
+            """Pool that runs every chunk when it is submitted."""
+
+            def __init__(self, max_workers):
+                """Remember nothing but the worker count."""
+                self.max_workers = max_workers
+
+            def submit(self, function, *args):
+                """Run the chunk and return a done future."""
+                submitted.append(args[2])
+                future = Future()
+                future.set_result(function(*args))
+                return future
+
+            def shutdown(self, cancel_futures=False):
+                """Do nothing."""
+
+        seen = []
+        with patch("PigDiceGame.cli.ProcessPoolExecutor", Pool):
+            for _ in cli.play_chunks("1", "2", 100, 5, 2, chunk_size=10):
+                seen.append(len(submitted))
+        self.assertEqual(seen, [4, 5, 6, 7, 8, 9, 10, 10, 10, 10])
+
+    def test_text(self):
+        """Without --json progress goes to errors and the summary is text."""
+        _, out, err = self.simulate("--games", "100", "--chunk-size", "50", "--workers", "1")
+        self.assertIn("100/100 games", err)
+        self.assertIn("won", out)
+        self.assertIn("95% interval", out)
+
+    def test_main(self):
+        """Without a subcommand the game starts with the options."""
+        with patch("PigDiceGame.main.main") as game_main:
+            self.assertEqual(cli.main(["--profile", "profile.json"]), 0)
+        game_main.assert_called_once_with(["--profile", "profile.json"])
+        with patch("PigDiceGame.cli.simulate") as simulate:
+            self.assertEqual(cli.main(["simulate", "--games", "5"]), 0)
+        self.assertEqual(simulate.call_args[0][0].games, 5)
+
+    def test_help(self):
+        """The help of the command line names the program and lists simulate."""
+        with patch("sys.stdout", new=StringIO()) as fake_out, self.assertRaises(SystemExit):
+            cli.main(["--help"])
+        self.assertIn("usage: python -m PigDiceGame", fake_out.getvalue())
+        self.assertIn("simulate", fake_out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
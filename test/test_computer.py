@@ -1,6 +1,7 @@
 """Testclass for computer."""
 
 import unittest
+from unittest.mock import patch
 from PigDiceGame import computer
 
 
@@ -91,6 +92,27 @@ class TestComputer(unittest.TestCase):
         exp = (["stay"], ["toss"])
         self.assertIn(res, exp)
 
+    def test_optimal_difficulty(self):
+        """Test the optimal player holds at 21 at the start of the game."""
+        c = computer.Computer("4")
+        self.assertEqual(c.optimal_difficulty(20, 0), ["toss"])
+        self.assertEqual(c.optimal_difficulty(21, 0), ["stay"])
+        self.assertEqual(c.difficulty_choice(2, 21, 0), ["stay"])
+        other = computer.Computer("2")
+        with patch("PigDiceGame.strategy.create") as create:
+            self.assertEqual(other.optimal_difficulty(21, 0), ["stay"])
+        create.assert_not_called()
+
+    def test_decide(self):
+        """Test decide returns the decision as a string."""
+        c = computer.Computer("1")
+        self.assertEqual(c.decide(0, 0), "toss")
+        self.assertEqual(c.decide(1, 4), "stay")
+
+        c.set_difficulty("Pelle")
+        self.assertEqual(c.decide(5, 24), "toss")
+        self.assertEqual(c.decide(5, 25), "stay")
+
     def test_difficulty_choice(self):
         """Test for choosing difficulty"""
         c = computer.Computer("1")
@@ -0,0 +1,66 @@
+"""Testclass for engine."""
+
+import unittest
+from PigDiceGame import engine
+
+
+class TestGameState(unittest.TestCase):
+    """Test the game rules."""
+
+    def test_init_default_object(self):
+        """A new game starts with seat 0 and no points."""
+        state = engine.GameState()
+        self.assertEqual(state.scores, [0, 0])
+        self.assertEqual(state.current, 0)
+        self.assertIsNone(state.winner)
+
+    def test_roll_and_hold(self):
+        """Rolled points are banked on hold and the die passes on."""
+        state = engine.GameState()
+        self.assertTrue(state.roll(4))
+        self.assertTrue(state.roll(5))
+        self.assertEqual(state.total(), 9)
+        state.hold()
+        self.assertEqual(state.scores, [9, 0])
+        self.assertEqual(state.current, 1)
+        self.assertEqual(state.turn_total, 0)
+        self.assertEqual(state.toss_count, 0)
+        self.assertEqual(state.opponent_score(), 9)
+
+    def test_roll_one(self):
+        """A one loses the points of the turn."""
+        state = engine.GameState(starter=1)
+        state.roll(6)
+        self.assertFalse(state.roll(1))
+        self.assertEqual(state.scores, [0, 0])
+        self.assertEqual(state.current, 0)
+        self.assertEqual(state.turns, 2)
+        self.assertEqual(state.tosses, 2)
+
+    def test_reaching_target_wins(self):
+        """Reaching the target wins without holding."""
+        state = engine.GameState(scores=(97, 50))
+        self.assertFalse(state.roll(3))
+        self.assertEqual(state.winner, 0)
+        self.assertEqual(state.scores, [100, 50])
+
+    def test_surrender(self):
+        """The other seat wins on surrender."""
+        state = engine.GameState()
+        state.surrender()
+        self.assertEqual(state.winner, 1)
+
+    def test_game_over(self):
+        """Nothing can be played after the game is over."""
+        state = engine.GameState(target=5)
+        state.roll(6)
+        with self.assertRaises(ValueError):
+            state.roll(2)
+        with self.assertRaises(ValueError):
+            state.hold()
+        with self.assertRaises(ValueError):
+            state.surrender()
+
+
+if __name__ == "__main__":
+    unittest.main()
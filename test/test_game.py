@@ -248,6 +248,22 @@ class TestGame(unittest.TestCase):
 
         self.assertEqual(intelligence.get_difficulty(), "2")
 
+    def test_seat_keeps_the_match(self):
+        """Scores changed outside the engine do not start a new match."""
+        g = game.Game(highscore.Highscore())
+        anna, bob = player.Player("Anna"), player.Player("Bob")
+        g.new_match(anna, bob)
+        g.roll(5)
+        anna.set_total_score(50)
+        self.assertEqual(g.seat(anna), 0)
+        self.assertEqual(g.seat(bob), 1)
+        self.assertEqual(g.state.turn_total, 5)
+
+        g.surrender()
+        self.assertEqual(g.seat(bob), 0)
+        self.assertEqual(g.seats, [bob, None])
+        self.assertEqual(g.state.scores, [0, 0])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,9 +1,10 @@
 """Testclass for highscore."""
 
+import os
 import unittest
 import tempfile
 from unittest.mock import mock_open, patch
-from PigDiceGame.highscore import Highscore
+from PigDiceGame.highscore import Highscore, parse_highscores, read_highscores
 
 
 class TestHighscore(unittest.TestCase):
@@ -67,6 +68,66 @@ class TestHighscore(unittest.TestCase):
         self.assertEqual(names, ["Oliver", "Marcus"])
         self.assertEqual(values, [10, 12])
 
+    def test_top_rank_and_page(self):
+        """Class method to test the leaderboard queries."""
+        self.highscore.highscores = {"Kalle": 12, "Anna": 7, "Muhammed": 13, "Ali": 7}
+        self.highscore.board.rebuild(self.highscore.highscores)
+
+        self.assertEqual(self.highscore.top(2), [("Muhammed", 13), ("Kalle", 12)])
+        self.assertEqual(self.highscore.page(1, 2), [("Anna", 7), ("Ali", 7)])
+        self.assertEqual(self.highscore.rank("Ali"), 3)
+        self.assertIsNone(self.highscore.rank("Nobody"))
+
+    def test_board_follows_wins(self):
+        """Class method to test the ranked board is kept up to date."""
+        with patch("PigDiceGame.highscore.Highscore.add_highscore_to_file"):
+            for name in ["Anna", "Kalle", "Kalle", "Ali", "Kalle", "Ali"]:
+                self.highscore.add_winner(name)
+
+        self.assertEqual(self.highscore.sorted_list(), [("Kalle", 3), ("Ali", 2), ("Anna", 1)])
+        self.assertEqual(self.highscore.get_name_and_highscore(2), (["Kalle", "Ali"], [3, 2]))
+        self.assertEqual(self.highscore.rank("Anna"), 3)
+
+    def test_parse_highscores(self):
+        """Class method to test names are stripped and duplicate names added."""
+        text = "Kalle : 12\nAnna: 7\n  Kalle:3\n"
+        self.assertEqual(parse_highscores(text), {"Kalle": 15, "Anna": 7})
+        self.assertEqual(parse_highscores(""), {})
+
+    def test_parse_bad_lines(self):
+        """Class method to test bad lines are skipped and names may contain colons."""
+        text = "Kalle : 12\nbroken line\n\n: 4\nAnna : many\nDr: Who : 2\r\nAli : -1\n"
+        self.assertEqual(parse_highscores(text), {"Kalle": 12, "Dr: Who": 2})
+
+    def test_parse_wins_are_ascii_digits(self):
+        """Class method to test both parsers take only ASCII digits as wins."""
+        self.assertEqual(parse_highscores("Kalle : 12\nAnna : \u00b2\n"), {"Kalle": 12})
+        self.assertEqual(parse_highscores("Kalle : +3\nAnna : 1_0\n"), {})
+        self.assertEqual(parse_highscores("Kalle : +3\nAnna : 1_0\nbroken line\n"), {})
+
+    def test_parse_canonical(self):
+        """Class method to test the fast path adds the wins of repeated names."""
+        text = "Kalle : 12\nAnna : 7\nKalle : 3"
+        self.assertEqual(parse_highscores(text), {"Kalle": 15, "Anna": 7})
+        expected = {"Kalle": 15, "Anna": 7, "Dr Who": 2}
+        self.assertEqual(parse_highscores(text + "\nDr Who : 2\n"), expected)
+        self.assertEqual(parse_highscores(""), {})
+
+    def test_round_trip(self):
+        """Class method to test a name keeps one key through the file."""
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as directory:
+            os.chdir(directory)
+            try:
+                self.assertEqual(self.highscore.retreive_highscore_file(), {})
+                self.highscore.add_winner("Kalle")
+                high = Highscore()
+                high.retreive_highscore_file()
+                high.add_winner("Kalle")
+                self.assertEqual(read_highscores("highscore_list.txt"), {"Kalle": 2})
+            finally:
+                os.chdir(cwd)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,55 @@
+"""Testclass for histogram."""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from PigDiceGame.highscore import Highscore
+from PigDiceGame.histogram import Histogram
+
+
+class TestHistogram(unittest.TestCase):
+    """Test the headless rendering of the histogram."""
+
+    def setUp(self):
+        """Set up a highscore list with a few winners."""
+        self.high = Highscore()
+        with patch("PigDiceGame.highscore.Highscore.add_highscore_to_file"):
+            for name in ["Kalle", "Anna", "Kalle", "Ali"]:
+                self.high.add_winner(name)
+        self.chart = Histogram()
+
+    def test_render_png_and_svg(self):
+        """The chart is rendered to PNG and SVG bytes."""
+        png = self.chart.render(self.high)
+        self.assertTrue(png.startswith(b"\x89PNG"))
+        svg = self.chart.render(self.high, fmt="svg")
+        self.assertIn(b"<svg", svg)
+
+    def test_render_is_cached(self):
+        """An unchanged top 10 is not drawn again."""
+        first = self.chart.render(self.high)
+        with patch("PigDiceGame.histogram.Histogram.draw") as mock_draw:
+            second = self.chart.render(self.high)
+            mock_draw.assert_not_called()
+        self.assertIs(first, second)
+
+        with patch("PigDiceGame.highscore.Highscore.add_highscore_to_file"):
+            self.high.add_winner("Ali")
+        self.assertIsNot(self.chart.render(self.high), first)
+
+    def test_render_empty(self):
+        """Nothing is rendered for an empty list."""
+        self.assertIsNone(self.chart.render(Highscore()))
+
+    def test_save(self):
+        """The chart is saved to a file in the format of the file ending."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "highscore.svg")
+            self.assertTrue(self.chart.save(self.high, path))
+            with open(path, "rb") as file:
+                self.assertIn(b"<svg", file.read())
+
+
+if __name__ == "__main__":
+    unittest.main()
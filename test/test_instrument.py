@@ -0,0 +1,103 @@
+"""Testclass for instrument."""
+
+import json
+import os
+import pstats
+import tempfile
+import unittest
+from unittest.mock import patch
+from PigDiceGame import dice, game, instrument, main
+
+
+class TestInstrument(unittest.TestCase):
+    """Test the phase timings."""
+
+    def setUp(self):
+        """Use fresh instruments for every test."""
+        self.instruments = instrument.Instruments()
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        """Remove the hooks and the temporary directory."""
+        self.instruments.disable()
+        self.directory.cleanup()
+
+    def test_histogram(self):
+        """Calls are counted in the bucket of their time."""
+        histogram = instrument.Histogram()
+        for seconds in (5e-7, 2e-6, 2e-6, 20.0):
+            histogram.observe(seconds)
+        self.assertEqual(histogram.count, 4)
+        self.assertAlmostEqual(histogram.total, 20.0000045)
+        self.assertEqual(histogram.cumulative(), [1, 3, 3, 3, 3, 3, 3, 3, 4])
+        self.assertEqual(histogram.as_dict()["buckets"]["+Inf"], 4)
+
+    def test_enable_and_disable(self):
+        """Enabled the hooked methods are timed, disabled the originals are back."""
+        original = dice.Dice.get_random_number
+        die = dice.Dice()
+        die.get_random_number()
+        self.assertEqual(self.instruments.phases, {})
+
+        self.instruments.enable()
+        self.instruments.enable()
+        self.assertTrue(self.instruments.enabled)
+        for _ in range(3):
+            self.assertIn(die.get_random_number(), range(1, 7))
+        self.assertEqual(self.instruments.phases["roll"].count, 3)
+
+        self.instruments.disable()
+        self.assertFalse(self.instruments.enabled)
+        self.assertIs(dice.Dice.get_random_number, original)
+        die.get_random_number()
+        self.assertEqual(self.instruments.phases["roll"].count, 3)
+
+    def test_export(self):
+        """The phases are written as JSON or as Prometheus text."""
+        self.instruments.observe("roll", 2e-6)
+        self.instruments.observe("persist", 0.5)
+        path = os.path.join(self.directory.name, "profile.json")
+        self.instruments.export(path)
+        with open(path, "r", encoding="utf-8") as file:
+            phases = json.load(file)["phases"]
+        self.assertEqual(list(phases), ["persist", "roll"])
+        self.assertEqual(phases["roll"]["count"], 1)
+
+        path = os.path.join(self.directory.name, "profile.prom")
+        self.instruments.export(path)
+        with open(path, "r", encoding="utf-8") as file:
+            text = file.read()
+        self.assertIn("# TYPE pigdice_phase_seconds histogram", text)
+        self.assertIn('pigdice_phase_seconds_bucket{phase="roll",le="1e-05"} 1', text)
+        self.assertIn('pigdice_phase_seconds_count{phase="persist"} 1', text)
+
+    def test_profile(self):
+        """A call under cProfile returns its result and dumps the stats."""
+        path = os.path.join(self.directory.name, "game.prof")
+        self.assertEqual(instrument.profile(path, sum, [1, 2, 3]), 6)
+        self.assertTrue(pstats.Stats(path).total_calls > 0)
+
+    def test_main_profile(self):
+        """The game started with --profile writes the timings of its phases."""
+        path = os.path.join(self.directory.name, "profile.json")
+
+        def start_game(_):
+            dice.Dice().get_random_number()
+
+        with patch.object(game.Game, "start_game", start_game):
+            main.main(["--profile", path])
+        with open(path, "r", encoding="utf-8") as file:
+            self.assertEqual(json.load(file)["phases"]["roll"]["count"], 1)
+        self.assertFalse(instrument.INSTRUMENTS.enabled)
+        instrument.INSTRUMENTS.reset()
+
+    def test_environment(self):
+        """The environment variable is the default of --profile."""
+        with patch.dict(os.environ, {instrument.ENV_VAR: "metrics.prom"}):
+            self.assertEqual(main.parse_args([]).profile, "metrics.prom")
+        with patch.dict(os.environ, {instrument.ENV_VAR: ""}):
+            self.assertIsNone(main.parse_args([]).profile)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+"""Testclass for leaderboard."""
+
+import unittest
+from PigDiceGame.leaderboard import Leaderboard
+
+
+class TestLeaderboard(unittest.TestCase):
+    """Test the incremental leaderboard."""
+
+    def test_init_from_highscores(self):
+        """The board is built from a dict of wins."""
+        board = Leaderboard({"Kalle": 12, "Anna": 7, "Muhammed": 13})
+        self.assertEqual(len(board), 3)
+        self.assertEqual(board.top(2), [("Muhammed", 13), ("Kalle", 12)])
+
+    def test_add_win_moves_player_up(self):
+        """A win moves the player to the next bucket."""
+        board = Leaderboard({"Kalle": 2, "Anna": 1})
+        board.add_win("Anna")
+        board.add_win("Anna")
+        board.add_win("Ali")
+        self.assertEqual(board.top(), [("Anna", 3), ("Kalle", 2), ("Ali", 1)])
+        self.assertEqual(board.counts, [1, 2, 3])
+
+    def test_empty_buckets_are_removed(self):
+        """A bucket without players is dropped from the counts."""
+        board = Leaderboard({"Kalle": 1})
+        board.add_win("Kalle")
+        self.assertEqual(board.counts, [2])
+        self.assertEqual(board.buckets, {2: {"Kalle": None}})
+
+    def test_rank(self):
+        """Players with the same wins share the rank."""
+        board = Leaderboard({"Kalle": 5, "Anna": 3, "Ali": 3, "Minou": 1})
+        self.assertEqual(board.rank("Kalle"), 1)
+        self.assertEqual(board.rank("Ali"), 2)
+        self.assertEqual(board.rank("Minou"), 4)
+        self.assertIsNone(board.rank("Nobody"))
+
+    def test_top_limits(self):
+        """Top returns at most limit players."""
+        board = Leaderboard({"Kalle": 5, "Anna": 3})
+        self.assertEqual(board.top(0), [])
+        self.assertEqual(len(board.top(10)), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,52 @@
+"""Testclass for main."""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from PigDiceGame import game, main, render, storage
+
+
+class TestMain(unittest.TestCase):
+    """Test starting the game."""
+
+    def test_games_share_highscore_file(self):
+        """Games started side by side merge their wins into the same file."""
+        highs = []
+
+        def start_game(self):
+            highs.append(self.high)
+            self.high.retreive_highscore_file()
+
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as directory:
+            os.chdir(directory)
+            try:
+                with patch.object(game.Game, "start_game", start_game):
+                    main.main([])
+                    main.main([])
+                highs[0].add_winner("Kalle")
+                highs[1].add_winner("Anna")
+                highs[0].add_winner("Anna")
+                res = highs[1].retreive_highscore_file()
+            finally:
+                os.chdir(cwd)
+        self.assertIsInstance(highs[0].store, storage.LockedFileStore)
+        self.assertEqual(res, {"Kalle": 1, "Anna": 2})
+
+    def test_renderer_options(self):
+        """The renderer and its delay are chosen on the command line."""
+        renderer = main.make_renderer(main.parse_args([]))
+        self.assertIsInstance(renderer, render.ConsoleRenderer)
+        self.assertEqual(renderer.delay, 1.0)
+        renderer = main.make_renderer(main.parse_args(["--renderer", "instant", "--delay", "0.2"]))
+        self.assertIsInstance(renderer, render.InstantRenderer)
+        self.assertEqual(renderer.delay, 0.2)
+        renderer = main.make_renderer(main.parse_args(["--renderer", "null", "--delay", "3"]))
+        self.assertIsInstance(renderer, render.NullRenderer)
+        with patch("sys.stderr"), self.assertRaises(SystemExit):
+            main.parse_args(["--delay", "-1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+"""Testclass for optimal."""
+
+import os
+import tempfile
+import unittest
+import numpy as np
+from PigDiceGame import optimal
+
+
+class TestOptimal(unittest.TestCase):
+    """Test the optimal strategy solver."""
+
+    def test_solve_small_game(self):
+        """A game to 2 points is won by rolling until anything but a 1."""
+        prob, policy = optimal.solve(target=2)
+        self.assertEqual(policy.shape, (2, 2, 2))
+        self.assertFalse(policy[0, 0, 0])
+        self.assertAlmostEqual(prob[1, 1, 0], 5 / 6 + (1 - prob[1, 1, 0]) / 6)
+
+    def test_first_player_advantage(self):
+        """The stored policy matches the known optimal play to 100."""
+        policy = optimal.load_policy()
+        self.assertEqual(policy.shape, (100, 100, 100))
+        self.assertFalse(policy[0, 0, 20])
+        self.assertTrue(policy[0, 0, 21])
+        self.assertTrue(optimal.should_hold(90, 0, 10))
+
+    def test_save_and_load(self):
+        """A saved policy is loaded back unchanged."""
+        _, policy = optimal.solve(target=10)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "policy.npy")
+            optimal.save_policy(policy, path)
+            loaded = optimal.load_policy(path, target=10)
+        np.testing.assert_array_equal(loaded, policy)
+
+
+if __name__ == "__main__":
+    unittest.main()
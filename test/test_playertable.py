@@ -0,0 +1,72 @@
+"""Testclass for playertable."""
+
+import unittest
+from unittest.mock import patch
+from PigDiceGame import dice
+from PigDiceGame import game
+from PigDiceGame import highscore
+from PigDiceGame import playertable
+from PigDiceGame import render
+from PigDiceGame.player import Player
+from PigDiceGame.computer import Computer
+
+
+class TestPlayerTable(unittest.TestCase):
+    """Test the columnar player table."""
+
+    def test_add_and_get(self):
+        """Rows keep the name, score and toss count."""
+        table = playertable.PlayerTable(["Anna", "Bob"])
+        row = table.add("Cleo", total_score=40, tossed_amount=3)
+        self.assertEqual(len(table), 3)
+        self.assertEqual(row.get_name(), "Cleo")
+        self.assertEqual(row.get_total_score(), 40)
+        self.assertEqual(row.get_tossed_amount(), 3)
+        self.assertEqual(table[0].get_name(), "Anna")
+        self.assertEqual(table[-1].get_name(), "Cleo")
+
+    def test_setters_write_through(self):
+        """The setters of a row change the columns."""
+        table = playertable.PlayerTable(["Anna"])
+        row = table[0]
+        row.set_name("Bea")
+        row.set_total_score(55)
+        row.set_tossed_amount()
+        self.assertEqual(table.names, ["Bea"])
+        self.assertEqual(table.total_scores.tolist(), [55])
+        self.assertEqual(table.tossed_amounts.tolist(), [1])
+
+    @patch("PigDiceGame.dice.Dice.get_random_number", return_value=4)
+    def test_throw_dice(self, mock_die):
+        """Throwing the dice counts the toss like a Player."""
+        row = playertable.PlayerTable(["Anna"])[0]
+        self.assertEqual(row.throw_dice(dice.Dice()), 4)
+        self.assertEqual(row.get_tossed_amount(), 1)
+
+    def test_row_wins_game(self):
+        """A row can take the place of a Player in a game and win it."""
+        row = playertable.PlayerTable(["Anna"])[0]
+        g = game.Game(highscore.Highscore(), render.NullRenderer())
+        with patch("PigDiceGame.highscore.Highscore.add_winner") as add_winner:
+            self.assertFalse(g.check_if_winner(100, row))
+        add_winner.assert_called_once_with("Anna")
+        self.assertEqual(g.players, {"Anna": 100})
+        self.assertEqual(row.get_total_score(), 100)
+
+    def test_index_out_of_range(self):
+        """Indexing past the end raises IndexError."""
+        table = playertable.PlayerTable(["Anna"])
+        with self.assertRaises(IndexError):
+            table[1]  # pylint: disable=pointless-statement
+        self.assertEqual([row.get_name() for row in table], ["Anna"])
+
+    def test_compact(self):
+        """Player, Computer and the table rows carry no instance dict."""
+        self.assertFalse(hasattr(Player("Anna"), "__dict__"))
+        self.assertFalse(hasattr(Computer("1"), "__dict__"))
+        table = playertable.PlayerTable(str(i) for i in range(1000))
+        self.assertEqual(table.nbytes(), 1000 * 12)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+"""Testclass for records."""
+
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from PigDiceGame import game, highscore, records, render, replay, simulation
+from PigDiceGame.player import Player
+
+
+class TestRecords(unittest.TestCase):
+    """Test writing and reading game records."""
+
+    def setUp(self):
+        """Use a record file in a temporary directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "games.rec")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def test_pack_rolls(self):
+        """Rolls take 3 bits each and unpack to the same values."""
+        rolls = [1, 6, 3, 4, 5, 2, 6, 6, 1]
+        data = records.pack_rolls(rolls)
+        self.assertEqual(len(data), 4)
+        self.assertEqual(records.unpack_rolls(data, len(rolls)), rolls)
+
+    def test_pack_decisions(self):
+        """Decisions take one bit each."""
+        decisions = [True, True, False, True, False, False, True, True, False]
+        data = records.pack_decisions(decisions)
+        self.assertEqual(len(data), 2)
+        self.assertEqual(records.unpack_decisions(data, len(decisions)), decisions)
+
+    def test_write_and_read(self):
+        """Games read back with the same header, rolls and decisions."""
+        with records.RecordWriter(self.path) as writer:
+            writer.write([4, 1], [True, True], 1, (0, 100), 2, starter=0, seed=7)
+            writer.write([], [False], 0, (3, 2), 1)
+        with records.RecordWriter(self.path) as writer:
+            writer.write([6] * 20, [True] * 20, 0, (100, 0), 1)
+
+        with records.RecordReader(self.path) as reader:
+            games = [
+                (record.seed, record.winner, record.scores, record.rolls(), record.decisions())
+                for record in reader
+            ]
+        self.assertEqual(len(games), 3)
+        self.assertEqual(games[0], (7, 1, (0, 100), [4, 1], [True, True]))
+        self.assertEqual(games[1], (0, 0, (3, 2), [], [False]))
+        self.assertEqual(games[2][3], [6] * 20)
+
+    def test_to_array(self):
+        """The headers can be read as a structured array."""
+        with records.RecordWriter(self.path) as writer:
+            simulation.Simulation("2", "Pelle", seed=3).run(50, writer)
+        with records.RecordReader(self.path) as reader:
+            array = reader.to_array()
+        self.assertEqual(array.size, 50)
+        self.assertTrue(((array["scores"] >= 100).any(axis=1)).all())
+        self.assertEqual(array["offset"][0], len(records.MAGIC))
+
+    def test_simulation_records_replay(self):
+        """A recorded simulation game replays to the same rolls."""
+        with records.RecordWriter(self.path) as writer:
+            simulation.Simulation("3", "2", seed=8).run(5, writer)
+        with records.RecordReader(self.path) as reader:
+            for game_record in reader:
+                rolls = []
+                state = replay.Replay(
+                    game_record.seed, "3", "2", game_record.starter, game_record.decisions()
+                ).play(rolls)
+                self.assertEqual(rolls, game_record.rolls())
+                self.assertEqual(state.winner, game_record.winner)
+                self.assertEqual(tuple(state.scores), game_record.scores)
+
+    def test_records_outlive_reader(self):
+        """Records kept after the reader is closed can still be read."""
+        with records.RecordWriter(self.path) as writer:
+            simulation.Simulation("3", "2", seed=8).run(5, writer)
+        with records.RecordReader(self.path) as reader:
+            games = list(reader)
+        self.assertEqual(len(games), 5)
+        for game_record in games:
+            self.assertEqual(len(game_record.rolls()), game_record.roll_count)
+
+    def test_empty_and_invalid_file(self):
+        """An empty file has no games and another file is refused."""
+        open(self.path, "wb").close()
+        with records.RecordReader(self.path) as reader:
+            self.assertEqual(list(reader), [])
+        with open(self.path, "wb") as file:
+            file.write(b"not a record")
+        with self.assertRaises(ValueError):
+            records.RecordReader(self.path)
+
+    @patch("PigDiceGame.highscore.Highscore.add_winner")
+    @patch("PigDiceGame.dice.Dice.get_random_number", return_value=6)
+    @patch("builtins.input", side_effect=["1"] * 17)
+    def test_game_records(self, mock_input, mock_die, mock_add_winner):
+        """The console game writes a finished game to its recorder."""
+        with records.RecordWriter(self.path) as writer:
+            g = game.Game(highscore.Highscore(), render.NullRenderer(), recorder=writer)
+            g.player_playing(Player("Anna"))
+        with records.RecordReader(self.path) as reader:
+            (game_record,) = list(reader)
+            self.assertEqual(game_record.winner, 0)
+            self.assertEqual(game_record.scores, (102, 0))
+            self.assertEqual(game_record.rolls(), [6] * 17)
+
+
+if __name__ == "__main__":
+    unittest.main()
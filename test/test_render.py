@@ -0,0 +1,76 @@
+"""Testclass for render."""
+
+import unittest
+from io import StringIO
+from unittest.mock import patch
+from PigDiceGame import computer, game, highscore, render
+
+
+class TestRender(unittest.TestCase):
+    """Test the renderers."""
+
+    def test_console_show(self):
+        """The console renderer prints the text."""
+        with patch("sys.stdout", new=StringIO()) as fake_out:
+            render.ConsoleRenderer().show("hello")
+        self.assertEqual(fake_out.getvalue(), "hello\n")
+
+    def test_console_pause(self):
+        """The console renderer sleeps for its delay."""
+        with patch("time.sleep") as sleep:
+            render.ConsoleRenderer(delay=0.5).pause()
+        sleep.assert_called_once_with(0.5)
+
+    def test_console_clear(self):
+        """The console renderer clears with the system command."""
+        with patch("os.system") as system:
+            render.ConsoleRenderer().clear()
+        system.assert_called_once()
+
+    def test_instant_renderer(self):
+        """The instant renderer clears with ANSI escapes and never sleeps."""
+        with patch("os.system") as system, patch("time.sleep") as sleep, patch(
+            "sys.stdout", new=StringIO()
+        ) as fake_out:
+            renderer = render.InstantRenderer()
+            renderer.clear()
+            renderer.pause()
+        system.assert_not_called()
+        sleep.assert_not_called()
+        self.assertEqual(fake_out.getvalue(), render.CLEAR)
+
+    def test_null_renderer(self):
+        """The null renderer shows nothing."""
+        with patch("sys.stdout", new=StringIO()) as fake_out:
+            renderer = render.NullRenderer()
+            renderer.show("hello")
+            renderer.clear()
+            renderer.pause()
+        self.assertEqual(fake_out.getvalue(), "")
+
+    def test_game_uses_renderer(self):
+        """The game shows its text and pauses through the renderer."""
+        g = game.Game(highscore.Highscore(), renderer=render.NullRenderer())
+        pc = computer.Computer("2")
+        with patch("sys.stdout", new=StringIO()) as fake_out, patch("time.sleep") as sleep:
+            g.computer_playing(pc)
+        self.assertEqual(fake_out.getvalue(), "")
+        sleep.assert_not_called()
+
+    def test_menus_use_renderer(self):
+        """The menu, the rules and the empty highscore list go through the renderer."""
+        g = game.Game(highscore.Highscore(), renderer=render.NullRenderer())
+        with patch("sys.stdout", new=StringIO()) as fake_out, patch(
+            "builtins.input", side_effect=["3", "4", "5"]
+        ), patch("PigDiceGame.highscore.Highscore.retreive_highscore_file"):
+            g.start_game()
+        self.assertEqual(fake_out.getvalue(), "")
+
+    def test_game_default_renderer(self):
+        """The game uses the console renderer by default."""
+        g = game.Game(highscore.Highscore())
+        self.assertIsInstance(g.renderer, render.ConsoleRenderer)
+
+
+if __name__ == "__main__":
+    unittest.main()
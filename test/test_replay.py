@@ -0,0 +1,59 @@
+"""Testclass for replay."""
+
+import unittest
+from PigDiceGame import replay
+from PigDiceGame import seeds
+from PigDiceGame import simulation
+
+
+class TestReplay(unittest.TestCase):
+    """Test seeded games and their replays."""
+
+    def test_derive(self):
+        """Derived seeds are stable and differ between children."""
+        self.assertEqual(seeds.derive(42, 7), seeds.derive(42, 7))
+        self.assertNotEqual(seeds.derive(42, 7), seeds.derive(42, 8))
+        self.assertNotEqual(seeds.derive(42, 7), seeds.derive(43, 7))
+        self.assertEqual(seeds.spawn(42, 3), [seeds.derive(42, index) for index in range(3)])
+
+    def test_seeded_run_is_reproducible(self):
+        """The same master seed gives the same result, also with random strategies."""
+        first = simulation.Simulation("3", "2", seed=5).run(200)
+        second = simulation.Simulation("3", "2", seed=5).run(200)
+        self.assertEqual(first.as_dict(), second.as_dict())
+
+    def test_replay_matches_game(self):
+        """Replaying a recorded game ends like the game did."""
+        for index in range(20):
+            seed = seeds.derive(9, index)
+            winner, turns, tosses = simulation.Simulation("3", "2").play_game(index % 2, seed)
+            state = replay.record("3", "2", seed, index % 2).play()
+            self.assertEqual((state.winner, state.turns, state.tosses), (winner, turns, tosses))
+
+    def test_encode_decode(self):
+        """A replay survives a round trip through its text line."""
+        game = replay.record("Pelle", "4", 123, starter=1)
+        line = game.encode()
+        self.assertTrue(line.startswith("pig1 123 Pelle 4 1 "))
+        again = replay.Replay.decode(line)
+        self.assertEqual(again.decisions, game.decisions)
+        first_rolls, second_rolls = [], []
+        game.play(first_rolls)
+        again.play(second_rolls)
+        self.assertEqual(first_rolls, second_rolls)
+
+    def test_record_from_run(self):
+        """A single game of a run can be recorded from its index."""
+        sim = simulation.Simulation("2", "Pelle", seed=11)
+        expected = sim.play_game(sim.starter(3), sim.game_seed(3))
+        state = replay.record_from_run("2", "Pelle", 11, 3).play()
+        self.assertEqual((state.winner, state.turns, state.tosses), expected)
+
+    def test_decode_invalid(self):
+        """Lines in another format are refused."""
+        with self.assertRaises(ValueError):
+            replay.Replay.decode("hello world")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+"""Testclass for server."""
+
+import asyncio
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+from PigDiceGame import server
+
+
+class FixedDie:
+    """Die that returns the given values in turn."""
+
+    def __init__(self, *values):
+        """Initialize with the values to return."""
+        self.values = list(values)
+
+    def get_random_number(self):
+        """Return the next value."""
+        return self.values.pop(0)
+
+
+class TestSession(unittest.TestCase):
+    """Test the rules of a session."""
+
+    def test_roll_and_hold(self):
+        """Rolled points are kept when the player holds."""
+        session = server.Session("Anna", die=FixedDie(5, 6))
+        session.roll()
+        session.roll()
+        session.hold()
+        self.assertEqual(session.player.get_total_score(), 11)
+        self.assertEqual(session.turn_total, 0)
+
+    def test_roll_one_loses_turn(self):
+        """A one loses the points of the turn."""
+        session = server.Session("Anna", die=FixedDie(5, 1))
+        session.roll()
+        self.assertEqual(session.roll(), 1)
+        self.assertEqual(session.turn_total, 0)
+        self.assertEqual(session.player.get_total_score(), 0)
+
+    def test_player_wins(self):
+        """Reaching 100 wins at once."""
+        session = server.Session("Anna", die=FixedDie(6))
+        session.state.scores[0] = 95
+        session.roll()
+        self.assertEqual(session.winner, "Anna")
+
+    def test_computer_turn(self):
+        """The computer rolls until it holds at 25 on the hard difficulty."""
+        session = server.Session("Anna", difficulty="Pelle", die=FixedDie(*[5] * 5))
+        session.hold()
+        self.assertEqual(list(session.computer_turn()), [5, 5, 5, 5, 5, None])
+        self.assertEqual(session.computer.get_total_score(), 25)
+        self.assertIsNone(session.winner)
+
+
+class TestServer(unittest.IsolatedAsyncioTestCase):
+    """Test the server with real connections."""
+
+    async def asyncSetUp(self):
+        """Start a server on a free port."""
+        self.high = MagicMock()
+        self.server = server.Server(self.high, port=0)
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        """Stop the server."""
+        await self.server.close()
+
+    async def play(self, name):
+        """Connect, roll until the game is over and return the last line."""
+        reader, writer = await asyncio.open_connection(self.server.host, self.server.port)
+        await reader.readline()
+        writer.write(f"{name}\n".encode("utf-8"))
+        line = ""
+        while not line.endswith("won!"):
+            line = (await reader.readline()).decode("utf-8").strip()
+            if line.startswith("You have"):
+                writer.write(b"roll\n")
+        writer.close()
+        return line
+
+    async def test_many_sessions(self):
+        """Many clients play at the same time and every winner is recorded once."""
+        with patch("PigDiceGame.dice.Dice.get_random_number", return_value=6):
+            lines = await asyncio.gather(*(self.play(f"player{i}") for i in range(50)))
+        self.assertEqual(len(lines), 50)
+        self.assertTrue(all(line.endswith("won!") for line in lines))
+        self.assertEqual(self.high.add_winner.call_count, 50)
+
+    async def test_quit(self):
+        """A client can quit and nothing is recorded."""
+        reader, writer = await asyncio.open_connection(self.server.host, self.server.port)
+        await reader.readline()
+        writer.write(b"anna\nquit\n")
+        lines = []
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            lines.append(line.decode("utf-8").strip())
+        writer.close()
+        self.assertEqual(lines[-1], "Bye")
+        self.high.add_winner.assert_not_called()
+
+
+class TestServerHighscore(unittest.IsolatedAsyncioTestCase):
+    """Test the highscore the server builds itself."""
+
+    async def test_default_highscore_keeps_wins(self):
+        """A win through the default highscore keeps the wins already in the file."""
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as directory:
+            os.chdir(directory)
+            try:
+                with open("highscore_list.txt", "w", encoding="utf-8") as file:
+                    file.write("Kalle: 12\nAnna: 7\n")
+                pig = server.Server(port=0)
+                await pig.highscore_call(pig.high.add_winner, "Bob")
+                await pig.close()
+                res = pig.high.retreive_highscore_file()
+            finally:
+                os.chdir(cwd)
+        self.assertEqual(res, {"Kalle": 12, "Anna": 7, "Bob": 1})
+
+    async def test_servers_merge_wins(self):
+        """Two servers on the same file both keep their wins."""
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as directory:
+            os.chdir(directory)
+            try:
+                first = server.Server(port=0)
+                second = server.Server(port=0)
+                await first.highscore_call(first.high.add_winner, "Bob")
+                await second.highscore_call(second.high.add_winner, "Anna")
+                await second.highscore_call(second.high.add_winner, "Bob")
+                await first.close()
+                await second.close()
+                res = server.Server(port=0).high.retreive_highscore_file()
+            finally:
+                os.chdir(cwd)
+        self.assertEqual(res, {"Bob": 2, "Anna": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
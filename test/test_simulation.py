@@ -0,0 +1,71 @@
+"""Testclass for simulation."""
+
+import unittest
+from unittest.mock import patch
+from PigDiceGame import simulation
+
+
+class TestSimulation(unittest.TestCase):
+    """Test the headless simulation."""
+
+    def test_init_default_object(self):
+        """Instantiate an object and check its computers."""
+        sim = simulation.Simulation("1", "Pelle")
+        self.assertIsInstance(sim, simulation.Simulation)
+        self.assertEqual(sim.computers[0].get_difficulty(), "1")
+        self.assertEqual(sim.computers[1].get_difficulty(), "Pelle")
+
+    @patch("PigDiceGame.dice.Dice.get_random_number", return_value=6)
+    def test_play_game_starter_wins(self, mock_die):
+        """Pelle always rolls sixes and reaches 100 before the easy computer."""
+        sim = simulation.Simulation("Pelle", "1")
+        winner, turns, tosses = sim.play_game(0)
+        self.assertEqual(winner, 0)
+        self.assertEqual(turns, 7)
+        self.assertEqual(tosses, 17 + 3)
+
+    @patch("builtins.print")
+    def test_run_is_silent(self, mock_print):
+        """Running games never prints anything."""
+        simulation.Simulation("2", "3").run(20)
+        mock_print.assert_not_called()
+
+    def test_run_counts_games(self):
+        """All games are counted and the win rates add up to one."""
+        res = simulation.Simulation("2", "Pelle", seed=1).run(200)
+        self.assertEqual(res.games, 200)
+        self.assertEqual(sum(res.wins), 200)
+        self.assertAlmostEqual(res.win_rate(0) + res.win_rate(1), 1.0)
+        self.assertGreater(res.average_turns(), 1)
+
+    def test_pelle_beats_baby(self):
+        """Holding at 25 beats rolling once per turn."""
+        res = simulation.Simulation("1", "Pelle", seed=2).run(300)
+        self.assertGreater(res.win_rate(1), 0.8)
+
+    def test_merge(self):
+        """Merging adds up the counts of two results."""
+        first = simulation.SimulationResult("1", "2")
+        first.add_game(0, 10, 30)
+        second = simulation.SimulationResult("1", "2")
+        second.add_game(1, 20, 50)
+        first.merge(second)
+        self.assertEqual(first.wins, [1, 1])
+        self.assertEqual(first.average_turns(), 15)
+        self.assertEqual(first.as_dict()["tosses"], 80)
+
+    def test_run_in_parts(self):
+        """A seeded run split at a game number plays the same games."""
+        whole = simulation.Simulation("2", "Pelle", seed=7).run(100)
+        part = simulation.Simulation("2", "Pelle", seed=7).run(60)
+        part.merge(simulation.Simulation("2", "Pelle", seed=7).run(40, start=60))
+        self.assertEqual(part.as_dict(), whole.as_dict())
+
+    def test_unknown_difficulty(self):
+        """An unknown difficulty is refused instead of playing with no decisions."""
+        with self.assertRaises(KeyError):
+            simulation.Simulation("1", "nope", seed=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+"""Testclass for the startup time of the game."""
+
+import unittest
+from benchmark.startup import import_times
+
+# Modules that must only be imported when a chart, simulation or database needs them.
+HEAVY_MODULES = ["matplotlib", "numpy", "sqlite3"]
+
+
+class TestStartup(unittest.TestCase):
+    """Test that starting the game stays cheap."""
+
+    def test_game_does_not_import_heavy_modules(self):
+        """The menu starts without matplotlib, numpy and sqlite3."""
+        times = import_times("PigDiceGame.main")
+        for heavy in HEAVY_MODULES:
+            self.assertNotIn(heavy, times)
+
+    def test_workers_do_not_import_matplotlib(self):
+        """Simulation workers start without matplotlib."""
+        times = import_times("PigDiceGame.tournament")
+        self.assertIn("numpy", times)
+        self.assertNotIn("matplotlib", times)
+
+    def test_histogram_module_is_cheap(self):
+        """Importing the chart module waits with matplotlib until a chart is drawn."""
+        self.assertNotIn("matplotlib", import_times("PigDiceGame.histogram"))
+
+
+if __name__ == "__main__":
+    unittest.main()
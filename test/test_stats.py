@@ -0,0 +1,148 @@
+"""Testclass for stats."""
+
+import random
+import statistics
+import unittest
+from unittest.mock import patch
+from PigDiceGame import game, highscore, render, simulation, stats
+from PigDiceGame.player import Player
+
+
+class TestRunningStats(unittest.TestCase):
+    """Test the running mean and variance."""
+
+    def test_matches_statistics(self):
+        """Mean and variance match the statistics module."""
+        values = [random.Random(1).gauss(10, 3) for _ in range(1000)]
+        running = stats.RunningStats()
+        for value in values:
+            running.add(value)
+        self.assertAlmostEqual(running.mean, statistics.mean(values))
+        self.assertAlmostEqual(running.variance(), statistics.variance(values))
+        self.assertEqual(running.minimum, min(values))
+
+    def test_merge(self):
+        """Merged statistics equal statistics of all values."""
+        first, second, whole = stats.RunningStats(), stats.RunningStats(), stats.RunningStats()
+        for value in range(10):
+            first.add(value)
+            whole.add(value)
+        for value in range(100, 130):
+            second.add(value)
+            whole.add(value)
+        first.merge(second)
+        self.assertEqual(first.count, whole.count)
+        self.assertAlmostEqual(first.mean, whole.mean)
+        self.assertAlmostEqual(first.variance(), whole.variance())
+        self.assertEqual((first.minimum, first.maximum), (0, 129))
+
+
+class TestQuantileSketch(unittest.TestCase):
+    """Test the quantile sketch."""
+
+    def test_relative_accuracy(self):
+        """Quantiles are within the relative accuracy."""
+        sketch = stats.QuantileSketch(relative_accuracy=0.01)
+        for value in range(1, 10001):
+            sketch.add(value)
+        self.assertAlmostEqual(sketch.quantile(0.5), 5000, delta=5000 * 0.011)
+        self.assertAlmostEqual(sketch.quantile(0.99), 9900, delta=9900 * 0.011)
+        self.assertEqual(len(sketch), 10000)
+
+    def test_zeros_and_empty(self):
+        """Zeros are counted apart and an empty sketch has no quantiles."""
+        sketch = stats.QuantileSketch()
+        self.assertIsNone(sketch.quantile(0.5))
+        for value in (0, 0, 0, 5):
+            sketch.add(value)
+        self.assertEqual(sketch.quantile(0.5), 0.0)
+
+    def test_bounded_and_mergeable(self):
+        """The buckets stay bounded and merged sketches add up."""
+        first = stats.QuantileSketch(max_buckets=50)
+        second = stats.QuantileSketch(max_buckets=50)
+        for value in range(1, 100000, 7):
+            first.add(value)
+            second.add(value * 3)
+        self.assertLessEqual(len(first.buckets), 50)
+        count = len(first) + len(second)
+        first.merge(second)
+        self.assertEqual(len(first), count)
+        self.assertLessEqual(len(first.buckets), 50)
+        with self.assertRaises(ValueError):
+            first.merge(stats.QuantileSketch(relative_accuracy=0.05))
+
+
+class TestStatistics(unittest.TestCase):
+    """Test the per-player statistics."""
+
+    def test_record_log(self):
+        """Turns, busts and games are taken from a game log."""
+        recorded = stats.Statistics()
+        # Anna rolls a 6 and holds, Bob busts, Anna rolls 16 sixes and wins.
+        decisions = [True, False, True] + [True] * 16
+        recorded.record_log(["Anna", "Bob"], 0, decisions, [6, 1] + [6] * 16)
+        anna, bob = recorded.players["Anna"], recorded.players["Bob"]
+        self.assertEqual((anna.games, anna.wins, anna.busts), (1, 1, 0))
+        self.assertEqual((bob.games, bob.wins, bob.busts), (1, 0, 1))
+        self.assertEqual(anna.turns_per_game.running.mean, 2)
+        self.assertEqual(anna.points_per_turn.running.maximum, 96)
+        self.assertEqual(anna.rolls_per_turn.running.maximum, 16)
+        self.assertEqual(bob.points_per_turn.running.mean, 0)
+
+    def test_simulation_feeds_statistics(self):
+        """A simulation run adds every game to both computers."""
+        recorded = stats.Statistics()
+        simulation.Simulation("2", "Pelle", seed=1).run(200, stats=recorded)
+        first = recorded.players["Computer 1 (2)"]
+        second = recorded.players["Computer 2 (Pelle)"]
+        self.assertEqual(first.games, 200)
+        self.assertEqual(first.wins + second.wins, 200)
+        self.assertGreaterEqual(second.points_per_turn.running.maximum, 25)
+        summary = recorded.as_dict()["Computer 2 (Pelle)"]
+        self.assertGreater(summary["turns_per_game"]["mean"], 1)
+        self.assertIn("p99", summary["rolls_per_turn"])
+
+    def test_merge_workers(self):
+        """Statistics from two workers merge into the statistics of both runs."""
+        first, second, whole = stats.Statistics(), stats.Statistics(), stats.Statistics()
+        simulation.Simulation("1", "2", seed=3).run(100, stats=first)
+        simulation.Simulation("1", "2", seed=4).run(100, stats=second)
+        simulation.Simulation("1", "2", seed=3).run(100, stats=whole)
+        simulation.Simulation("1", "2", seed=4).run(100, stats=whole)
+        first.merge(second)
+        name = "Computer 1 (1)"
+        self.assertEqual(first.players[name].games, 200)
+        self.assertEqual(first.players[name].busts, whole.players[name].busts)
+        self.assertAlmostEqual(
+            first.players[name].points_per_turn.running.mean,
+            whole.players[name].points_per_turn.running.mean,
+        )
+
+    @patch("PigDiceGame.highscore.Highscore.add_winner")
+    @patch("PigDiceGame.dice.Dice.get_random_number", side_effect=[6, 6, 1] + [6] * 17)
+    @patch("builtins.input", side_effect=["bob", "raz"] + ["1"] * 20)
+    def test_game_feeds_statistics(self, mock_input, mock_die, mock_add_winner):
+        """The console game adds every turn and the game to the players."""
+        recorded = stats.Statistics()
+        g = game.Game(highscore.Highscore(), render.NullRenderer(), stats=recorded)
+        g.player_vs_player()
+        bob, raz = recorded.players["Bob"], recorded.players["Raz"]
+        self.assertEqual((bob.games, bob.wins, bob.busts), (1, 0, 1))
+        self.assertEqual((raz.games, raz.wins, raz.busts), (1, 1, 0))
+        self.assertEqual(raz.points_per_turn.running.maximum, 102)
+        self.assertEqual(raz.turns_per_game.running.mean, 1)
+
+    def test_wilson_interval(self):
+        """The interval is the Wilson score interval and stays within 0 and 1."""
+        low, high = stats.wilson_interval(50, 100)
+        self.assertAlmostEqual(low, 0.4038, places=4)
+        self.assertAlmostEqual(high, 0.5962, places=4)
+        low, high = stats.wilson_interval(10, 10, confidence=0.99)
+        self.assertLess(low, 1.0)
+        self.assertEqual(high, 1.0)
+        self.assertEqual(stats.wilson_interval(0, 0), (0.0, 1.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
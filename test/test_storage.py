@@ -0,0 +1,213 @@
+"""Testclass for storage."""
+
+import multiprocessing
+import os
+import tempfile
+import unittest
+from PigDiceGame.highscore import Highscore
+from PigDiceGame.storage import AppendLogStore, LockedFileStore, SQLiteStore
+
+
+def record_wins(path, name, wins):
+    """Record wins from another process."""
+    store = LockedFileStore(path, batch_size=25)
+    store.load()
+    for _ in range(wins):
+        store.record(name)
+        store.record("Shared")
+    store.close()
+
+
+class TestAppendLogStore(unittest.TestCase):
+    """Test the append only highscore store."""
+
+    def setUp(self):
+        """Create a temporary directory for the files."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "highscore_list.txt")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def test_record_and_load(self):
+        """Recorded wins are loaded back by a new store."""
+        store = AppendLogStore(self.path, batch_size=2)
+        store.load()
+        for name in ["Kalle", "Anna", "Kalle"]:
+            store.record(name)
+        store.close()
+
+        res = AppendLogStore(self.path).load()
+        self.assertEqual(res, {"Kalle": 2, "Anna": 1})
+
+    def test_batches_are_buffered(self):
+        """Wins are only written when the batch is full."""
+        store = AppendLogStore(self.path, batch_size=3)
+        store.load()
+        store.record("Kalle")
+        store.record("Kalle")
+        self.assertEqual(AppendLogStore(self.path).load(), {})
+        store.record("Kalle")
+        self.assertEqual(AppendLogStore(self.path).load(), {"Kalle": 3})
+        store.close()
+
+    def test_compact(self):
+        """Compaction writes a snapshot and removes the old logs."""
+        store = AppendLogStore(self.path, batch_size=1, compact_every=3)
+        store.load()
+        for name in ["Kalle", "Anna", "Kalle", "Anna"]:
+            store.record(name)
+        store.close()
+
+        self.assertTrue(os.path.exists(store.snapshot_path()))
+        self.assertEqual(store.log_generations(), [1])
+        self.assertEqual(AppendLogStore(self.path).load(), {"Kalle": 2, "Anna": 2})
+
+    def test_torn_line_is_ignored(self):
+        """A half written line from a crash is not counted."""
+        with open(self.path + ".log.0", "w", encoding="utf-8") as file:
+            file.write("Kalle\nAnna\nKal")
+        store = AppendLogStore(self.path, batch_size=1)
+        self.assertEqual(store.load(), {"Kalle": 1, "Anna": 1})
+        store.record("Anna")
+        store.close()
+        self.assertEqual(AppendLogStore(self.path).load(), {"Kalle": 1, "Anna": 2})
+
+    def test_names_are_normalized(self):
+        """A name keeps one key in the log, the snapshot and memory."""
+        with open(self.path + ".log.0", "w", encoding="utf-8") as file:
+            file.write(" Kalle \r\n\nAnna\n")
+        store = AppendLogStore(self.path, batch_size=1, compact_every=2)
+        self.assertEqual(store.load(), {"Kalle": 1, "Anna": 1})
+        store.record("Kalle ")
+        store.record("An\nna")
+        self.assertEqual(store.counts, {"Kalle": 2, "Anna": 1, "An na": 1})
+        store.close()
+        self.assertTrue(os.path.exists(store.snapshot_path()))
+        self.assertEqual(AppendLogStore(self.path).load(), {"Kalle": 2, "Anna": 1, "An na": 1})
+
+    def test_highscore_uses_store(self):
+        """Highscore records wins in the store instead of rewriting the file."""
+        high = Highscore(AppendLogStore(self.path, batch_size=10))
+        high.retreive_highscore_file()
+        high.add_winner("Kalle")
+        high.add_winner("Kalle")
+        high.close()
+        self.assertFalse(os.path.exists(self.path))
+
+        high = Highscore(AppendLogStore(self.path))
+        self.assertEqual(high.retreive_highscore_file(), {"Kalle": 2})
+
+
+class TestSQLiteStore(unittest.TestCase):
+    """Test the SQLite highscore store."""
+
+    def setUp(self):
+        """Create a database in a temporary directory."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = SQLiteStore(os.path.join(self.directory.name, "highscore.db"), batch_size=4)
+        self.store.record_many(["Kalle"] * 5 + ["Anna"] * 3 + ["Ali"] * 3 + ["Minou"])
+
+    def tearDown(self):
+        """Close the database and remove the directory."""
+        self.store.close()
+        self.directory.cleanup()
+
+    def test_top_and_page(self):
+        """The leaderboard is ordered by wins and paged."""
+        self.assertEqual(self.store.top(2), [("Kalle", 5), ("Ali", 3)])
+        self.assertEqual(self.store.page(1, 2), [("Anna", 3), ("Minou", 1)])
+        self.assertEqual(self.store.page(2, 2), [])
+
+    def test_rank(self):
+        """Players with the same wins share the rank."""
+        self.assertEqual(self.store.rank("Kalle"), 1)
+        self.assertEqual(self.store.rank("Anna"), 2)
+        self.assertEqual(self.store.rank("Ali"), 2)
+        self.assertEqual(self.store.rank("Minou"), 4)
+        self.assertIsNone(self.store.rank("Nobody"))
+
+    def test_batched_record(self):
+        """Buffered wins are visible to queries and written in batches."""
+        self.store.record("Minou")
+        self.assertEqual(self.store.pending, {"Minou": 1})
+        self.assertEqual(self.store.wins("Minou"), 2)
+        self.assertEqual(self.store.pending, {})
+        self.assertEqual(self.store.count(), 4)
+
+    def test_highscore_uses_index(self):
+        """Highscore asks the store instead of keeping the list in memory."""
+        high = Highscore(self.store)
+        high.retreive_highscore_file()
+        high.add_winner("Minou")
+        self.assertEqual(high.highscores, {})
+        self.assertEqual(high.get_name_and_highscore(limit=1), (["Kalle"], [5]))
+        self.assertEqual(high.rank("Minou"), 4)
+        self.assertEqual(high.sorted_list()[-1], ("Minou", 2))
+
+
+class TestLockedFileStore(unittest.TestCase):
+    """Test the highscore file shared by several processes."""
+
+    def setUp(self):
+        """Create a temporary directory for the files."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "highscore_list.txt")
+
+    def tearDown(self):
+        """Remove the temporary directory."""
+        self.directory.cleanup()
+
+    def test_merge_on_write(self):
+        """Two stores writing the same file keep the wins of both."""
+        first = LockedFileStore(self.path, batch_size=1)
+        second = LockedFileStore(self.path, batch_size=1)
+        first.load()
+        second.load()
+        first.record("Kalle")
+        second.record("Anna")
+        second.record("Kalle")
+        self.assertEqual(LockedFileStore(self.path).load(), {"Kalle": 2, "Anna": 1})
+
+    def test_batches_are_buffered(self):
+        """Wins are merged when the batch is full and show up in load before that."""
+        store = LockedFileStore(self.path, batch_size=3)
+        store.record("Kalle")
+        store.record("Kalle")
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(store.load(), {"Kalle": 2})
+        store.record("Kalle")
+        self.assertEqual(LockedFileStore(self.path).load(), {"Kalle": 3})
+
+    def test_reads_legacy_file(self):
+        """The plain highscore file is read and bad lines are skipped."""
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("Kalle : 3\nbroken line\nAnna:2\n")
+        self.assertEqual(LockedFileStore(self.path).load(), {"Kalle": 3, "Anna": 2})
+
+    def test_processes(self):
+        """No win is lost when processes write at the same time."""
+        workers = [
+            multiprocessing.Process(target=record_wins, args=(self.path, f"Worker{index}", 200))
+            for index in range(4)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        res = LockedFileStore(self.path).load()
+        self.assertEqual(res["Shared"], 800)
+        self.assertEqual(res["Worker3"], 200)
+
+    def test_highscore_uses_store(self):
+        """Highscore records to the shared file through the store."""
+        high = Highscore(LockedFileStore(self.path, batch_size=1))
+        high.retreive_highscore_file()
+        high.add_winner("Kalle")
+        res = Highscore(LockedFileStore(self.path)).retreive_highscore_file()
+        self.assertEqual(res, {"Kalle": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""Testclass for strategy."""
+
+import random
+import unittest
+from PigDiceGame import strategy
+
+
+class TestStrategy(unittest.TestCase):
+    """Test the compiled hold tables."""
+
+    def test_hold_probability(self):
+        """The table is indexed by toss count and clamped at the end."""
+        table = strategy.HOLD_TABLES["2"]
+        self.assertEqual(table.hold_probability(0, 50), 0.0)
+        self.assertEqual(table.hold_probability(3, 0), 0.4)
+        self.assertEqual(table.hold_probability(30, 0), 1.0)
+
+    def test_turn_total_table(self):
+        """Pelle holds from 25 points this round."""
+        table = strategy.HOLD_TABLES["Pelle"]
+        self.assertEqual(table.decide(9, 24), strategy.TOSS)
+        self.assertEqual(table.decide(0, 25), strategy.HOLD)
+        self.assertEqual(table.decide(0, 80), strategy.HOLD)
+
+    def test_decide_draws_once(self):
+        """A decision compares one uniform draw against the table."""
+        table = strategy.HoldTable((0.0, 0.3))
+        rng = random.Random()
+        rng.random = lambda: 0.29
+        self.assertEqual(table.decide(1, 0, rng), strategy.HOLD)
+        rng.random = lambda: 0.3
+        self.assertEqual(table.decide(1, 0, rng), strategy.TOSS)
+
+    def test_registry(self):
+        """The built in difficulties are registered."""
+        self.assertEqual(strategy.names()[:5], ["1", "2", "Pelle", "3", "4"])
+        self.assertIsInstance(strategy.create("2"), strategy.TableStrategy)
+        self.assertIsNone(strategy.create("nope"))
+
+    def test_decide_is_abstract(self):
+        """A strategy without decide can not be created."""
+        with self.assertRaises(TypeError):
+            strategy.Strategy()  # pylint: disable=abstract-class-instantiated
+
+    def test_register_custom(self):
+        """A custom strategy is created with the given random source."""
+
+        class Greedy(strategy.Strategy):
+            """Never hold."""
+
+            def decide(self, own_score, opponent_score, turn_total, toss_count):
+                """Return TOSS."""
+                return strategy.TOSS
+
+        strategy.register("greedy", Greedy)
+        try:
+            rng = random.Random(1)
+            greedy = strategy.create("greedy", rng)
+            self.assertIs(greedy.rng, rng)
+            self.assertEqual(greedy.decide(90, 0, 9, 3), strategy.TOSS)
+        finally:
+            del strategy.STRATEGIES["greedy"]
+
+    def test_optimal_strategy(self):
+        """The optimal strategy holds at 21 at the start of the game."""
+        optimal = strategy.create("4")
+        self.assertEqual(optimal.decide(0, 0, 20, 5), strategy.TOSS)
+        self.assertEqual(optimal.decide(0, 0, 21, 5), strategy.HOLD)
+
+
+if __name__ == "__main__":
+    unittest.main()
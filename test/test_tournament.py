@@ -0,0 +1,40 @@
+"""Testclass for tournament."""
+
+import unittest
+import numpy as np
+from PigDiceGame import tournament
+
+
+class TestTournament(unittest.TestCase):
+    """Test the round robin tournament."""
+
+    def test_pairings(self):
+        """Every difficulty meets every other difficulty once."""
+        tour = tournament.Tournament(difficulties=["1", "2", "3", "Pelle"])
+        self.assertEqual(len(tour.pairings()), 6)
+
+    def test_tasks_are_chunked(self):
+        """Games are split in chunks with their own seeds."""
+        tour = tournament.Tournament(games=250, seed=1, difficulties=["1", "2"], chunk_size=100)
+        sizes = [task[2] for task in tour.tasks()]
+        self.assertEqual(sizes, [100, 100, 50])
+
+    def test_win_matrix(self):
+        """The matrix is complementary and Pelle beats the baby."""
+        tour = tournament.Tournament(games=2000, seed=3, workers=1, difficulties=["1", "Pelle"])
+        matrix = tour.run()
+        self.assertEqual(matrix.shape, (2, 2))
+        self.assertAlmostEqual(matrix[0, 1] + matrix[1, 0], 1.0)
+        self.assertGreater(matrix[1, 0], 0.8)
+        self.assertEqual(tour.results[("1", "Pelle")].games, 2000)
+
+    def test_same_seed_any_workers(self):
+        """The result only depends on the seed, not on the number of workers."""
+        serial = tournament.Tournament(games=300, seed=9, workers=1, difficulties=["1", "2", "3"])
+        parallel = tournament.Tournament(games=300, seed=9, workers=2, difficulties=["1", "2", "3"])
+        serial.chunk_size = parallel.chunk_size = 100
+        np.testing.assert_array_equal(serial.run(), parallel.run())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,95 @@
+"""Testclass for vectorized."""
+
+import unittest
+import numpy as np
+from PigDiceGame import strategy
+from PigDiceGame import vectorized
+
+
+class TestVectorized(unittest.TestCase):
+    """Test the vectorized simulation."""
+
+    def test_policies(self):
+        """The batch decisions match the Computer difficulties."""
+        rng = np.random.default_rng(0)
+        zeros = np.zeros(3, dtype=np.int16)
+        toss_count = np.array([0, 1, 8], dtype=np.int16)
+        turn_total = np.array([0, 24, 25], dtype=np.int16)
+
+        res = strategy.create("1").decide_batch(zeros, zeros, turn_total, toss_count, rng)
+        self.assertEqual(res.tolist(), [False, True, True])
+        res = strategy.create("Pelle").decide_batch(zeros, zeros, turn_total, toss_count, rng)
+        self.assertEqual(res.tolist(), [False, False, True])
+        res = strategy.create("2").decide_batch(zeros, zeros, turn_total, toss_count, rng)
+        self.assertFalse(res[0])
+        self.assertTrue(res[2])
+
+    def test_play_batch(self):
+        """Every game in a batch finishes with a winner."""
+        sim = vectorized.VectorSimulation("2", "3", seed=1)
+        winners, turns, tosses = sim.play_batch(1000)
+        self.assertEqual(winners.size, 1000)
+        self.assertTrue(set(winners.tolist()) <= {0, 1})
+        self.assertGreaterEqual(turns.min(), 1)
+        self.assertGreater(tosses.min(), 0)
+
+    def test_same_seed_same_result(self):
+        """The same seed gives the same result."""
+        first = vectorized.VectorSimulation("1", "Pelle", seed=7).run(500)
+        second = vectorized.VectorSimulation("1", "Pelle", seed=7).run(500)
+        self.assertEqual(first.as_dict(), second.as_dict())
+
+    def test_run_in_batches(self):
+        """Games are split in batches and the win rates match the rules."""
+        res = vectorized.VectorSimulation("1", "Pelle", seed=3, batch_size=700).run(3000)
+        self.assertEqual(res.games, 3000)
+        self.assertEqual(sum(res.wins), 3000)
+        self.assertGreater(res.win_rate(1), 0.8)
+
+    def test_mirror_match_is_even(self):
+        """Two equal computers win about as often when the start swaps."""
+        res = vectorized.VectorSimulation("Pelle", "Pelle", seed=4).run(20000)
+        self.assertAlmostEqual(res.win_rate(0), 0.5, delta=0.02)
+
+    def test_registered_strategy(self):
+        """A registered strategy without decide_batch can be used by name."""
+
+        class HoldAtTwenty(strategy.Strategy):
+            """Hold at 20 points this turn."""
+
+            def decide(self, own_score, opponent_score, turn_total, toss_count):
+                """Return TOSS or HOLD."""
+                return strategy.HOLD if turn_total >= 20 else strategy.TOSS
+
+        strategy.register("hold20", HoldAtTwenty)
+        try:
+            res = vectorized.VectorSimulation("hold20", "1", seed=5).run(300)
+            self.assertGreater(res.win_rate(0), 0.8)
+        finally:
+            del strategy.STRATEGIES["hold20"]
+
+    def test_custom_strategy_reproducible(self):
+        """A strategy that draws through its rng repeats with the same seed."""
+
+        class Coin(strategy.Strategy):
+            """Hold on heads."""
+
+            def decide(self, own_score, opponent_score, turn_total, toss_count):
+                """Return TOSS or HOLD."""
+                return strategy.HOLD if self.rng.random() < 0.3 else strategy.TOSS
+
+        strategy.register("coin", Coin)
+        try:
+            runs = [vectorized.VectorSimulation("coin", "coin", seed=9).run(200) for _ in range(2)]
+            self.assertEqual(runs[0].as_dict(), runs[1].as_dict())
+        finally:
+            del strategy.STRATEGIES["coin"]
+
+    def test_unknown_difficulty(self):
+        """An unknown difficulty is refused."""
+        with self.assertRaises(KeyError):
+            vectorized.VectorSimulation("1", "nope")
+
+
+if __name__ == "__main__":
+    unittest.main()
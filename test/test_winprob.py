@@ -0,0 +1,63 @@
+"""Testclass for winprob."""
+
+import itertools
+import unittest
+from unittest.mock import MagicMock, patch
+from PigDiceGame import computer, game, highscore, winprob
+from PigDiceGame.player import Player
+
+
+class TestWinProbability(unittest.TestCase):
+    """Test the exact win probabilities."""
+
+    def test_optimal_first_player_advantage(self):
+        """The known first player advantage of optimal play to 100."""
+        table = winprob.tables("4", "4")
+        self.assertAlmostEqual(table.probability(0, 0), 0.5306, places=4)
+        self.assertAlmostEqual(table.probability(0, 0, seat=1), table.probability(0, 0))
+
+    def test_matches_simulation(self):
+        """Holding at 25 beats the baby about as often as the simulations say."""
+        table = winprob.tables("Pelle", "1")
+        start_first = table.probability(0, 0)
+        start_second = 1.0 - table.probability(0, 0, seat=1)
+        self.assertAlmostEqual((start_first + start_second) / 2, 0.9911, places=3)
+
+    def test_within_turn_matches_table(self):
+        """Walking a whole turn gives the start of turn table."""
+        table = winprob.WinProbability("2", "3", target=30)
+        for own, opponent in itertools.product(range(0, 30, 7), repeat=2):
+            self.assertAlmostEqual(
+                table.within_turn(0, own, opponent, 0, 0), table.probability(own, opponent)
+            )
+
+    def test_target_reached(self):
+        """Reaching the target is a certain win."""
+        self.assertEqual(winprob.win_probability(90, 50, turn_total=10), 1.0)
+
+    def test_odds_grow_with_points(self):
+        """More points this turn means a better chance."""
+        low = winprob.win_probability(50, 50, turn_total=4, toss_count=1)
+        high = winprob.win_probability(50, 50, turn_total=20, toss_count=4)
+        self.assertGreater(high, low)
+
+    def test_tables_are_cached(self):
+        """The tables of a pair are solved once."""
+        self.assertIs(winprob.tables("1", "2"), winprob.tables("1", "2"))
+
+    def test_unknown_difficulty(self):
+        """An unknown difficulty is refused."""
+        with self.assertRaises(KeyError):
+            winprob.WinProbability("1", "nope", target=10)
+
+    @patch("builtins.input", side_effect=["4"])
+    def test_game_shows_odds(self, mock_input):
+        """The game shows the chance to win before the player chooses."""
+        renderer = MagicMock()
+        g = game.Game(highscore.Highscore(), renderer, show_odds=True)
+        g.player_playing(Player("Anna"), True, computer.Computer("Pelle"))
+        renderer.show.assert_any_call("Chance to win: 55.1%")
+
+
+if __name__ == "__main__":
+    unittest.main()